@@ -66,9 +66,9 @@ async def process_api_key_header(
         acls = [SectionACL.model_validate(acl) for acl in auth_info.acls]
         user_label = _user_label(auth_info.name, auth_info.username)
         if mode == "authn":
-            logger.info(f"API key authentication for '{user_label}' (cached)")
+            logger.info("API key authentication for '%s' (cached)", user_label)
         elif mode == "authz":
-            logger.info(f"API key authorization for '{user_label}' (cached)")
+            logger.info("API key authorization for '%s' (cached)", user_label)
         return acls
 
     try:
@@ -79,9 +79,9 @@ async def process_api_key_header(
             cache.store_app_cache(auth_hash, serial_auth_info, 900)
             user_label = _user_label(auth_info.name, auth_info.username)
             if mode == "authn":
-                logger.info(f"API key authentication for '{user_label}'")
+                logger.info("API key authentication for '%s'", user_label)
             elif mode == "authz":
-                logger.info(f"API key authorization for '{user_label}'")
+                logger.info("API key authorization for '%s'", user_label)
     except AuthenticationError as exc:
         raise HTTPException(status_code=403, detail=f"Invalid API key: {exc}")
 
@@ -130,15 +130,17 @@ async def process_bearer_token(
         acls = [SectionACL.model_validate(item) for item in auth_info.acls]
         user_label = _user_label(auth_info.name, auth_info.username)
         if mode == "authn":
-            logger.info(f"JWT authentication for '{user_label}' (cached)")
+            logger.info("JWT authentication for '%s' (cached)", user_label)
         elif mode == "authz":
-            logger.info(f"JWT authorization for '{user_label}' (cached)")
+            logger.info("JWT authorization for '%s' (cached)", user_label)
             for acl in acls:
                 logger.debug(
-                    f"ACL for {user_label} regex:'{acl.section_regex}' "
-                    f"permissions:{acl.permissions} "
-                    f"principal:'{acl.principal_name}' "
-                    f"memo:'{acl.memo}'"
+                    "ACL for %s regex:'%s' permissions:%s principal:'%s' memo:'%s'",
+                    user_label,
+                    acl.section_regex,
+                    acl.permissions,
+                    acl.principal_name,
+                    acl.memo,
                 )
         return acls
 
@@ -150,15 +152,17 @@ async def process_bearer_token(
             cache.store_app_cache(auth_hash, serial_auth_info, 900)
             user_label = _user_label(auth_info.name, auth_info.username)
             if mode == "authn":
-                logger.info(f"JWT authentication for '{user_label}'")
+                logger.info("JWT authentication for '%s'", user_label)
             elif mode == "authz":
-                logger.info(f"JWT authorization for '{user_label}'")
+                logger.info("JWT authorization for '%s'", user_label)
                 for acl in acls:
                     logger.info(
-                        f"ACL for {user_label} regex:'{acl.section_regex}' "
-                        f"permissions:{acl.permissions} "
-                        f"principal:'{acl.principal_name}' "
-                        f"memo:'{acl.memo}'"
+                        "ACL for %s regex:'%s' permissions:%s principal:'%s' memo:'%s'",
+                        user_label,
+                        acl.section_regex,
+                        acl.permissions,
+                        acl.principal_name,
+                        acl.memo,
                     )
     except AuthenticationError as exc:
         raise HTTPException(status_code=403, detail=f"Invalid token: {exc}")
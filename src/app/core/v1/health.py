@@ -6,9 +6,20 @@
 
 import logging
 
+from starlette.types import ASGIApp, Receive, Scope, Send
+
 logger = logging.getLogger(__name__)
 is_ready: bool = False  # Application readiness flag, controlled by lifespan
 
+LIVENESS_PATH = "/health/liveness"
+_LIVENESS_METHODS = frozenset({"GET", "HEAD"})
+_LIVENESS_BODY = b'{"status":"alive"}'
+_LIVENESS_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_LIVENESS_BODY)).encode("latin-1")),
+    (b"cache-control", b"no-store"),
+]
+
 
 def set_app_ready() -> None:
     """
@@ -40,3 +51,49 @@ def check_app_readiness() -> bool:
         bool: True if the app is ready; False otherwise.
     """
     return is_ready
+
+
+class LivenessMiddleware:
+    """
+    ASGI middleware that answers liveness probes before FastAPI routing.
+
+    Liveness probes need no auth, dependencies or validation, so GET and HEAD
+    probes are answered with a precomputed response instead of running the
+    /health/liveness route. Other methods fall through so the router can reject
+    them with 405 Method Not Allowed.
+
+    Args:
+        app: The next ASGI app in the middleware stack.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Answer liveness probes directly, and pass other requests through.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
+        """
+        if (
+            scope["type"] == "http"
+            and scope["method"] in _LIVENESS_METHODS
+            and scope["path"].removeprefix(scope.get("root_path", "")) == LIVENESS_PATH
+        ):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": _LIVENESS_HEADERS,
+                }
+            )
+            # NOTE: HEAD responses keep the GET headers, including content-length,
+            #   but must not carry a body
+            body = b"" if scope["method"] == "HEAD" else _LIVENESS_BODY
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await self.app(scope, receive, send)
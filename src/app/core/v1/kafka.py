@@ -95,7 +95,7 @@ async def _start_demo_consumer() -> None:
             try:
                 await route_kafka_message(message)
             except Exception as exc:
-                logger.error(f"Error processing message: {exc}", exc_info=True)
+                logger.error("Error processing message: %s", exc, exc_info=True)
     finally:
         logger.info("Stopping Kafka demo consumer...")
         await consumer.stop()
@@ -146,6 +146,8 @@ async def create_kafka_producer() -> Optional[AIOKafkaProducer]:
             sasl_mechanism=_sasl_mechanism,
             sasl_plain_username=_sasl_plain_username,
             sasl_plain_password=_sasl_plain_password,
+            linger_ms=_sk.linger_ms,
+            max_batch_size=_sk.max_batch_size,
             key_serializer=lambda k: str(k).encode("utf-8"),
             value_serializer=custom_serializer,
         )
@@ -79,18 +79,20 @@ def with_huey_mongo_session(
         mongo_client = huey_async_client[db_name]
 
         try:
-            logger.debug(f"Running: {func.__qualname__} with MongoDB: {db_name}")
+            logger.debug("Running: %s with MongoDB: %s", func.__qualname__, db_name)
             kwargs["mongo_client"] = mongo_client
             result = await func(*args, **kwargs)
             return result
         except Exception as exc:
             logger.critical(
-                f"Error in {func.__qualname__} using MongoDB: {exc}",
+                "Error in %s using MongoDB: %s",
+                func.__qualname__,
+                exc,
                 exc_info=True,
             )
             raise
         finally:
-            logger.debug(f"Cleaned up MongoDB client for: {func.__qualname__}")
+            logger.debug("Cleaned up MongoDB client for: %s", func.__qualname__)
             await huey_async_client.close()
 
     return wrapper
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""Response classes shared by API routers."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response that is rendered by pydantic-core instead of json.dumps.
+
+    pydantic-core writes UTF-8 bytes directly from Rust, and it also accepts
+    Pydantic models (or lists of them) as content, so list endpoints do not need
+    to model_dump() every item before building the response.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize the response content to JSON.
+
+        Args:
+            content: JSON-compatible data and/or Pydantic models.
+
+        Returns:
+            bytes: The encoded response body.
+        """
+        return to_json(content)
+
+
+def etag_json_response(request: Request, content: Any) -> Response:
+    """
+    Render content as JSON with an ETag, or answer 304 if the client has it.
+
+    The ETag is a hash of the rendered body, so it changes whenever any field in
+    the content changes. When the request's If-None-Match header matches, the body
+    is not sent.
+
+    Args:
+        request: The incoming request.
+        content: JSON-compatible data and/or Pydantic models.
+
+    Returns:
+        Response: A 200 JSON response, or an empty 304 response.
+    """
+    body = to_json(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag}
+
+    if if_none_match := request.headers.get("if-none-match"):
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
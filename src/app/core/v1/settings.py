@@ -36,6 +36,7 @@ class SqlAlchemySettings(BaseModel):
     pool_size: int = 4
     pool_timeout: int = 30
     pool_recycle: int = 300
+    pool_warmup: int = 0
 
 
 class MongoSettings(BaseModel):
@@ -75,6 +76,9 @@ class McpSettings(BaseModel):
         mcp_mount_path: Mount path for the MCP interface.
         max_retries: Maximum number of retries for fetching the OpenAPI spec.
         stateless_http: Whether to use stateless or in-memory state/session tracking.
+        http2: Whether the upstream API client should negotiate HTTP/2 (requires
+            the h2 package, and is only used for https:// base URLs).
+        max_keepalive_connections: Idle connections kept open to the upstream API.
     """
 
     headers: dict[str, str] = {}
@@ -83,6 +87,19 @@ class McpSettings(BaseModel):
     mcp_mount_path: str = "/mcp"
     max_retries: int = 5
     stateless_http: bool = True
+    http2: bool = False
+    max_keepalive_connections: int = 50
+
+
+class HealthSettings(BaseModel):
+    """
+    Settings for health/readiness probes.
+
+    Attributes:
+        readiness_ttl: Seconds to reuse a readiness result before checking again.
+    """
+
+    readiness_ttl: float = 2.0
 
 
 class KafkaSettings(BaseModel):
@@ -110,6 +127,10 @@ class KafkaSettings(BaseModel):
         sasl_plain_password: SASL authentication password, used with PLAIN or
             SCRAM mechanisms.
 
+        linger_ms: How long the producer waits for more messages before sending a
+            batch, so that messages from concurrent requests share a request.
+        max_batch_size: The maximum size of a producer batch, in bytes.
+
         ssl_cafile: Path to the CA certificate file for verifying the broker's
             certificate.
         ssl_certfile: Path to the client's SSL certificate file (optional, for mTLS).
@@ -128,6 +149,9 @@ class KafkaSettings(BaseModel):
     sasl_plain_username: Optional[str] = None
     sasl_plain_password: Optional[str] = None
 
+    linger_ms: int = 50
+    max_batch_size: int = 65536
+
     # TODO: add support for this later
     ssl_cafile: Optional[str] = None
     ssl_certfile: Optional[str] = None
@@ -159,6 +183,7 @@ class AppSettings(BaseSettings):
         custom={},
     )
     mcp: McpSettings = McpSettings()
+    health: HealthSettings = HealthSettings()
     kafka: KafkaSettings = KafkaSettings()
     logging: LoggingSettings = LoggingSettings()
     tasks: TaskSettings = TaskSettings(
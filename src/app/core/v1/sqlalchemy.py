@@ -6,11 +6,13 @@
 
 import logging
 import ssl
+from contextlib import AsyncExitStack
 from functools import wraps
 from typing import Any, Callable, Coroutine, TypeVar
 
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -24,7 +26,9 @@ settings = get_app_settings()
 Base = declarative_base()  # needed for Alembic migrations
 
 # NOTE: asynchronous SQLAlchemy engine and session should be used with
-#   dependency injection for normal API calls
+#   dependency injection for normal API calls; create_async_engine() gives
+#   file/network databases an AsyncAdaptedQueuePool, so pool checkout never
+#   blocks the event loop
 
 # default connection arguments; we can modify depending on config settings
 connect_args = settings.sqlalchemy.connect_args
@@ -105,6 +109,28 @@ sync_engine = create_engine(
 )
 sync_session = sessionmaker(bind=sync_engine)
 
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> None:
+    """
+    Open pooled connections ahead of time so early requests skip connect latency.
+
+    All connections are held at once, so that each one is a new connection, and
+    are then returned to the pool together.
+
+    Args:
+        engine: The async engine whose pool should be warmed up.
+        connections: The number of connections to open; 0 disables warmup.
+    """
+    if connections <= 0:
+        return
+
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            await stack.enter_async_context(engine.connect())
+
+    logger.info("Warmed up %s database connection(s)", connections)
+
+
 T = TypeVar("T")  # preserves the return type of the original coroutine
 
 
@@ -131,13 +157,15 @@ def with_huey_db_session(
         async with huey_session() as session:
             try:
                 kwargs["db_session"] = session
-                logger.debug(f"Running: {func.__qualname__}")
+                logger.debug("Running: %s", func.__qualname__)
                 result = await func(*args, **kwargs)
                 await session.commit()
                 return result
             except Exception as exc:
                 logger.critical(
-                    f"Error in {func.__qualname__}, rolling back session: {exc}",
+                    "Error in %s, rolling back session: %s",
+                    func.__qualname__,
+                    exc,
                     exc_info=True,
                 )
                 await session.rollback()
@@ -145,6 +173,6 @@ def with_huey_db_session(
             finally:
                 await session.close()
                 await huey_engine.dispose()  # Clean up all connection pools
-                logger.debug(f"Disposed DB engine after: {func.__qualname__}")
+                logger.debug("Disposed DB engine after: %s", func.__qualname__)
 
     return wrapper
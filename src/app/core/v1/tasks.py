@@ -4,12 +4,19 @@
 
 """Set-up and initialize async tasks engine."""
 
+from typing import Any
+
 from huey import RedisExpireHuey, SqliteHuey
+from nmtfast.tasks.v1.huey import fetch_task_metadata, fetch_task_result
 
 from app.core.v1.settings import get_app_settings
 
 settings = get_app_settings()
 
+# NOTE: zap tasks sleep this many seconds at a time, and publish their progress
+#   after each sleep
+HEARTBEAT_SECONDS = 5
+
 huey_app = SqliteHuey(
     name=settings.tasks.name,
     filename=settings.tasks.sqlite_filename,
@@ -20,3 +27,29 @@ if settings.tasks.backend == "redis":
         name=settings.tasks.name,
         url=settings.tasks.url,
     )
+
+
+def fetch_task_state(task_uuid: str) -> tuple[Any, Exception | None, Any]:
+    """
+    Fetch the result of a Huey task, or its metadata if it has no result yet.
+
+    Both reads are blocking calls to the Huey storage backend, so this is meant to
+    run in a worker thread, where it costs one thread hop instead of two.
+
+    Args:
+        task_uuid: The UUID of the Huey task.
+
+    Returns:
+        tuple[Any, Exception | None, Any]: The task result, the error raised while
+            fetching the result (if the task failed), and the task metadata. The
+            metadata is only fetched when there is neither a result nor an error.
+    """
+    try:
+        task_result = fetch_task_result(huey_app, task_uuid)
+    except Exception as exc:
+        return None, exc, None
+
+    if task_result:
+        return task_result, None, None
+
+    return None, None, fetch_task_metadata(huey_app, task_uuid)
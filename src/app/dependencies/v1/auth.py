@@ -5,6 +5,7 @@
 """Dependencies related to authorization and authentication."""
 
 import logging
+from dataclasses import dataclass
 
 from fastapi import Depends, HTTPException, Request, Security
 from fastapi.security import APIKeyHeader
@@ -16,6 +17,7 @@ from nmtfast.settings.v1.schemas import SectionACL
 from app.core.v1.auth import process_api_key_header, process_bearer_token
 from app.core.v1.settings import AppSettings, get_app_settings
 from app.dependencies.v1.cache import get_cache
+from app.dependencies.v1.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -38,16 +40,30 @@ oauth2_auth_code_scheme = OAuth2AuthorizationCode(
 )
 
 
-async def authenticate_headers(
+@dataclass(slots=True)
+class ClientCredentials:
+    """
+    Credentials presented by a client, before they are validated.
+
+    Attributes:
+        api_key: The API key from the X-API-Key request header.
+        bearer_token: The Bearer token from the Authorization header.
+    """
+
+    api_key: str | None
+    bearer_token: str | None
+
+
+async def get_client_credentials(
     api_key: str | None = Security(api_key_header),
     token: str | None = Security(oauth2_scheme),
     token_auth_code: str | None = Security(oauth2_auth_code_scheme),
-    settings: AppSettings = Depends(get_app_settings),
-    cache: AppCacheBase = Depends(get_cache),
-) -> str:
+) -> ClientCredentials:
     """
-    Authenticate client headers, which might be a Bearer token or an API key.
+    Extract client credentials, rejecting requests that cannot possibly succeed.
 
+    This only inspects the request headers, so requests with missing or conflicting
+    credentials are rejected before any API key, token or ACL lookups are made.
     Accepts Bearer tokens from either the client credentials scheme or the
     authorization code scheme; both populate the same Authorization header.
 
@@ -56,14 +72,12 @@ async def authenticate_headers(
         token: The Bearer token extracted via the client credentials OAuth2 scheme.
         token_auth_code: The Bearer token extracted via the authorization code
             OAuth2 scheme.
-        settings: The application settings.
-        cache: An implementation of AppCacheBase for getting/setting cache keys.
 
     Returns:
-        str: A string indicating which authentication method was used.
+        ClientCredentials: The API key or Bearer token presented by the client.
 
     Raises:
-        HTTPException: If the credentials are not valid.
+        HTTPException: If no credentials, or conflicting credentials, were provided.
     """
     bearer_token = token or token_auth_code
 
@@ -76,10 +90,39 @@ async def authenticate_headers(
             ),
         )
 
+    if not api_key and not bearer_token:
+        raise HTTPException(
+            status_code=403, detail="Missing X-API-Key and Bearer token."
+        )
+
+    return ClientCredentials(api_key=api_key, bearer_token=bearer_token)
+
+
+async def authenticate_headers(
+    credentials: ClientCredentials = Depends(get_client_credentials),
+    settings: AppSettings = Depends(get_settings),
+    cache: AppCacheBase = Depends(get_cache),
+) -> str:
+    """
+    Authenticate client headers, which might be a Bearer token or an API key.
+
+    Args:
+        credentials: The credentials presented by the client.
+        settings: The application settings.
+        cache: An implementation of AppCacheBase for getting/setting cache keys.
+
+    Returns:
+        str: A string indicating which authentication method was used.
+
+    Raises:
+        HTTPException: If the credentials are not valid.
+    """
     # check API key authentication (if provided)
-    if api_key:
+    if credentials.api_key:
         try:
-            acls = await process_api_key_header(api_key, settings, cache, "authn")
+            acls = await process_api_key_header(
+                credentials.api_key, settings, cache, "authn"
+            )
             if acls:
                 return "API key successfully authenticated."
         except AuthenticationError as exc:
@@ -88,9 +131,11 @@ async def authenticate_headers(
         raise HTTPException(status_code=403, detail="API key authentication failed")
 
     # check token authentication (if provided)
-    if bearer_token:
+    if credentials.bearer_token:
         try:
-            acls = await process_bearer_token(bearer_token, settings, cache, "authn")
+            acls = await process_bearer_token(
+                credentials.bearer_token, settings, cache, "authn"
+            )
             if acls:
                 return "Bearer token successfully authenticated."
         except AuthenticationError as exc:
@@ -101,7 +146,7 @@ async def authenticate_headers(
 
 async def get_acls(
     request: Request,
-    settings: AppSettings = Depends(get_app_settings),
+    settings: AppSettings = Depends(get_settings),
     cache: AppCacheBase = Depends(get_cache),
 ) -> list[SectionACL]:
     """
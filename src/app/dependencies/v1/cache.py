@@ -4,23 +4,17 @@
 
 """Dependencies related to caching."""
 
-from fastapi import Depends
 from nmtfast.cache.v1.base import AppCacheBase
 
 from app.core.v1.cache import app_cache
-from app.core.v1.settings import AppSettings, get_app_settings
 
 
-async def get_cache(
-    settings: AppSettings = Depends(get_app_settings),
-) -> AppCacheBase:
+async def get_cache() -> AppCacheBase:
     """
     Provide an application caching object.
 
     This provides dependency injection of app_cache objects into the dependency graph.
-
-    Args:
-        settings: The application settings.
+    It has no sub-dependencies, so FastAPI resolves it without walking any further.
 
     Returns:
         AppCacheBase: An implementation of the super class.
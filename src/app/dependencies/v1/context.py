@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""Dependencies shared by every authenticated service in a request."""
+
+from dataclasses import dataclass
+
+from fastapi import Depends
+from nmtfast.cache.v1.base import AppCacheBase
+from nmtfast.settings.v1.schemas import SectionACL
+
+from app.core.v1.settings import AppSettings
+from app.dependencies.v1.auth import get_acls
+from app.dependencies.v1.cache import get_cache
+from app.dependencies.v1.settings import get_settings
+
+
+@dataclass(slots=True)
+class RequestContext:
+    """
+    Per-request objects that every service layer needs.
+
+    Attributes:
+        acls: List of ACLs associated with authenticated client/apikey.
+        settings: The application's AppSettings object.
+        cache: An implementation of AppCacheBase, used for getting/setting cache data.
+    """
+
+    acls: list[SectionACL]
+    settings: AppSettings
+    cache: AppCacheBase
+
+
+async def get_request_context(
+    acls: list[SectionACL] = Depends(get_acls),
+    settings: AppSettings = Depends(get_settings),
+    cache: AppCacheBase = Depends(get_cache),
+) -> RequestContext:
+    """
+    Bundle ACLs, settings and cache into a single dependency.
+
+    FastAPI caches this per request, so every service factory that depends on it
+    shares one RequestContext.
+
+    Args:
+        acls: List of ACLs associated with authenticated client/apikey.
+        settings: The application's AppSettings object.
+        cache: An implementation of AppCacheBase, used for getting/setting cache data.
+
+    Returns:
+        RequestContext: The bundled request dependencies.
+    """
+    return RequestContext(acls=acls, settings=settings, cache=cache)
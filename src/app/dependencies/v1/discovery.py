@@ -11,13 +11,14 @@ from nmtfast.discovery.v1.clients import create_api_client
 
 from app.core.v1.cache import app_cache
 from app.core.v1.discovery import api_clients, api_clients_lock, required_clients
-from app.core.v1.settings import AppSettings, get_app_settings
+from app.core.v1.settings import AppSettings
+from app.dependencies.v1.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
 async def get_api_clients(
-    settings: AppSettings = Depends(get_app_settings),
+    settings: AppSettings = Depends(get_settings),
 ) -> dict:
     """
     Provides a dictionary of async httpx clients, creating them lazily on first use.
@@ -37,12 +38,12 @@ async def get_api_clients(
         if client_name not in api_clients:
             async with api_clients_lock:
                 if client_name not in api_clients:
-                    logger.info(f"Lazily creating API client for '{client_name}'...")
+                    logger.info("Lazily creating API client for '%s'...", client_name)
                     api_clients[client_name] = await create_api_client(
                         settings.auth,
                         settings.discovery,
                         client_name,
                         cache=app_cache,
                     )
-                    logger.info(f"API client for '{client_name}' created successfully")
+                    logger.info("API client for '%s' created successfully", client_name)
     return api_clients
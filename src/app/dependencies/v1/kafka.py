@@ -8,11 +8,12 @@ from aiokafka import AIOKafkaProducer
 from fastapi import Depends
 
 from app.core.v1.kafka import create_kafka_producer
-from app.core.v1.settings import AppSettings, get_app_settings
+from app.core.v1.settings import AppSettings
+from app.dependencies.v1.settings import get_settings
 
 
 async def get_kafka_producer(
-    settings: AppSettings = Depends(get_app_settings),
+    settings: AppSettings = Depends(get_settings),
 ) -> AIOKafkaProducer | None:
     """
     Provide dependency access to the Kafka producer.
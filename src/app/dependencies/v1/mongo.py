@@ -8,11 +8,12 @@ from fastapi import Depends
 from pymongo.asynchronous.database import AsyncDatabase as AsyncMongoDatabase
 
 from app.core.v1.mongo import get_async_client
-from app.core.v1.settings import AppSettings, get_app_settings
+from app.core.v1.settings import AppSettings
+from app.dependencies.v1.settings import get_settings
 
 
 async def get_mongo_db(
-    settings: AppSettings = Depends(get_app_settings),
+    settings: AppSettings = Depends(get_settings),
 ) -> AsyncMongoDatabase:
     """
     Provide an async MongoDB database for FastAPI endpoints.
@@ -10,14 +10,15 @@ from typing import AsyncGenerator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.v1.settings import AppSettings, get_app_settings
+from app.core.v1.settings import AppSettings
 from app.core.v1.sqlalchemy import async_session
+from app.dependencies.v1.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
 async def get_sql_db(
-    settings: AppSettings = Depends(get_app_settings),
+    settings: AppSettings = Depends(get_settings),
 ) -> AsyncGenerator[AsyncSession, None]:
     """
     Provide an async sqlalchemy session for FastAPI endpoints.
@@ -15,6 +15,17 @@ class ResourceNotFoundError(Exception):
     """
 
     def __init__(self, resource_id: str | int, resource_name: str) -> None:
-        super().__init__(f"{resource_name} with ID {resource_id} not found.")
+        # NOTE: the message is only formatted when it is needed, because misses
+        #   that are caught internally never render it
+        super().__init__(resource_id, resource_name)
         self.resource_id: str | int = resource_id
         self.resource_name: str = resource_name
+
+    def __str__(self) -> str:
+        """
+        Format the error message.
+
+        Returns:
+            str: A message naming the resource that was not found.
+        """
+        return f"{self.resource_name} with ID {self.resource_id} not found."
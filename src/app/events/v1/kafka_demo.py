@@ -18,4 +18,4 @@ async def route_kafka_message(message: ConsumerRecord) -> None:
     Args:
       message: The entire Kafka ConsumerRecord message (with topics, value, etc)
     """
-    logger.info(f"Received Kafka message: {message}")
+    logger.info("Received Kafka message: %s", message)
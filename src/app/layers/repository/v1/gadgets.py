@@ -83,9 +83,11 @@ class GadgetRepository:
 
         await self.collection.insert_one(new_gadget)
         inserted_gadget = await self.collection.find_one({"id": new_gadget["id"]})
-        logger.debug(f"Inserted gadget: {inserted_gadget}")
+        logger.debug("Inserted gadget: %s", inserted_gadget)
 
-        return GadgetRead(**new_gadget)
+        # NOTE: new_gadget was dumped from a validated GadgetCreate, so there is
+        #   nothing left to coerce
+        return GadgetRead.model_construct(**new_gadget)
 
     @retry(
         reraise=True,
@@ -106,19 +108,19 @@ class GadgetRepository:
         Raises:
             ResourceNotFoundError: If the gadget is not found.
         """
-        logger.debug(f"Fetching gadget by ID: {gadget_id}")
+        logger.debug("Fetching gadget by ID: %s", gadget_id)
         db_gadget: dict[str, Any] | None = await self.collection.find_one(
             {"id": gadget_id}
         )
 
         if db_gadget is None:
-            logger.warning(f"Gadget with ID {gadget_id} not found.")
+            logger.warning("Gadget with ID %s not found.", gadget_id)
             raise ResourceNotFoundError(gadget_id, "Gadget")
 
-        logger.debug(f"Retrieved gadget: {db_gadget}")
+        logger.debug("Retrieved gadget: %s", db_gadget)
         db_gadget = self._normalize_gadget(db_gadget)
 
-        return GadgetRead(**db_gadget)
+        return GadgetRead.model_validate(db_gadget)
 
     @retry(
         reraise=True,
@@ -140,7 +142,7 @@ class GadgetRepository:
         Raises:
             ResourceNotFoundError: If the gadget is not found.
         """
-        logger.debug(f"Updating force for gadget ID {gadget_id} to {new_force}")
+        logger.debug("Updating force for gadget ID %s to %s", gadget_id, new_force)
         db_gadget = await self.collection.find_one_and_update(
             {"id": gadget_id},
             {"$set": {"force": new_force}},
@@ -148,13 +150,47 @@ class GadgetRepository:
         )
 
         if db_gadget is None:
-            logger.warning(f"Gadget with ID {gadget_id} not found.")
+            logger.warning("Gadget with ID %s not found.", gadget_id)
             raise ResourceNotFoundError(gadget_id, "Gadget")
 
-        logger.debug(f"Gadget ID {gadget_id} force updated to {new_force}")
+        logger.debug("Gadget ID %s force updated to %s", gadget_id, new_force)
         db_gadget = self._normalize_gadget(db_gadget)
 
-        return GadgetRead(**db_gadget)
+        return GadgetRead.model_validate(db_gadget)
+
+    # NOTE: this is not retried, because an increment is not idempotent
+    async def increment_force(self, gadget_id: str, amount: int = 1) -> GadgetRead:
+        """
+        Atomically increment the force property of a gadget.
+
+        A gadget without a force value is treated as having a force of zero.
+
+        Args:
+            gadget_id: The ID of the gadget to update.
+            amount: The amount to add to the force property.
+
+        Returns:
+            GadgetRead: The updated gadget.
+
+        Raises:
+            ResourceNotFoundError: If the gadget is not found.
+        """
+        logger.debug("Incrementing force for gadget ID %s by %s", gadget_id, amount)
+        # NOTE: an update pipeline is used because $inc fails on a null force
+        db_gadget = await self.collection.find_one_and_update(
+            {"id": gadget_id},
+            [{"$set": {"force": {"$add": [{"$ifNull": ["$force", 0]}, amount]}}}],
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if db_gadget is None:
+            logger.warning("Gadget with ID %s not found.", gadget_id)
+            raise ResourceNotFoundError(gadget_id, "Gadget")
+
+        logger.debug("Gadget ID %s force updated to %s", gadget_id, db_gadget["force"])
+        db_gadget = self._normalize_gadget(db_gadget)
+
+        return GadgetRead.model_validate(db_gadget)
 
     @retry(
         reraise=True,
@@ -203,8 +239,8 @@ class GadgetRepository:
         )
         gadgets: list[GadgetRead] = []
         async for doc in cursor:
-            gadgets.append(GadgetRead(**self._normalize_gadget(doc)))
-        logger.debug(f"Retrieved {len(gadgets)} gadgets (total: {total})")
+            gadgets.append(GadgetRead.model_validate(self._normalize_gadget(doc)))
+        logger.debug("Retrieved %s gadgets (total: %s)", len(gadgets), total)
 
         return gadgets, total
 
@@ -228,7 +264,7 @@ class GadgetRepository:
         Raises:
             ResourceNotFoundError: If the gadget is not found.
         """
-        logger.debug(f"Updating gadget ID {gadget_id}")
+        logger.debug("Updating gadget ID %s", gadget_id)
         update_fields = data.model_dump(exclude_unset=True)
 
         db_gadget = await self.collection.find_one_and_update(
@@ -238,13 +274,13 @@ class GadgetRepository:
         )
 
         if db_gadget is None:
-            logger.warning(f"Gadget with ID {gadget_id} not found.")
+            logger.warning("Gadget with ID %s not found.", gadget_id)
             raise ResourceNotFoundError(gadget_id, "Gadget")
 
         db_gadget = self._normalize_gadget(db_gadget)
-        logger.debug(f"Updated gadget ID {gadget_id}: {update_fields}")
+        logger.debug("Updated gadget ID %s: %s", gadget_id, update_fields)
 
-        return GadgetRead(**db_gadget)
+        return GadgetRead.model_validate(db_gadget)
 
     @retry(
         reraise=True,
@@ -262,14 +298,14 @@ class GadgetRepository:
         Raises:
             ResourceNotFoundError: If the gadget is not found.
         """
-        logger.debug(f"Deleting gadget ID {gadget_id}")
+        logger.debug("Deleting gadget ID %s", gadget_id)
         result = await self.collection.delete_one({"id": gadget_id})
 
         if result.deleted_count == 0:
-            logger.warning(f"Gadget with ID {gadget_id} not found.")
+            logger.warning("Gadget with ID %s not found.", gadget_id)
             raise ResourceNotFoundError(gadget_id, "Gadget")
 
-        logger.debug(f"Deleted gadget ID {gadget_id}")
+        logger.debug("Deleted gadget ID %s", gadget_id)
 
     @retry(
         reraise=True,
@@ -287,9 +323,9 @@ class GadgetRepository:
         Returns:
             int: The number of gadgets deleted.
         """
-        logger.debug(f"Bulk deleting gadget IDs: {ids}")
+        logger.debug("Bulk deleting gadget IDs: %s", ids)
         result = await self.collection.delete_many({"id": {"$in": ids}})
-        logger.debug(f"Bulk deleted {result.deleted_count} gadgets")
+        logger.debug("Bulk deleted %s gadgets", result.deleted_count)
 
         return result.deleted_count
 
@@ -318,12 +354,12 @@ class GadgetRepository:
         if not update_fields:
             return 0
 
-        logger.debug(f"Bulk updating gadget IDs {ids}: {update_fields}")
+        logger.debug("Bulk updating gadget IDs %s: %s", ids, update_fields)
         result = await self.collection.update_many(
             {"id": {"$in": ids}},
             {"$set": update_fields},
         )
-        logger.debug(f"Bulk updated {result.modified_count} gadgets")
+        logger.debug("Bulk updated %s gadgets", result.modified_count)
 
         return result.modified_count
 
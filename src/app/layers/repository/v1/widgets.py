@@ -29,6 +29,8 @@ class WidgetRepository:
         db: The asynchronous database session.
     """
 
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession) -> None:
         self.db: AsyncSession = db
 
@@ -48,9 +50,10 @@ class WidgetRepository:
         Returns:
             Widget: The newly created widget instance.
         """
-        db_widget = Widget(**widget.model_dump())
+        new_widget = widget.model_dump()
+        db_widget = Widget(**new_widget)
         self.db.add(db_widget)
-        logger.debug(f"Adding widget: {widget.model_dump()}")
+        logger.debug("Adding widget: %s", new_widget)
 
         await self.db.commit()
         await self.db.refresh(db_widget)
@@ -76,13 +79,13 @@ class WidgetRepository:
         Raises:
             ResourceNotFoundError: If the widget is not found.
         """
-        logger.debug(f"Fetching widget by ID: {widget_id}")
+        logger.debug("Fetching widget by ID: %s", widget_id)
         db_widget = await self.db.get(Widget, widget_id)
 
         if db_widget is None:
-            logger.warning(f"Widget with ID {widget_id} not found.")
+            logger.warning("Widget with ID %s not found.", widget_id)
             raise ResourceNotFoundError(widget_id, "Widget")
-        logger.debug(f"Retrieved widget: {db_widget}")
+        logger.debug("Retrieved widget: %s", db_widget)
 
         return db_widget
 
@@ -106,17 +109,55 @@ class WidgetRepository:
         Raises:
             ResourceNotFoundError: If the widget is not found.
         """
-        logger.debug(f"Updating force for widget ID {widget_id} to {new_force}")
+        logger.debug("Updating force for widget ID %s to %s", widget_id, new_force)
         db_widget = await self.db.get(Widget, widget_id)
 
         if db_widget is None:
-            logger.warning(f"Widget with ID {widget_id} not found.")
+            logger.warning("Widget with ID %s not found.", widget_id)
             raise ResourceNotFoundError(widget_id, "Widget")
-        logger.debug(f"Widget ID {widget_id} force updated to {new_force}")
+        logger.debug("Widget ID %s force updated to %s", widget_id, new_force)
         db_widget.force = new_force
 
         return db_widget
 
+    # NOTE: this is not retried, because an increment is not idempotent
+    async def increment_force(self, widget_id: int, amount: int = 1) -> int:
+        """
+        Atomically increment the force property of a widget.
+
+        A widget without a force value is treated as having a force of zero. Like
+        update_force, the change is committed by the caller.
+
+        Args:
+            widget_id: The ID of the widget to update.
+            amount: The amount to add to the force property.
+
+        Returns:
+            int: The new force value.
+
+        Raises:
+            ResourceNotFoundError: If the widget is not found.
+        """
+        logger.debug("Incrementing force for widget ID %s by %s", widget_id, amount)
+        result = await self.db.execute(
+            sa_update(Widget)
+            .where(Widget.id == widget_id)
+            .values(force=func.coalesce(Widget.force, 0) + amount)
+        )
+
+        if result.rowcount == 0:
+            logger.warning("Widget with ID %s not found.", widget_id)
+            raise ResourceNotFoundError(widget_id, "Widget")
+
+        # NOTE: RETURNING would save this query, but MySQL does not support it
+        result = await self.db.execute(
+            select(Widget.force).where(Widget.id == widget_id)
+        )
+        new_force: int = result.scalar_one()
+        logger.debug("Widget ID %s force updated to %s", widget_id, new_force)
+
+        return new_force
+
     @retry(
         reraise=True,
         stop=stop_after_attempt(5),
@@ -176,7 +217,7 @@ class WidgetRepository:
             query.order_by(order).offset(offset).limit(page_size)
         )
         widgets = list(result.scalars().all())
-        logger.debug(f"Retrieved {len(widgets)} widgets (total: {total})")
+        logger.debug("Retrieved %s widgets (total: %s)", len(widgets), total)
 
         return widgets, total
 
@@ -200,11 +241,11 @@ class WidgetRepository:
         Raises:
             ResourceNotFoundError: If the widget is not found.
         """
-        logger.debug(f"Updating widget ID {widget_id}")
+        logger.debug("Updating widget ID %s", widget_id)
         db_widget = await self.db.get(Widget, widget_id)
 
         if db_widget is None:
-            logger.warning(f"Widget with ID {widget_id} not found.")
+            logger.warning("Widget with ID %s not found.", widget_id)
             raise ResourceNotFoundError(widget_id, "Widget")
 
         update_fields = data.model_dump(exclude_unset=True)
@@ -213,7 +254,7 @@ class WidgetRepository:
 
         await self.db.commit()
         await self.db.refresh(db_widget)
-        logger.debug(f"Updated widget ID {widget_id}: {update_fields}")
+        logger.debug("Updated widget ID %s: %s", widget_id, update_fields)
 
         return db_widget
 
@@ -233,16 +274,16 @@ class WidgetRepository:
         Raises:
             ResourceNotFoundError: If the widget is not found.
         """
-        logger.debug(f"Deleting widget ID {widget_id}")
+        logger.debug("Deleting widget ID %s", widget_id)
         db_widget = await self.db.get(Widget, widget_id)
 
         if db_widget is None:
-            logger.warning(f"Widget with ID {widget_id} not found.")
+            logger.warning("Widget with ID %s not found.", widget_id)
             raise ResourceNotFoundError(widget_id, "Widget")
 
         await self.db.delete(db_widget)
         await self.db.commit()
-        logger.debug(f"Deleted widget ID {widget_id}")
+        logger.debug("Deleted widget ID %s", widget_id)
 
     @retry(
         reraise=True,
@@ -260,11 +301,11 @@ class WidgetRepository:
         Returns:
             int: The number of widgets deleted.
         """
-        logger.debug(f"Bulk deleting widget IDs: {ids}")
+        logger.debug("Bulk deleting widget IDs: %s", ids)
         result = await self.db.execute(sa_delete(Widget).where(Widget.id.in_(ids)))
         await self.db.commit()
         deleted_count = result.rowcount
-        logger.debug(f"Bulk deleted {deleted_count} widgets")
+        logger.debug("Bulk deleted %s widgets", deleted_count)
 
         return deleted_count
 
@@ -293,13 +334,13 @@ class WidgetRepository:
         if not update_fields:
             return 0
 
-        logger.debug(f"Bulk updating widget IDs {ids}: {update_fields}")
+        logger.debug("Bulk updating widget IDs %s: %s", ids, update_fields)
         result = await self.db.execute(
             sa_update(Widget).where(Widget.id.in_(ids)).values(**update_fields)
         )
         await self.db.commit()
         updated_count = result.rowcount
-        logger.debug(f"Bulk updated {updated_count} widgets")
+        logger.debug("Bulk updated %s widgets", updated_count)
 
         return updated_count
 
@@ -412,7 +453,7 @@ class WidgetRepository:
 
         result = await self.db.execute(query)
         tasks = list(result.scalars().all())
-        logger.debug(f"Retrieved {len(tasks)} tasks (total: {total})")
+        logger.debug("Retrieved %s tasks (total: %s)", len(tasks), total)
 
         return tasks, total
 
@@ -9,15 +9,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Path, Query, status
 from fastapi.responses import JSONResponse
-from nmtfast.cache.v1.base import AppCacheBase
-from nmtfast.settings.v1.schemas import SectionACL
 from pymongo.asynchronous.database import AsyncDatabase as AsyncMongoDatabase
 
-from app.core.v1.settings import AppSettings
-from app.dependencies.v1.auth import authenticate_headers, get_acls
-from app.dependencies.v1.cache import get_cache
+from app.core.v1.responses import PydanticJSONResponse
+from app.dependencies.v1.auth import authenticate_headers
+from app.dependencies.v1.context import RequestContext, get_request_context
 from app.dependencies.v1.mongo import get_mongo_db
-from app.dependencies.v1.settings import get_settings
 from app.layers.repository.v1.gadgets import GadgetRepository
 from app.layers.service.v1.gadgets import GadgetService
 from app.schemas.dto.v1.gadgets import (
@@ -34,30 +31,30 @@ gadgets_router = APIRouter(
     prefix="/v1/gadgets",
     tags=["Gadget Operations (MongoDB)"],
     dependencies=[Depends(authenticate_headers)],
+    default_response_class=PydanticJSONResponse,
 )
 
 
-def get_gadget_service(
+async def get_gadget_service(
     db: AsyncMongoDatabase = Depends(get_mongo_db),
-    acls: list[SectionACL] = Depends(get_acls),
-    settings: AppSettings = Depends(get_settings),
-    cache: AppCacheBase = Depends(get_cache),
+    ctx: RequestContext = Depends(get_request_context),
 ) -> GadgetService:
     """
     Dependency function to provide a GadgetService instance.
 
     Args:
         db: The asynchronous MongoDB database.
-        acls: List of ACLs associated with authenticated client/apikey.
-        settings: The application's AppSettings object.
-        cache: An implementation of AppCacheBase, for getting/setting cache data.
+        ctx: The ACLs, settings and cache for the current request.
 
     Returns:
         GadgetService: An instance of the gadget service.
     """
     gadget_repository = GadgetRepository(db)
 
-    return GadgetService(gadget_repository, acls, settings, cache)
+    return GadgetService(gadget_repository, ctx.acls, ctx.settings, ctx.cache)
+
+
+GadgetServiceDep = Annotated[GadgetService, Depends(get_gadget_service)]
 
 
 @gadgets_router.post(
@@ -87,7 +84,7 @@ async def gadget_create(
             },
         ),
     ],
-    gadget_service: GadgetService = Depends(get_gadget_service),
+    gadget_service: GadgetServiceDep,
 ) -> GadgetRead:
     """
     Create a new gadget.
@@ -99,7 +96,7 @@ async def gadget_create(
     Returns:
         GadgetRead: The created gadget data.
     """
-    logger.info(f"Attempting to create a gadget: {gadget}")
+    logger.info("Attempting to create a gadget: %s", gadget)
     return await gadget_service.gadget_create(gadget)
 
 
@@ -112,6 +109,7 @@ async def gadget_create(
     operation_id="list_gadgets",
 )
 async def gadget_list(
+    gadget_service: GadgetServiceDep,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=5000, description="Items per page")] = 10,
     sort_by: Annotated[str, Query(description="Field to sort by")] = "id",
@@ -119,18 +117,17 @@ async def gadget_list(
         str, Query(pattern="^(asc|desc)$", description="Sort direction")
     ] = "asc",
     search: Annotated[str | None, Query(description="Search filter")] = None,
-    gadget_service: GadgetService = Depends(get_gadget_service),
 ) -> JSONResponse:
     """
     List all gadgets with pagination and sorting.
 
     Args:
+        gadget_service: The gadget service instance.
         page: The page number (1-indexed).
         page_size: The number of items per page.
         sort_by: The field to sort by.
         sort_order: The sort direction ('asc' or 'desc').
         search: Optional search filter string.
-        gadget_service: The gadget service instance.
 
     Returns:
         JSONResponse: A JSON list of gadgets with X-Total-Count header.
@@ -143,9 +140,8 @@ async def gadget_list(
         sort_order=sort_order,
         search=search,
     )
-    content = [g.model_dump(mode="json") for g in gadgets]
-    return JSONResponse(
-        content=content,
+    return PydanticJSONResponse(
+        content=gadgets,
         headers={"X-Total-Count": str(total)},
     )
 
@@ -162,7 +158,7 @@ async def gadget_get_by_id(
         str,
         Path(description="The ID of the gadget to retrieve."),
     ],
-    gadget_service: GadgetService = Depends(get_gadget_service),
+    gadget_service: GadgetServiceDep,
 ) -> GadgetRead:
     """
     Retrieve a gadget by its ID.
@@ -174,7 +170,7 @@ async def gadget_get_by_id(
     Returns:
         GadgetRead: The retrieved gadget data.
     """
-    logger.info(f"Attempting to find gadget {gadget_id}")
+    logger.info("Attempting to find gadget %s", gadget_id)
     return await gadget_service.gadget_get_by_id(gadget_id)
 
 
@@ -206,7 +202,7 @@ async def gadget_update(
             },
         ),
     ],
-    gadget_service: GadgetService = Depends(get_gadget_service),
+    gadget_service: GadgetServiceDep,
 ) -> GadgetRead:
     """
     Update an existing gadget.
@@ -219,7 +215,7 @@ async def gadget_update(
     Returns:
         GadgetRead: The updated gadget data.
     """
-    logger.info(f"Attempting to update gadget {gadget_id}: {gadget}")
+    logger.info("Attempting to update gadget %s: %s", gadget_id, gadget)
     return await gadget_service.gadget_update(gadget_id, gadget)
 
 
@@ -235,7 +231,7 @@ async def gadget_delete(
         str,
         Path(description="The ID of the gadget to delete."),
     ],
-    gadget_service: GadgetService = Depends(get_gadget_service),
+    gadget_service: GadgetServiceDep,
 ) -> None:
     """
     Delete a gadget by its ID.
@@ -244,7 +240,7 @@ async def gadget_delete(
         gadget_id: The ID of the gadget to delete.
         gadget_service: The gadget service instance.
     """
-    logger.info(f"Attempting to delete gadget {gadget_id}")
+    logger.info("Attempting to delete gadget %s", gadget_id)
     await gadget_service.gadget_delete(gadget_id)
 
 
@@ -257,7 +253,7 @@ async def gadget_delete(
 )
 async def gadget_bulk_delete(
     ids: Annotated[list[str], Body(embed=False)],
-    gadget_service: GadgetService = Depends(get_gadget_service),
+    gadget_service: GadgetServiceDep,
 ) -> dict[str, int]:
     """
     Delete multiple gadgets by their IDs.
@@ -269,7 +265,7 @@ async def gadget_bulk_delete(
     Returns:
         dict[str, int]: The number of gadgets deleted.
     """
-    logger.info(f"Attempting to bulk delete gadgets: {ids}")
+    logger.info("Attempting to bulk delete gadgets: %s", ids)
     deleted = await gadget_service.gadget_bulk_delete(ids)
 
     return {"deleted": deleted}
@@ -284,7 +280,7 @@ async def gadget_bulk_delete(
 )
 async def gadget_bulk_update(
     payload: Annotated[GadgetBulkUpdate, Body()],
-    gadget_service: GadgetService = Depends(get_gadget_service),
+    gadget_service: GadgetServiceDep,
 ) -> dict[str, int]:
     """
     Update multiple gadgets by their IDs.
@@ -296,7 +292,9 @@ async def gadget_bulk_update(
     Returns:
         dict[str, int]: The number of gadgets updated.
     """
-    logger.info(f"Attempting to bulk update gadgets {payload.ids}: {payload.updates}")
+    logger.info(
+        "Attempting to bulk update gadgets %s: %s", payload.ids, payload.updates
+    )
     updated = await gadget_service.gadget_bulk_update(payload.ids, payload.updates)
 
     return {"updated": updated}
@@ -314,6 +312,7 @@ async def gadget_zap_list(
         str,
         Path(description="The ID of the gadget."),
     ],
+    gadget_service: GadgetServiceDep,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=5000, description="Items per page")] = 10,
     sort_by: Annotated[str, Query(description="Field to sort by")] = "created_at",
@@ -321,24 +320,23 @@ async def gadget_zap_list(
         str, Query(pattern="^(asc|desc)$", description="Sort direction")
     ] = "desc",
     search: Annotated[str | None, Query(description="Search filter")] = None,
-    gadget_service: GadgetService = Depends(get_gadget_service),
 ) -> JSONResponse:
     """
     Retrieve zap task history for a gadget with pagination.
 
     Args:
         gadget_id: The ID of the gadget.
+        gadget_service: The gadget service instance.
         page: The page number (1-indexed).
         page_size: The number of items per page.
         sort_by: The field to sort by.
         sort_order: The sort direction ('asc' or 'desc').
         search: Optional search filter.
-        gadget_service: The gadget service instance.
 
     Returns:
         JSONResponse: A JSON list of zap task history records with X-Total-Count header.
     """
-    logger.info(f"Listing zap task history for gadget {gadget_id}")
+    logger.info("Listing zap task history for gadget %s", gadget_id)
     tasks, total = await gadget_service.gadget_zap_history(
         gadget_id=gadget_id,
         page=page,
@@ -347,9 +345,8 @@ async def gadget_zap_list(
         sort_order=sort_order,
         search=search,
     )
-    content = [t.model_dump(mode="json") for t in tasks]
-    return JSONResponse(
-        content=content,
+    return PydanticJSONResponse(
+        content=tasks,
         headers={"X-Total-Count": str(total)},
     )
 
@@ -383,7 +380,7 @@ async def gadget_zap(
             },
         ),
     ],
-    gadget_service: GadgetService = Depends(get_gadget_service),
+    gadget_service: GadgetServiceDep,
 ) -> GadgetZapTask:
     """
     Zaps an existing gadget.
@@ -396,7 +393,7 @@ async def gadget_zap(
     Returns:
         GadgetZapTask: Information about the new task that was created.
     """
-    logger.info(f"Attempting to zap gadget {gadget_id}: {payload}")
+    logger.info("Attempting to zap gadget %s: %s", gadget_id, payload)
     return await gadget_service.gadget_zap(gadget_id, payload)
 
 
@@ -416,7 +413,7 @@ async def gadget_zap_get_task(
         str,
         Path(description="The UUID of the async zap task."),
     ],
-    gadget_service: GadgetService = Depends(get_gadget_service),
+    gadget_service: GadgetServiceDep,
 ) -> GadgetZapTask:
     """
     Retrieve a zap gadget task by its UUID.
@@ -429,5 +426,5 @@ async def gadget_zap_get_task(
     Returns:
         GadgetZapTask: The retrieved gadget task data.
     """
-    logger.info(f"Attempting to find zap status for task {task_uuid}")
+    logger.info("Attempting to find zap status for task %s", task_uuid)
     return await gadget_service.gadget_zap_by_uuid(gadget_id, task_uuid)
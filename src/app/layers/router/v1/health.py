@@ -4,14 +4,18 @@
 
 """This module defines API endpoints for health/readiness checks."""
 
+import asyncio
 import logging
+import time
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
 from nmtfast.cache.v1.base import AppCacheBase
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.v1.health import check_app_readiness
+from app.core.v1.responses import PydanticJSONResponse
 from app.core.v1.settings import AppSettings
 from app.dependencies.v1.cache import get_cache
 from app.dependencies.v1.settings import get_settings
@@ -23,10 +27,104 @@ logger = logging.getLogger(__name__)
 health_router = APIRouter(
     # prefix="/health",
     tags=["API Health Operations"],
+    default_response_class=PydanticJSONResponse,
 )
 
+_LIVENESS_CHECKS = frozenset({"basic"})
+_READINESS_CHECKS = frozenset({"basic", "database", "cache"})
 
-def get_health_service(
+
+def _health_response(status_code: int, content: dict[str, Any]) -> JSONResponse:
+    """
+    Build a health check response that downstream proxies must not cache.
+
+    Args:
+        status_code: The HTTP status code of the response.
+        content: The JSON body of the response.
+
+    Returns:
+        JSONResponse: The health check response.
+    """
+    return PydanticJSONResponse(
+        status_code=status_code,
+        content=content,
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+class ReadinessCache:
+    """
+    Readiness probe results that are reused for a few seconds.
+
+    Frequent probes from orchestrators / load balancers would otherwise hit the
+    database and cache every time. One instance is held per app on app.state.
+
+    Attributes:
+        entry: The cached (expiry, status_code, content), if any.
+        lock: Held while a cache miss is recomputed, so that concurrent probes
+            wait for and then reuse the fresh result.
+    """
+
+    def __init__(self) -> None:
+        self.entry: tuple[float, int, dict[str, Any]] | None = None
+        self.lock: asyncio.Lock = asyncio.Lock()
+
+    def get(self) -> JSONResponse | None:
+        """
+        Return the cached readiness response, if it has not expired yet.
+
+        Returns:
+            JSONResponse | None: The cached response, or None on a miss.
+        """
+        if self.entry is None or time.monotonic() >= self.entry[0]:
+            return None
+
+        return _health_response(self.entry[1], self.entry[2])
+
+    def set(
+        self,
+        ttl: float,
+        status_code: int,
+        content: dict[str, Any],
+    ) -> JSONResponse:
+        """
+        Store a readiness result and return the matching response.
+
+        Args:
+            ttl: The number of seconds the result may be reused.
+            status_code: The HTTP status code of the response.
+            content: The JSON body of the response.
+
+        Returns:
+            JSONResponse: The readiness response.
+        """
+        self.entry = (time.monotonic() + ttl, status_code, content)
+
+        return _health_response(status_code, content)
+
+
+async def get_readiness_cache(request: Request) -> ReadinessCache:
+    """
+    Dependency function to provide the app's ReadinessCache.
+
+    The cache is created on first use, so every app gets its own results and lock.
+    This runs on the event loop with no await between the check and the store, so
+    concurrent cold probes cannot each create their own cache.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        ReadinessCache: The readiness cache of the app serving the request.
+    """
+    state = request.app.state
+    if not hasattr(state, "readiness_cache"):
+        state.readiness_cache = ReadinessCache()
+
+    return state.readiness_cache
+
+
+async def get_health_service(
     settings: AppSettings = Depends(get_settings),
     db: AsyncSession = Depends(get_sql_db),
     cache: AppCacheBase = Depends(get_cache),
@@ -42,17 +140,23 @@ def get_health_service(
     Returns:
         AppHealthService: An instance of the app health service.
     """
+    # NOTE: db is checked out from the pooled async engine, so the database check
+    #   reuses a warm connection instead of connecting on every probe
     widget_repository = WidgetRepository(db)
 
     return AppHealthService(settings, widget_repository, cache)
 
 
+AppHealthServiceDep = Annotated[AppHealthService, Depends(get_health_service)]
+ReadinessCacheDep = Annotated[ReadinessCache, Depends(get_readiness_cache)]
+
+
 @health_router.get(
     path="/health/liveness",
     include_in_schema=False,
 )
 async def liveness(
-    health_service: AppHealthService = Depends(get_health_service),
+    health_service: AppHealthServiceDep,
 ) -> JSONResponse:
     """
     Perform liveness check(s) to determine if application is alive.
@@ -61,19 +165,20 @@ async def liveness(
     check_app_readiness() to see if the app is in the process of shutting down,
     and it will not bother checking database and cache availability.
 
+    LivenessMiddleware answers GET and HEAD probes in the main app before they
+    reach this route, so results are not cached here.
+
     Args:
         health_service: The app health service instance.
 
     Returns:
         JSONResponse: The retrieved readiness information.
     """
-    healthy = await health_service.check_health(checks=["basic"])
+    healthy = await health_service.check_health(checks=_LIVENESS_CHECKS)
     if not healthy:
-        return JSONResponse(
-            status_code=503, content={"status": "dependencies not ready"}
-        )
+        return _health_response(503, {"status": "dependencies not ready"})
 
-    return JSONResponse({"status": "alive"})
+    return _health_response(200, {"status": "alive"})
 
 
 @health_router.get(
@@ -81,7 +186,9 @@ async def liveness(
     include_in_schema=False,
 )
 async def readiness(
-    health_service: AppHealthService = Depends(get_health_service),
+    health_service: AppHealthServiceDep,
+    readiness_cache: ReadinessCacheDep,
+    settings: AppSettings = Depends(get_settings),
 ) -> JSONResponse:
     """
     Perform readiness check(s) to determine if application is ready for requests.
@@ -92,21 +199,40 @@ async def readiness(
     critical to the core function of the application, so the app would not be
     considered ready if it is cannot communicate with the database.
 
+    Dependency checks run concurrently; when any of them fails, the response body
+    includes the status of each check so that the failing subsystem is visible.
+    Dependency check results are reused for settings.health.readiness_ttl seconds,
+    but check_app_readiness() is always consulted so that shutdown is reported
+    immediately. Concurrent probes that miss the cache share one recomputation.
+
     Args:
         health_service: The app health service instance.
+        readiness_cache: The app's cached readiness result.
+        settings: The application's AppSettings object.
 
     Returns:
         JSONResponse: The retrieved readiness information.
     """
     if not check_app_readiness():
-        return JSONResponse(status_code=503, content={"status": "not ready"})
+        return _health_response(503, {"status": "not ready"})
 
-    healthy = await health_service.check_health(
-        checks=["basic", "database", "cache"],
-    )
-    if not healthy:
-        return JSONResponse(
-            status_code=503, content={"status": "dependencies not ready"}
-        )
+    if cached := readiness_cache.get():
+        return cached
 
-    return JSONResponse({"status": "ready"})
+    async with readiness_cache.lock:
+        if cached := readiness_cache.get():
+            return cached
+
+        ttl = settings.health.readiness_ttl
+        results = await health_service.check_health_results(
+            checks=_READINESS_CHECKS,
+        )
+        if not all(results.values()):
+            checks = {name: "ok" if ok else "failed" for name, ok in results.items()}
+            return readiness_cache.set(
+                ttl,
+                503,
+                {"status": "dependencies not ready", "checks": checks},
+            )
+
+        return readiness_cache.set(ttl, 200, {"status": "ready"})
@@ -5,11 +5,11 @@
 """This module defines API endpoints for managing widgets via upsteam API."""
 
 import logging
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Body, Depends, Path, Query, status
+from fastapi import APIRouter, Body, Depends, Path, Query, Request, Response, status
+from fastapi.openapi.models import Example
 from fastapi.responses import JSONResponse
-from nmtfast.cache.v1.base import AppCacheBase
 from nmtfast.repositories.widgets.v1.api import WidgetApiRepository
 from nmtfast.repositories.widgets.v1.schemas import (
     WidgetCreate,
@@ -17,13 +17,11 @@ from nmtfast.repositories.widgets.v1.schemas import (
     WidgetZap,
     WidgetZapTask,
 )
-from nmtfast.settings.v1.schemas import SectionACL
 
-from app.core.v1.settings import AppSettings
-from app.dependencies.v1.auth import authenticate_headers, get_acls
-from app.dependencies.v1.cache import get_cache
+from app.core.v1.responses import PydanticJSONResponse, etag_json_response
+from app.dependencies.v1.auth import authenticate_headers
+from app.dependencies.v1.context import RequestContext, get_request_context
 from app.dependencies.v1.discovery import get_api_clients
-from app.dependencies.v1.settings import get_settings
 from app.layers.service.v1.upstream import WidgetApiService
 
 logger = logging.getLogger(__name__)
@@ -31,65 +29,97 @@ widgets_api_router = APIRouter(
     prefix="/v1/upstream",
     tags=["Widget Operations (Upstream API)"],
     dependencies=[Depends(authenticate_headers)],
+    default_response_class=PydanticJSONResponse,
 )
 
+# NOTE: examples are typed as Example so that they match Body(openapi_examples=...)
+_CREATE_EXAMPLES: dict[str, Example] = {
+    "normal": {
+        "summary": "Create a widget",
+        "description": "A **normal** widget that is created successfully.",
+        "value": {
+            "name": "widget-432",
+            "height": "30cm",
+            "mass": "1.2kg",
+            "force": 1,
+        },
+    },
+}
+_ZAP_EXAMPLES: dict[str, Example] = {
+    "normal": {
+        "summary": "Zap a widget",
+        "description": "A task is created to zap the widget for `duration` seconds.",
+        "value": {
+            "duration": 10,
+        },
+    },
+}
+_CREATE_BODY = Body(openapi_examples=_CREATE_EXAMPLES)
+_ZAP_BODY = Body(openapi_examples=_ZAP_EXAMPLES)
+
+
+# NOTE: upstream API clients live for the whole process, so the repository that
+#   wraps each one is created once and reused by every request; a plain dict is
+#   enough, since entries never need to be released
+_widget_api_repositories: dict[Any, WidgetApiRepository] = {}
+
+
+def _get_widget_api_repository(api_client: Any) -> WidgetApiRepository:
+    """
+    Return the WidgetApiRepository for an upstream API client, creating it once.
+
+    Args:
+        api_client: The upstream API client for widgets.
+
+    Returns:
+        WidgetApiRepository: The repository bound to the client.
+    """
+    repository = _widget_api_repositories.get(api_client)
+    if repository is None:
+        repository = WidgetApiRepository(api_client)
+        _widget_api_repositories[api_client] = repository
+
+    return repository
 
-def get_widget_service(
+
+async def get_widget_service(
     api_clients: dict = Depends(get_api_clients),
-    acls: list[SectionACL] = Depends(get_acls),
-    settings: AppSettings = Depends(get_settings),
-    cache: AppCacheBase = Depends(get_cache),
+    ctx: RequestContext = Depends(get_request_context),
 ) -> WidgetApiService:
     """
     Dependency function to provide a WidgetApiService instance.
 
     Args:
         api_clients: Service-to-service and upstream API clients.
-        acls: List of ACLs associated with authenticated client/apikey.
-        settings: The application's AppSettings object.
-        cache: An implementation of AppCacheBase, used for getting/setting cache data.
+        ctx: The ACLs, settings and cache for the current request.
 
     Returns:
         WidgetApiService: An instance of the widget service.
     """
-    widget_api_repository = WidgetApiRepository(api_clients["widgets"])
+    widget_api_repository = _get_widget_api_repository(api_clients["widgets"])
 
     return WidgetApiService(
         widget_api_repository,
-        acls,
-        settings,
-        cache,
+        ctx.acls,
+        ctx.settings,
+        ctx.cache,
     )
 
 
+WidgetApiServiceDep = Annotated[WidgetApiService, Depends(get_widget_service)]
+
+
 @widgets_api_router.post(
     path="",
-    response_model=WidgetRead,
+    response_model=None,
+    responses={201: {"model": WidgetRead}},
     status_code=status.HTTP_201_CREATED,
     summary="Create an API widget",
     description="Create an API widget",  # Override the docstring in Swagger UI
 )
 async def widget_api_create(
-    widget: Annotated[
-        WidgetCreate,
-        Body(
-            openapi_examples={
-                "normal": {
-                    "summary": "Create a widget",
-                    "description": (
-                        "A **normal** widget that is created successfully."
-                    ),
-                    "value": {
-                        "name": "widget-432",
-                        "height": "30cm",
-                        "mass": "1.2kg",
-                        "force": 1,
-                    },
-                },
-            },
-        ),
-    ],
-    widget_service: WidgetApiService = Depends(get_widget_service),
+    widget: Annotated[WidgetCreate, _CREATE_BODY],
+    widget_service: WidgetApiServiceDep,
 ) -> WidgetRead:
     """
     Create a new widget.
@@ -104,41 +134,50 @@ async def widget_api_create(
     Returns:
         WidgetRead: The created widget data.
     """
-    logger.info(f"Attempting to create a widget: {widget}")
+    logger.info("Attempting to create a widget: %s", widget)
     return await widget_service.widget_create(widget)
 
 
 @widgets_api_router.get(
     "/{widget_id}",
-    response_model=WidgetRead,
+    # NOTE: the service already returns a validated WidgetRead, so FastAPI does
+    #   not validate it again; responses= keeps the OpenAPI schema accurate
+    response_model=None,
+    responses={
+        200: {"model": WidgetRead},
+        304: {"description": "Widget has not changed since the given ETag"},
+    },
     status_code=status.HTTP_200_OK,
     summary="View (read) an API widget",
     description="View (read) an API widget",  # Override the docstring in Swagger UI
 )
 async def widget_api_get_by_id(
+    request: Request,
     widget_id: Annotated[
         int,
-        Path(
-            description="The ID of the widget to retrieve.",
-            gt=0,
-        ),
+        Path(description="The ID of the widget to retrieve.", gt=0),
     ],
-    widget_service: WidgetApiService = Depends(get_widget_service),
-) -> WidgetRead:
+    widget_service: WidgetApiServiceDep,
+) -> Response:
     """
     Retrieve a widget by its ID.
 
     Upstream API exceptions (UpstreamApiException) should be caught by exception
-    handlers that are registered during app startup.
+    handlers that are registered during app startup. The response carries an ETag;
+    clients that send it back in If-None-Match get an empty 304 response while the
+    widget is unchanged.
 
     Args:
+        request: The incoming request.
         widget_id: The ID of the widget to retrieve.
         widget_service: The widget service instance.
 
     Returns:
-        WidgetRead: The retrieved widget data.
+        Response: The retrieved widget data, or 304 Not Modified.
     """
-    return await widget_service.widget_get_by_id(widget_id)
+    widget = await widget_service.widget_get_by_id(widget_id)
+
+    return etag_json_response(request, widget)
 
 
 @widgets_api_router.get(
@@ -153,6 +192,7 @@ async def widget_api_zap_list(
         int,
         Path(description="The ID of the widget.", gt=0),
     ],
+    widget_service: WidgetApiServiceDep,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=5000, description="Items per page")] = 10,
     sort_by: Annotated[str, Query(description="Field to sort by")] = "created_at",
@@ -160,7 +200,6 @@ async def widget_api_zap_list(
         str, Query(pattern="^(asc|desc)$", description="Sort direction")
     ] = "desc",
     search: Annotated[str | None, Query(description="Search filter")] = None,
-    widget_service: WidgetApiService = Depends(get_widget_service),
 ) -> JSONResponse:
     """
     Retrieve zap task history for an upstream API widget with pagination.
@@ -170,17 +209,17 @@ async def widget_api_zap_list(
 
     Args:
         widget_id: The ID of the widget.
+        widget_service: The widget service instance.
         page: The page number (1-indexed).
         page_size: The number of items per page.
         sort_by: The field to sort by.
         sort_order: The sort direction ('asc' or 'desc').
         search: Optional search filter.
-        widget_service: The widget service instance.
 
     Returns:
         JSONResponse: A JSON list of zap task history records with X-Total-Count header.
     """
-    logger.info(f"Listing zap task history for API widget {widget_id}")
+    logger.info("Listing zap task history for API widget %s", widget_id)
     tasks, total = await widget_service.widget_zap_history(
         widget_id=widget_id,
         page=page,
@@ -189,16 +228,16 @@ async def widget_api_zap_list(
         sort_order=sort_order,
         search=search,
     )
-    content = [t.model_dump(mode="json") for t in tasks]
-    return JSONResponse(
-        content=content,
+    return PydanticJSONResponse(
+        content=tasks,
         headers={"X-Total-Count": str(total)},
     )
 
 
 @widgets_api_router.post(
     "/{widget_id}/zap",
-    response_model=WidgetZapTask,
+    response_model=None,
+    responses={202: {"model": WidgetZapTask}},
     # TODO: add custom response which includes Location header!
     status_code=status.HTTP_202_ACCEPTED,
     summary="Zap an API widget",
@@ -207,28 +246,10 @@ async def widget_api_zap_list(
 async def widget_api_zap(
     widget_id: Annotated[
         int,
-        Path(
-            description="The ID of the widget to zap.",
-            gt=0,
-        ),
-    ],
-    payload: Annotated[
-        WidgetZap,
-        Body(
-            openapi_examples={
-                "normal": {
-                    "summary": "Zap a widget",
-                    "description": (
-                        "A task is created to zap the widget for `duration` seconds."
-                    ),
-                    "value": {
-                        "duration": 10,
-                    },
-                },
-            },
-        ),
+        Path(description="The ID of the widget to zap.", gt=0),
     ],
-    widget_service: WidgetApiService = Depends(get_widget_service),
+    payload: Annotated[WidgetZap, _ZAP_BODY],
+    widget_service: WidgetApiServiceDep,
 ) -> WidgetZapTask:
     """
     Zaps an existing widget.
@@ -244,14 +265,17 @@ async def widget_api_zap(
     Returns:
         WidgetZapTask: Information about the new task that was created.
     """
-    logger.info(f"Attempting to zap widget {widget_id}: {payload}")
+    logger.info("Attempting to zap widget %s: %s", widget_id, payload)
 
     return await widget_service.widget_zap(widget_id, payload)
 
 
 @widgets_api_router.get(
     "/{widget_id}/zap/{task_uuid}/status",
-    response_model=WidgetZapTask,
+    # NOTE: the service already returns a validated WidgetZapTask, so FastAPI does
+    #   not validate it again; responses= keeps the OpenAPI schema accurate
+    response_model=None,
+    responses={200: {"model": WidgetZapTask}},
     status_code=status.HTTP_200_OK,
     summary="View async API task status",
     description="View async API task status",  # Override the docstring in Swagger UI
@@ -268,7 +292,7 @@ async def widget_api_zap_get_task(
         str,
         Path(description="The UUID of the async zap task."),
     ],
-    widget_service: WidgetApiService = Depends(get_widget_service),
+    widget_service: WidgetApiServiceDep,
 ) -> WidgetZapTask:
     """
     Retrieve a zap widget task by its UUID.
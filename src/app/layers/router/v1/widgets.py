@@ -8,17 +8,14 @@ import logging
 from typing import Annotated, Optional
 
 from aiokafka import AIOKafkaProducer
-from fastapi import APIRouter, Body, Depends, Path, Query, status
+from fastapi import APIRouter, Body, Depends, Path, Query, Request, Response, status
 from fastapi.responses import JSONResponse
-from nmtfast.cache.v1.base import AppCacheBase
-from nmtfast.settings.v1.schemas import SectionACL
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.v1.settings import AppSettings
-from app.dependencies.v1.auth import authenticate_headers, get_acls
-from app.dependencies.v1.cache import get_cache
+from app.core.v1.responses import PydanticJSONResponse, etag_json_response
+from app.dependencies.v1.auth import authenticate_headers
+from app.dependencies.v1.context import RequestContext, get_request_context
 from app.dependencies.v1.kafka import get_kafka_producer
-from app.dependencies.v1.settings import get_settings
 from app.dependencies.v1.sqlalchemy import get_sql_db
 from app.layers.repository.v1.widgets import WidgetRepository
 from app.layers.service.v1.widgets import WidgetService
@@ -36,14 +33,13 @@ widgets_router = APIRouter(
     prefix="/v1/widgets",
     tags=["Widget Operations (SQLAlchemy)"],
     dependencies=[Depends(authenticate_headers)],
+    default_response_class=PydanticJSONResponse,
 )
 
 
-def get_widget_service(
+async def get_widget_service(
     db: AsyncSession = Depends(get_sql_db),
-    acls: list[SectionACL] = Depends(get_acls),
-    settings: AppSettings = Depends(get_settings),
-    cache: AppCacheBase = Depends(get_cache),
+    ctx: RequestContext = Depends(get_request_context),
     kafka: Optional[AIOKafkaProducer] = Depends(get_kafka_producer),
 ) -> WidgetService:
     """
@@ -51,9 +47,7 @@ def get_widget_service(
 
     Args:
         db: The asynchronous database session.
-        acls: List of ACLs associated with authenticated client/apikey.
-        settings: The application's AppSettings object.
-        cache: An implementation of AppCacheBase, used for getting/setting cache data.
+        ctx: The ACLs, settings and cache for the current request.
         kafka: Optional Kafka producer, if enabled in configuration.
 
     Returns:
@@ -61,12 +55,16 @@ def get_widget_service(
     """
     widget_repository = WidgetRepository(db)
 
-    return WidgetService(widget_repository, acls, settings, cache, kafka)
+    return WidgetService(widget_repository, ctx.acls, ctx.settings, ctx.cache, kafka)
+
+
+WidgetServiceDep = Annotated[WidgetService, Depends(get_widget_service)]
 
 
 @widgets_router.post(
     path="",
-    response_model=WidgetRead,
+    response_model=None,
+    responses={201: {"model": WidgetRead}},
     status_code=status.HTTP_201_CREATED,
     summary="Create a widget",
     description="Create a widget",  # Override the docstring in Swagger UI
@@ -92,7 +90,7 @@ async def widget_create(
             },
         ),
     ],
-    widget_service: WidgetService = Depends(get_widget_service),
+    widget_service: WidgetServiceDep,
 ) -> WidgetRead:
     """
     Create a new widget.
@@ -104,7 +102,7 @@ async def widget_create(
     Returns:
         WidgetRead: The created widget data.
     """
-    logger.info(f"Attempting to create a widget: {widget}")
+    logger.info("Attempting to create a widget: %s", widget)
     return await widget_service.widget_create(widget)
 
 
@@ -117,6 +115,7 @@ async def widget_create(
     operation_id="list_widgets",
 )
 async def widget_list(
+    widget_service: WidgetServiceDep,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=5000, description="Items per page")] = 10,
     sort_by: Annotated[str, Query(description="Field to sort by")] = "id",
@@ -124,18 +123,17 @@ async def widget_list(
         str, Query(pattern="^(asc|desc)$", description="Sort direction")
     ] = "asc",
     search: Annotated[str | None, Query(description="Search filter")] = None,
-    widget_service: WidgetService = Depends(get_widget_service),
 ) -> JSONResponse:
     """
     List all widgets with pagination and sorting.
 
     Args:
+        widget_service: The widget service instance.
         page: The page number (1-indexed).
         page_size: The number of items per page.
         sort_by: The field to sort by.
         sort_order: The sort direction ('asc' or 'desc').
         search: Optional search filter string.
-        widget_service: The widget service instance.
 
     Returns:
         JSONResponse: A JSON list of widgets with X-Total-Count header.
@@ -148,22 +146,28 @@ async def widget_list(
         sort_order=sort_order,
         search=search,
     )
-    content = [w.model_dump(mode="json") for w in widgets]
-    return JSONResponse(
-        content=content,
+    return PydanticJSONResponse(
+        content=widgets,
         headers={"X-Total-Count": str(total)},
     )
 
 
 @widgets_router.get(
     "/{widget_id}",
-    response_model=WidgetRead,
+    # NOTE: the service already returns a validated WidgetRead, so FastAPI does
+    #   not validate it again; responses= keeps the OpenAPI schema accurate
+    response_model=None,
+    responses={
+        200: {"model": WidgetRead},
+        304: {"description": "Widget has not changed since the given ETag"},
+    },
     status_code=status.HTTP_200_OK,
     summary="View (read) a widget",
     description="View (read) a widget",  # Override the docstring in Swagger UI
     operation_id="get_widget",  # Custom operation ID for MCP
 )
 async def widget_get_by_id(
+    request: Request,
     widget_id: Annotated[
         int,
         Path(
@@ -171,25 +175,32 @@ async def widget_get_by_id(
             gt=0,
         ),
     ],
-    widget_service: WidgetService = Depends(get_widget_service),
-) -> WidgetRead:
+    widget_service: WidgetServiceDep,
+) -> Response:
     """
     Retrieve a widget by its ID.
 
+    The response carries an ETag; clients that send it back in If-None-Match get
+    an empty 304 response while the widget is unchanged.
+
     Args:
+        request: The incoming request.
         widget_id: The ID of the widget to retrieve.
         widget_service: The widget service instance.
 
     Returns:
-        WidgetRead: The retrieved widget data.
+        Response: The retrieved widget data, or 304 Not Modified.
     """
-    logger.info(f"Attempting to find widget {widget_id}")
-    return await widget_service.widget_get_by_id(widget_id)
+    logger.info("Attempting to find widget %s", widget_id)
+    widget = await widget_service.widget_get_by_id(widget_id)
+
+    return etag_json_response(request, widget)
 
 
 @widgets_router.patch(
     "/{widget_id}",
-    response_model=WidgetRead,
+    response_model=None,
+    responses={200: {"model": WidgetRead}},
     status_code=status.HTTP_200_OK,
     summary="Update a widget",
     description="Update a widget",
@@ -218,7 +229,7 @@ async def widget_update(
             },
         ),
     ],
-    widget_service: WidgetService = Depends(get_widget_service),
+    widget_service: WidgetServiceDep,
 ) -> WidgetRead:
     """
     Update an existing widget.
@@ -231,7 +242,7 @@ async def widget_update(
     Returns:
         WidgetRead: The updated widget data.
     """
-    logger.info(f"Attempting to update widget {widget_id}: {widget}")
+    logger.info("Attempting to update widget %s: %s", widget_id, widget)
     return await widget_service.widget_update(widget_id, widget)
 
 
@@ -250,7 +261,7 @@ async def widget_delete(
             gt=0,
         ),
     ],
-    widget_service: WidgetService = Depends(get_widget_service),
+    widget_service: WidgetServiceDep,
 ) -> None:
     """
     Delete a widget by its ID.
@@ -259,7 +270,7 @@ async def widget_delete(
         widget_id: The ID of the widget to delete.
         widget_service: The widget service instance.
     """
-    logger.info(f"Attempting to delete widget {widget_id}")
+    logger.info("Attempting to delete widget %s", widget_id)
     await widget_service.widget_delete(widget_id)
 
 
@@ -272,7 +283,7 @@ async def widget_delete(
 )
 async def widget_bulk_delete(
     ids: Annotated[list[int], Body(embed=False)],
-    widget_service: WidgetService = Depends(get_widget_service),
+    widget_service: WidgetServiceDep,
 ) -> dict[str, int]:
     """
     Delete multiple widgets by their IDs.
@@ -284,7 +295,7 @@ async def widget_bulk_delete(
     Returns:
         dict[str, int]: The number of widgets deleted.
     """
-    logger.info(f"Attempting to bulk delete widgets: {ids}")
+    logger.info("Attempting to bulk delete widgets: %s", ids)
     deleted = await widget_service.widget_bulk_delete(ids)
 
     return {"deleted": deleted}
@@ -299,7 +310,7 @@ async def widget_bulk_delete(
 )
 async def widget_bulk_update(
     payload: Annotated[WidgetBulkUpdate, Body()],
-    widget_service: WidgetService = Depends(get_widget_service),
+    widget_service: WidgetServiceDep,
 ) -> dict[str, int]:
     """
     Update multiple widgets by their IDs.
@@ -311,7 +322,9 @@ async def widget_bulk_update(
     Returns:
         dict[str, int]: The number of widgets updated.
     """
-    logger.info(f"Attempting to bulk update widgets {payload.ids}: {payload.updates}")
+    logger.info(
+        "Attempting to bulk update widgets %s: %s", payload.ids, payload.updates
+    )
     updated = await widget_service.widget_bulk_update(payload.ids, payload.updates)
 
     return {"updated": updated}
@@ -329,6 +342,7 @@ async def widget_zap_list(
         int,
         Path(description="The ID of the widget.", gt=0),
     ],
+    widget_service: WidgetServiceDep,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=5000, description="Items per page")] = 10,
     sort_by: Annotated[str, Query(description="Field to sort by")] = "created_at",
@@ -336,24 +350,23 @@ async def widget_zap_list(
         str, Query(pattern="^(asc|desc)$", description="Sort direction")
     ] = "desc",
     search: Annotated[str | None, Query(description="Search filter")] = None,
-    widget_service: WidgetService = Depends(get_widget_service),
 ) -> JSONResponse:
     """
     Retrieve zap task history for a widget with pagination.
 
     Args:
         widget_id: The ID of the widget.
+        widget_service: The widget service instance.
         page: The page number (1-indexed).
         page_size: The number of items per page.
         sort_by: The field to sort by.
         sort_order: The sort direction ('asc' or 'desc').
         search: Optional search filter.
-        widget_service: The widget service instance.
 
     Returns:
         JSONResponse: A JSON list of zap task history records with X-Total-Count header.
     """
-    logger.info(f"Listing zap task history for widget {widget_id}")
+    logger.info("Listing zap task history for widget %s", widget_id)
     tasks, total = await widget_service.widget_zap_history(
         widget_id=widget_id,
         page=page,
@@ -362,16 +375,16 @@ async def widget_zap_list(
         sort_order=sort_order,
         search=search,
     )
-    content = [t.model_dump(mode="json") for t in tasks]
-    return JSONResponse(
-        content=content,
+    return PydanticJSONResponse(
+        content=tasks,
         headers={"X-Total-Count": str(total)},
     )
 
 
 @widgets_router.post(
     "/{widget_id}/zap",
-    response_model=WidgetZapTask,
+    response_model=None,
+    responses={202: {"model": WidgetZapTask}},
     # TODO: add custom response which includes Location header!
     status_code=status.HTTP_202_ACCEPTED,
     summary="Zap a widget",
@@ -402,11 +415,14 @@ async def widget_zap(
             },
         ),
     ],
-    widget_service: WidgetService = Depends(get_widget_service),
+    widget_service: WidgetServiceDep,
 ) -> WidgetZapTask:
     """
     Zaps an existing widget.
 
+    The 202 response is returned once the task is scheduled and recorded; the zap
+    itself runs in the background, so callers should poll the task status.
+
     Args:
         widget_id: The ID of the widget to zap.
         payload: The widget task parameters.
@@ -415,13 +431,16 @@ async def widget_zap(
     Returns:
         WidgetZapTask: Information about the new task that was created.
     """
-    logger.info(f"Attempting to zap widget {widget_id}: {payload}")
+    logger.info("Attempting to zap widget %s: %s", widget_id, payload)
     return await widget_service.widget_zap(widget_id, payload)
 
 
 @widgets_router.get(
     "/{widget_id}/zap/{task_uuid}/status",
-    response_model=WidgetZapTask,
+    # NOTE: the service already returns a validated WidgetZapTask, so FastAPI does
+    #   not validate it again; responses= keeps the OpenAPI schema accurate
+    response_model=None,
+    responses={200: {"model": WidgetZapTask}},
     status_code=status.HTTP_200_OK,
     summary="View async task status",
     description="View async task status",  # Override the docstring in Swagger UI
@@ -441,7 +460,7 @@ async def widget_zap_get_task(
             description="The UUID of the async zap task.",
         ),
     ],
-    widget_service: WidgetService = Depends(get_widget_service),
+    widget_service: WidgetServiceDep,
 ) -> WidgetZapTask:
     """
     Retrieve a zap widget task by its UUID.
@@ -454,5 +473,5 @@ async def widget_zap_get_task(
     Returns:
         WidgetZapTask: The retrieved widget task data.
     """
-    logger.info(f"Attempting to find zap status for task {task_uuid}")
+    logger.info("Attempting to find zap status for task %s", task_uuid)
     return await widget_service.widget_zap_by_uuid(widget_id, task_uuid)
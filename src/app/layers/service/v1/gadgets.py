@@ -4,19 +4,16 @@
 
 """Business logic for gadget resources."""
 
+import asyncio
 import logging
 
 from nmtfast.auth.v1.acl import check_acl
 from nmtfast.cache.v1.base import AppCacheBase
 from nmtfast.middleware.v1.request_id import REQUEST_ID_CONTEXTVAR
-from nmtfast.tasks.v1.huey import (
-    fetch_task_metadata,
-    fetch_task_result,
-    store_task_metadata,
-)
+from nmtfast.tasks.v1.huey import store_task_metadata
 
 from app.core.v1.settings import AppSettings
-from app.core.v1.tasks import huey_app
+from app.core.v1.tasks import fetch_task_state, huey_app
 from app.errors.v1.exceptions import ResourceNotFoundError
 from app.layers.repository.v1.gadgets import GadgetRepository
 from app.schemas.dto.v1.gadgets import (
@@ -54,17 +51,27 @@ class GadgetService:
         self.acls = acls
         self.settings = settings
         self.cache = cache
+        # NOTE: permissions that check_acl has already allowed; services are built
+        #   per request for one client, so self.acls cannot change under this cache
+        self._acl_cache: dict[str, bool] = {}
 
     async def _is_authz(self, acls: list, permission: str) -> None:
         """
         Check if the ACLs allow access to the given resource.
 
+        Only allowed permissions are remembered, so a denied permission is checked
+        (and raises) every time.
+
         Args:
             acls: List of ACLs associated with this client
             permission: Required in order to complete the requested operation.
         """
+        if self._acl_cache.get(permission):
+            return
+
         # NOTE: by default, check_acl now raises AuthorizationError on failure
         await check_acl("gadgets", acls, permission)
+        self._acl_cache[permission] = True
 
     async def gadget_create(self, input_gadget: GadgetCreate) -> GadgetRead:
         """
@@ -214,7 +221,10 @@ class GadgetService:
             gadget_id=gadget_id,
             duration=payload.duration,
         )
-        huey_task = gadget_zap_task.schedule(args=[params], delay=0)
+        # NOTE: enqueueing is a blocking call to the Huey storage backend
+        huey_task = await asyncio.to_thread(
+            gadget_zap_task.schedule, args=[params], delay=0
+        )
 
         await self.gadget_repository.zap_task_create(
             gadget_id=gadget_id,
@@ -237,9 +247,11 @@ class GadgetService:
             runtime=0,
             result=None,
         )
-        store_task_metadata(huey_app, huey_task.id, task_md.model_dump())
+        await asyncio.to_thread(
+            store_task_metadata, huey_app, huey_task.id, task_md.model_dump()
+        )
 
-        logger.info(f"Zap task {huey_task.id} scheduled for gadget {gadget_id}")
+        logger.info("Zap task %s scheduled for gadget %s", huey_task.id, gadget_id)
         return task_md
 
     async def gadget_zap_history(
@@ -305,17 +317,21 @@ class GadgetService:
         """
         await self._is_authz(self.acls, "read")
 
-        db_gadget = await self.gadget_repository.get_by_id(gadget_id)
-        logger.debug(f"Fetching zap status for gadget ID {db_gadget.id}")
-
+        logger.debug("Fetching zap status for gadget ID %s", gadget_id)
         db_task = await self.gadget_repository.get_zap_task_by_uuid(
             gadget_id=gadget_id,
             task_uuid=task_uuid,
         )
 
-        if db_task is not None and db_task.get("state") in ("SUCCESS", "FAILED"):
+        if db_task is None:
+            # NOTE: the task record lookup is scoped to the gadget, so the gadget
+            #   only has to be looked up (to report it missing) without a record
+            await self.gadget_repository.get_by_id(gadget_id)
+        elif db_task.get("state") in ("SUCCESS", "FAILED"):
             logger.debug(
-                f"Found completed zap task in DB for {task_uuid}: {db_task['state']}"
+                "Found completed zap task in DB for %s: %s",
+                task_uuid,
+                db_task["state"],
             )
             return GadgetZapTask(
                 uuid=db_task["task_uuid"],
@@ -326,13 +342,9 @@ class GadgetService:
                 result=db_task.get("result"),
             )
 
-        task_result = None
-        task_error: Exception | None = None
-        try:
-            task_result = fetch_task_result(huey_app, task_uuid)
-        except Exception as exc:
-            task_error = exc
-
+        task_result, task_error, task_md_raw = await asyncio.to_thread(
+            fetch_task_state, task_uuid
+        )
         if task_result:
             task_md = GadgetZapTask.model_validate(task_result)
             return task_md
@@ -348,9 +360,8 @@ class GadgetService:
                 pass
             raise task_error
 
-        task_md_raw = fetch_task_metadata(huey_app, task_uuid)
         if task_md_raw is None:
-            logger.debug(f"Task metadata not found for {task_uuid}")
+            logger.debug("Task metadata not found for %s", task_uuid)
             raise ResourceNotFoundError(task_uuid, "Task")
         task_md = GadgetZapTask(**task_md_raw)
 
@@ -4,17 +4,39 @@
 
 """Business logic to check health of service dependencies."""
 
-import json
+import asyncio
 import logging
+from collections.abc import Collection
 
 from nmtfast.cache.v1.base import AppCacheBase
-from sqlalchemy import text
 
 from app.core.v1.settings import AppSettings
 from app.layers.repository.v1.widgets import WidgetRepository
 
 logger = logging.getLogger(__name__)
 
+# NOTE: the cache health sentinel is the JSON string "HEALTHY"; it is compared as
+#   raw bytes instead of being encoded/decoded on every check
+_CACHE_HEALTHY = '"HEALTHY"'
+_CACHE_HEALTHY_BYTES = _CACHE_HEALTHY.encode("utf-8")
+_CHECK_NAMES = ("basic", "database", "cache")  # in reporting order
+
+
+def _selected_checks(checks: Collection[str]) -> list[str]:
+    """
+    Return the known checks that were requested, in reporting order.
+
+    Args:
+        checks: The names of the checks to perform.
+
+    Returns:
+        list[str]: The names of the checks to run.
+    """
+    if not isinstance(checks, (set, frozenset)):
+        checks = frozenset(checks)
+
+    return [name for name in _CHECK_NAMES if name in checks]
+
 
 class AppHealthService:
     """
@@ -47,7 +69,10 @@ class AppHealthService:
             Exception: Raises an exception if unable to communicate with DB.
         """
         try:
-            await self.widget_repository.db.execute(text("SELECT 1"))
+            # NOTE: the probe is sent as-is to the DBAPI driver, skipping the
+            #   statement compilation that a text() construct goes through
+            connection = await self.widget_repository.db.connection()
+            await connection.exec_driver_sql("SELECT 1")
             logger.debug("Database health check passed")
         except Exception:
             logger.critical("Database health check failed!", exc_info=True)
@@ -65,48 +90,76 @@ class AppHealthService:
             Exception: Raises an exception if unable to communicate with cache.
         """
         try:
-            self.cache.store_app_cache("app_cache_health", json.dumps("HEALTHY"))
-            if raw_value := self.cache.fetch_app_cache("app_cache_health"):
-                cache_str = json.loads(raw_value.decode("utf-8"))
-                if cache_str != "HEALTHY":
-                    raise Exception(f"Cache health check failed! Result: {cache_str}")
+            self.cache.store_app_cache("app_cache_health", _CACHE_HEALTHY)
+            raw_value = self.cache.fetch_app_cache("app_cache_health")
+            if raw_value and raw_value != _CACHE_HEALTHY_BYTES:
+                raise Exception(f"Cache health check failed! Result: {raw_value!r}")
             logger.debug("Cache health check passed")
         except Exception:
             logger.critical("Cache health check failed!", exc_info=True)
             raise
         return True
 
-    async def check_health(self, checks: list[str] = ["basic"]) -> bool:
+    async def _check_basic(self) -> bool:
         """
-        Check if app is ready.
+        Check if the app itself is alive.
+
+        Returns:
+            bool: Always True, since the app is able to respond.
+        """
+        return True
+
+    async def _run_check(self, name: str) -> tuple[str, bool]:
+        """
+        Run a single named health check, converting failures to False.
 
         Args:
-            checks: A list of checks to perform.
+            name: The name of the check to run.
 
         Returns:
-            bool: Whether the readiness check(s) passed or not.
+            tuple[str, bool]: The name of the check, and whether it passed or not.
         """
-        results: dict[str, bool] = {}
+        known_checks = {
+            "basic": self._check_basic,
+            "database": self._check_database,
+            "cache": self._check_cache,
+        }
+        try:
+            return name, await known_checks[name]()
+        except Exception:
+            logger.critical("%s health check failed!", name.title(), exc_info=True)
+            return name, False
+
+    async def check_health_results(
+        self, checks: Collection[str] = frozenset({"basic"})
+    ) -> dict[str, bool]:
+        """
+        Run health checks concurrently and report the result of each one.
 
-        if "basic" in checks:
-            results["basic"] = True
+        Checks are awaited together with asyncio.gather(), so the overall latency
+        is that of the slowest check rather than the sum of all of them.
 
-        if "database" in checks:
-            try:
-                results["database"] = await self._check_database()
-            except Exception:
-                logger.critical("Database health check failed!", exc_info=True)
-                results["database"] = False
+        Args:
+            checks: The names of the checks to perform.
 
-        if "cache" in checks:
-            try:
-                results["cache"] = await self._check_cache()
-            except Exception:
-                logger.critical("Cache health check failed!", exc_info=True)
-                results["cache"] = False
+        Returns:
+            dict[str, bool]: Whether each requested check passed or not.
+        """
+        names = _selected_checks(checks)
+        outcomes = await asyncio.gather(*(self._run_check(name) for name in names))
 
-        for value in results.values():
-            if value is False:
-                return False
+        return dict(outcomes)
 
-        return True
+    async def check_health(
+        self, checks: Collection[str] = frozenset({"basic"})
+    ) -> bool:
+        """
+        Check if app is ready.
+
+        Args:
+            checks: The names of the checks to perform.
+
+        Returns:
+            bool: Whether the readiness check(s) passed or not.
+        """
+        return all((await self.check_health_results(checks)).values())
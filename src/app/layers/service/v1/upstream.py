@@ -46,17 +46,27 @@ class WidgetApiService:
         self.acls = acls
         self.settings = settings
         self.cache = cache
+        # NOTE: permissions that check_acl has already allowed; services are built
+        #   per request for one client, so self.acls cannot change under this cache
+        self._acl_cache: dict[str, bool] = {}
 
     async def _is_authz(self, acls: list, permission: str) -> None:
         """
         Check if the ACLs allow access to the given resource.
 
+        Only allowed permissions are remembered, so a denied permission is checked
+        (and raises) every time.
+
         Args:
             acls: List of ACLs associated with this client
             permission: Required in order to complete the requested operation.
         """
+        if self._acl_cache.get(permission):
+            return
+
         # NOTE: by default, check_acl now raises AuthorizationError on failure
         await check_acl("widgets", acls, permission)
+        self._acl_cache[permission] = True
 
     async def widget_create(self, input_widget: WidgetCreate) -> WidgetRead:
         """
@@ -4,6 +4,7 @@
 
 """Business logic for widget resources."""
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -11,14 +12,10 @@ from aiokafka import AIOKafkaProducer
 from nmtfast.auth.v1.acl import check_acl
 from nmtfast.cache.v1.base import AppCacheBase
 from nmtfast.middleware.v1.request_id import REQUEST_ID_CONTEXTVAR
-from nmtfast.tasks.v1.huey import (
-    fetch_task_metadata,
-    fetch_task_result,
-    store_task_metadata,
-)
+from nmtfast.tasks.v1.huey import store_task_metadata
 
 from app.core.v1.settings import AppSettings
-from app.core.v1.tasks import huey_app
+from app.core.v1.tasks import fetch_task_state, huey_app
 from app.errors.v1.exceptions import ResourceNotFoundError
 from app.layers.repository.v1.widgets import WidgetRepository
 from app.schemas.dto.v1.widgets import (
@@ -58,18 +55,31 @@ class WidgetService:
         self.acls = acls
         self.settings = settings
         self.cache = cache
+        # NOTE: permissions that check_acl has already allowed; services are built
+        #   per request for one client, so self.acls cannot change under this cache
+        self._acl_cache: dict[str, bool] = {}
         self.kafka = kafka
+        # NOTE: settings are fixed for the life of the service, so values read on
+        #   the request path are copied to plain attributes once
+        self._kafka_enabled: bool = settings.kafka.enabled
 
     async def _is_authz(self, acls: list, permission: str) -> None:
         """
         Check if the ACLs allow access to the given resource.
 
+        Only allowed permissions are remembered, so a denied permission is checked
+        (and raises) every time.
+
         Args:
             acls: List of ACLs associated with this client
             permission: Required in order to complete the requested operation.
         """
+        if self._acl_cache.get(permission):
+            return
+
         # NOTE: by default, check_acl now raises AuthorizationError on failure
         await check_acl("widgets", acls, permission)
+        self._acl_cache[permission] = True
 
     async def widget_create(self, input_widget: WidgetCreate) -> WidgetRead:
         """
@@ -83,17 +93,18 @@ class WidgetService:
         """
         await self._is_authz(self.acls, "create")
         db_widget = await self.widget_repository.widget_create(input_widget)
+        widget = WidgetRead.model_validate(db_widget)
 
         # NOTE: this is a demonstration of publishing Kafka messages
-        if self.settings.kafka.enabled:
+        if self._kafka_enabled:
             assert isinstance(self.kafka, AIOKafkaProducer)
             await self.kafka.send(
                 topic="nmtfast-widgets",
                 key="create-widget",
-                value=WidgetRead.model_validate(db_widget),
+                value=widget,
             )
 
-        return WidgetRead.model_validate(db_widget)
+        return widget
 
     async def widget_get_by_id(self, widget_id: int) -> WidgetRead:
         """
@@ -205,6 +216,31 @@ class WidgetService:
 
         return await self.widget_repository.bulk_update(ids, data)
 
+    async def _record_zap_task(
+        self,
+        widget_id: int,
+        task_uuid: str,
+        duration: int,
+    ) -> None:
+        """
+        Record a new zap task, and mark it as the widget's last task.
+
+        Args:
+            widget_id: The ID of the widget.
+            task_uuid: The UUID of the Huey task.
+            duration: The task duration in seconds.
+        """
+        await self.widget_repository.zap_task_create(
+            widget_id=widget_id,
+            task_uuid=task_uuid,
+            duration=duration,
+        )
+        await self.widget_repository.update_last_task(
+            widget_id=widget_id,
+            task_uuid=task_uuid,
+            status="PENDING",
+        )
+
     async def widget_zap(self, widget_id: int, payload: WidgetZap) -> WidgetZapTask:
         """
         Zap an existing widget by initiating an async task.
@@ -225,18 +261,9 @@ class WidgetService:
             widget_id=widget_id,
             duration=payload.duration,
         )
-        huey_task = widget_zap_task.schedule(args=[params], delay=0)
-
-        await self.widget_repository.zap_task_create(
-            widget_id=widget_id,
-            task_uuid=huey_task.id,
-            duration=payload.duration,
-        )
-
-        await self.widget_repository.update_last_task(
-            widget_id=widget_id,
-            task_uuid=huey_task.id,
-            status="PENDING",
+        # NOTE: enqueueing is a blocking call to the Huey storage backend
+        huey_task = await asyncio.to_thread(
+            widget_zap_task.schedule, args=[params], delay=0
         )
 
         task_md = WidgetZapTask(
@@ -247,9 +274,19 @@ class WidgetService:
             runtime=0,
             result=None,
         )
-        store_task_metadata(huey_app, huey_task.id, task_md.model_dump())
 
-        logger.info(f"Zap task {huey_task.id} scheduled for widget {widget_id}")
+        # NOTE: the DB writes share one session and must run in order, but the
+        #   (blocking) task metadata write to the Huey backend is independent, so
+        #   it runs in a worker thread while the DB writes are awaited; gather()
+        #   is used so errors such as ResourceNotFoundError propagate unwrapped
+        await asyncio.gather(
+            asyncio.to_thread(
+                store_task_metadata, huey_app, huey_task.id, task_md.model_dump()
+            ),
+            self._record_zap_task(widget_id, huey_task.id, payload.duration),
+        )
+
+        logger.info("Zap task %s scheduled for widget %s", huey_task.id, widget_id)
         return task_md
 
     async def widget_zap_history(
@@ -315,17 +352,19 @@ class WidgetService:
         """
         await self._is_authz(self.acls, "read")
 
-        db_widget = await self.widget_repository.get_by_id(widget_id)
-        logger.debug(f"Fetching zap status for widget ID {db_widget.id}")
-
+        logger.debug("Fetching zap status for widget ID %s", widget_id)
         db_task = await self.widget_repository.get_zap_task_by_uuid(
             widget_id=widget_id,
             task_uuid=task_uuid,
         )
 
-        if db_task is not None and db_task.state in ("SUCCESS", "FAILED"):
+        if db_task is None:
+            # NOTE: the task record lookup is scoped to the widget, so the widget
+            #   only has to be looked up (to report it missing) without a record
+            await self.widget_repository.get_by_id(widget_id)
+        elif db_task.state in ("SUCCESS", "FAILED"):
             logger.debug(
-                f"Found completed zap task in DB for {task_uuid}: {db_task.state}"
+                "Found completed zap task in DB for %s: %s", task_uuid, db_task.state
             )
             return WidgetZapTask(
                 uuid=db_task.task_uuid,
@@ -336,13 +375,9 @@ class WidgetService:
                 result=db_task.result,
             )
 
-        task_result = None
-        task_error: Exception | None = None
-        try:
-            task_result = fetch_task_result(huey_app, task_uuid)
-        except Exception as exc:
-            task_error = exc
-
+        task_result, task_error, task_md_raw = await asyncio.to_thread(
+            fetch_task_state, task_uuid
+        )
         if task_result:
             task_md = WidgetZapTask.model_validate(task_result)
             return task_md
@@ -358,9 +393,8 @@ class WidgetService:
                 pass
             raise task_error
 
-        task_md_raw = fetch_task_metadata(huey_app, task_uuid)
         if task_md_raw is None:
-            logger.debug(f"Task metadata not found for {task_uuid}")
+            logger.debug("Task metadata not found for %s", task_uuid)
             raise ResourceNotFoundError(task_uuid, "Task")
         task_md = WidgetZapTask(**task_md_raw)
 
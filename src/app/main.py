@@ -21,10 +21,14 @@ from nmtfast.logging.v1.config import create_logging_config
 from nmtfast.middleware.v1.request_duration import RequestDurationMiddleware
 from nmtfast.middleware.v1.request_id import RequestIDMiddleware
 
-from app.core.v1.health import set_app_not_ready, set_app_ready
+from app.core.v1.health import (
+    LivenessMiddleware,
+    set_app_not_ready,
+    set_app_ready,
+)
 from app.core.v1.kafka import create_kafka_consumers, create_kafka_producer
 from app.core.v1.settings import AppSettings, get_app_settings
-from app.core.v1.sqlalchemy import Base, async_engine
+from app.core.v1.sqlalchemy import Base, async_engine, warm_up_pool
 from app.errors.v1.exception_handlers import (
     authorization_error_handler,
     generic_not_found_error_handler,
@@ -186,6 +190,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await conn.run_sync(Base.metadata.create_all)  # pragma: no cover
         logger.info("Database schema created (only if necessary)")
 
+    # NOTE: warmup is capped at pool_size; overflow connections would be closed
+    #   as soon as they were returned to the pool
+    await warm_up_pool(
+        async_engine,
+        min(settings.sqlalchemy.pool_warmup, settings.sqlalchemy.pool_size),
+    )
+
     logger.info("Starting Kafka consumers/producer (if any)...")
     consumer_tasks = await create_kafka_consumers()
     kafka_producer = await create_kafka_producer()
@@ -257,6 +268,9 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"],
 )
+# NOTE: liveness middleware is added last so it is outermost, and probes skip the
+#   rest of the middleware stack; the /health/liveness route remains as a fallback
+app.add_middleware(LivenessMiddleware)
 
 # load custom OpenAPI schema for description, logo, etc
 object.__setattr__(app, "openapi", custom_openapi(app))
@@ -5,14 +5,17 @@
 """Main entrypoint for FastMCP instance."""
 
 import asyncio
+import json
 import logging
 import os
-from contextlib import AsyncExitStack, asynccontextmanager
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import httpx
 from fastapi import FastAPI
 from fastmcp import FastMCP
+from fastmcp.server.http import StarletteWithLifespan
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.v1.settings import get_app_settings
 from app.main import configure_logging
@@ -21,76 +24,245 @@ logger = logging.getLogger(__name__)
 settings = get_app_settings()
 
 
-@asynccontextmanager
-async def mcp_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+def create_api_client() -> httpx.AsyncClient:
     """
-    Asynchronous context manager for the FastMCP application lifespan.
+    Create the HTTP client used to fetch the OpenAPI spec and proxy MCP tool calls.
+
+    Returns:
+        httpx.AsyncClient: A pooled client for the upstream API.
+    """
+    return httpx.AsyncClient(
+        base_url=settings.mcp.openapi_base_url,
+        headers=settings.mcp.headers,
+        http2=settings.mcp.http2,
+        limits=httpx.Limits(
+            max_keepalive_connections=settings.mcp.max_keepalive_connections
+        ),
+    )
+
+
+async def fetch_openapi_spec(client: httpx.AsyncClient) -> dict:
+    """
+    Fetch the OpenAPI spec, retrying while the API server is still starting.
 
-    This function initializes the FastMCP interface by fetching the OpenAPI spec,
-    creating the FastMCP instance, attaching its ASGI app and lifespan, and mounting
-    it at the configured path. Cleans up resources on shutdown.
+    Only transport errors (e.g. connection refused) are retried; an error status
+    from the server fails immediately.
 
     Args:
-        app: The main FastAPI application instance.
+        client: The HTTP client for the upstream API.
 
-    Yields:
-        None: Used for async context management of the app's lifespan.
+    Returns:
+        dict: The decoded OpenAPI spec.
 
     Raises:
-        Exception: Raised if the OpenAPI spec cannot be fetched for any reason.
+        HTTPStatusError: Raised if the server responds with an error status.
+        TransportError: Raised if the server is still unreachable after
+            max_retries attempts.
     """
-    async with AsyncExitStack() as stack:
-
-        # fetch OpenAPI spec, and retry if the API server takes a few seconds to start
-
-        async with httpx.AsyncClient(base_url=settings.mcp.openapi_base_url) as client:
-            retries = 0
-            openapi_spec: dict | None = None
-
-            while True:
-                try:
-                    resp = await client.get(settings.mcp.openapi_path)
-                    openapi_spec = resp.json()
-                    break
-                except Exception as exc:
-                    retries += 1
-                    logger.error(
-                        f"OpenAPI fetch attempt {retries} for {client.base_url}"
-                        f"{settings.mcp.openapi_path} resulted in "
-                        f"{exc.__class__}: {exc}"
-                    )
-                    await asyncio.sleep(1)
-                    if retries >= settings.mcp.max_retries:
-                        logger.error(
-                            "Max retries reached! Failed to fetch OpenAPI spec."
-                        )
-                        raise
-
-            # create FastMCP instance, but only if the spec is valid
-            assert isinstance(openapi_spec, dict)
+    retries = 0
+    openapi_spec: dict | None = None
+
+    while True:
+        try:
+            # NOTE: accumulate the raw body and parse it once, rather than
+            #   buffering the response and then decoding it again as text
+            async with client.stream("GET", settings.mcp.openapi_path) as resp:
+                resp.raise_for_status()
+                body = bytearray()
+                async for chunk in resp.aiter_bytes():
+                    body += chunk
+            openapi_spec = json.loads(body)
+            break
+        except httpx.HTTPStatusError as exc:
+            # NOTE: the server is up but answering with an error, so retrying
+            #   would only delay the inevitable failure
+            logger.error(
+                "OpenAPI fetch for %s%s returned HTTP %s",
+                client.base_url,
+                settings.mcp.openapi_path,
+                exc.response.status_code,
+            )
+            raise
+        except httpx.TransportError as exc:
+            retries += 1
+            logger.error(
+                "OpenAPI fetch attempt %s for %s%s resulted in %s: %s",
+                retries,
+                client.base_url,
+                settings.mcp.openapi_path,
+                exc.__class__,
+                exc,
+            )
+            await asyncio.sleep(1)
+            if retries >= settings.mcp.max_retries:
+                logger.error("Max retries reached! Failed to fetch OpenAPI spec.")
+                raise
+
+    # only hand valid specs to FastMCP
+    assert isinstance(openapi_spec, dict)
+
+    return openapi_spec
+
+
+class McpMounter:
+    """
+    Build and mount the FastMCP app the first time it is needed.
+
+    The inner MCP lifespan is served from a dedicated task, so that its task
+    group is entered and exited by the same task regardless of which request
+    triggered the mount.
+
+    Args:
+        app: The FastAPI application to mount the MCP app on.
+        client: The HTTP client for the upstream API.
+    """
+
+    def __init__(self, app: FastAPI, client: httpx.AsyncClient) -> None:
+        self.app: FastAPI = app
+        self.client: httpx.AsyncClient = client
+        self.mounted: bool = False
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._shutdown: asyncio.Event = asyncio.Event()
+        self._lifespan_task: asyncio.Task | None = None
+
+    async def _serve_lifespan(
+        self,
+        mcp_inner_app: StarletteWithLifespan,
+        ready: asyncio.Future[None],
+    ) -> None:
+        """
+        Run the inner MCP lifespan until shutdown is requested.
+
+        Args:
+            mcp_inner_app: The FastMCP ASGI app.
+            ready: Resolved once the inner lifespan has started.
+
+        Raises:
+            Exception: Re-raised if the inner lifespan fails after startup.
+        """
+        try:
+            async with mcp_inner_app.lifespan(self.app):
+                ready.set_result(None)
+                await self._shutdown.wait()
+        except Exception as exc:
+            if ready.done():
+                raise
+            ready.set_exception(exc)
+
+    async def mount(self) -> None:
+        """
+        Create the FastMCP app and mount it, unless that has already happened.
+        """
+        if self.mounted:
+            return
+
+        async with self._lock:
+            if self.mounted:
+                return
+
+            # NOTE: the tool registry is rebuilt from the spec in every process;
+            #   FastMCP servers hold locks and the live client, so they cannot be
+            #   pickled to disk, and the build is already off the startup path
+            openapi_spec = await fetch_openapi_spec(self.client)
             mcp = FastMCP.from_openapi(
                 openapi_spec=openapi_spec,
-                client=client,
+                client=self.client,
                 name=f"{settings.app_name} MCP Interface",
             )
 
-            # create FastMCP ASGI app and attach its lifespan
+            # create FastMCP ASGI app and start its lifespan
             logger.debug(
-                "Creating MCP http_app with stateless_http="
-                f"{settings.mcp.stateless_http}"
+                "Creating MCP http_app with stateless_http=%s",
+                settings.mcp.stateless_http,
             )
             mcp_inner_app = mcp.http_app(
                 path="/",
                 stateless_http=settings.mcp.stateless_http,
             )
-            await stack.enter_async_context(mcp_inner_app.lifespan(app))
+            ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._lifespan_task = asyncio.create_task(
+                self._serve_lifespan(mcp_inner_app, ready)
+            )
+            await ready
             logger.info("Initialized MCP lifespan")
 
             # mount FastMCP app
-            app.mount(settings.mcp.mcp_mount_path, mcp_inner_app)
-            logger.info(f"Mounted MCP app at {settings.mcp.mcp_mount_path}")
+            self.app.mount(settings.mcp.mcp_mount_path, mcp_inner_app)
+            logger.info("Mounted MCP app at %s", settings.mcp.mcp_mount_path)
+            self.mounted = True
+
+    async def aclose(self) -> None:
+        """
+        Stop the inner MCP lifespan, if it was ever started.
+        """
+        self._shutdown.set()
+        if self._lifespan_task is not None:
+            await self._lifespan_task
+
+
+class LazyMcpMountMiddleware:
+    """
+    ASGI middleware that mounts the MCP app on the first request for it.
+
+    Args:
+        app: The next ASGI app in the middleware stack.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Mount the MCP app if needed, then pass the request through.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive callable.
+            send: The ASGI send callable.
+        """
+        if scope["type"] == "http":
+            mounter: McpMounter | None = getattr(
+                scope["app"].state, "mcp_mounter", None
+            )
+            path = scope["path"].removeprefix(scope.get("root_path", ""))
+            if (
+                mounter is not None
+                and not mounter.mounted
+                and path.startswith(settings.mcp.mcp_mount_path)
+            ):
+                await mounter.mount()
+
+        await self.app(scope, receive, send)
+
+
+@asynccontextmanager
+async def mcp_lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """
+    Asynchronous context manager for the FastMCP application lifespan.
+
+    Startup does no MCP work: the OpenAPI spec is fetched, and the FastMCP
+    app is created and mounted, by LazyMcpMountMiddleware on the first request
+    for the configured mount path. Cleans up resources on shutdown.
+
+    Args:
+        app: The main FastAPI application instance.
+
+    Yields:
+        None: Used for async context management of the app's lifespan.
+    """
+    # NOTE: FastMCP keeps using this client for every tool call, so it must
+    #   live for the whole lifespan and is only closed on shutdown
+    client = create_api_client()
+    mounter = McpMounter(app, client)
+    app.state.mcp_mounter = mounter
 
-            yield
+    try:
+        yield
+    finally:
+        try:
+            await mounter.aclose()
+        finally:
+            await client.aclose()
 
 
 # configure logging before app creation
@@ -103,3 +275,4 @@ print(f"Starting mcp_app with root_path='{root_path}'")
 
 # create a FastAPI app using MCP lifespan
 mcp_app = FastAPI(lifespan=mcp_lifespan, root_path=root_path)
+mcp_app.add_middleware(LazyMcpMountMiddleware)
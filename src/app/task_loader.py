@@ -6,7 +6,8 @@
 
 import importlib
 import logging
-import pathlib
+import os
+from collections.abc import Iterator
 
 from nmtfast.logging.v1.config import create_logging_config
 
@@ -30,6 +31,28 @@ def configure_logging(settings: AppSettings) -> None:
         logging.getLogger(logger_name).setLevel(log_level)
 
 
+def _iter_task_files(base_path: str) -> Iterator[str]:
+    """
+    Yield the paths of all Python files below base_path, except __init__.py.
+
+    Args:
+        base_path: The directory to walk.
+
+    Yields:
+        str: The path of each Python file that was found.
+    """
+    # NOTE: os.scandir yields plain strings and reuses the directory listing for
+    #   is_dir(), which is much cheaper than building a Path for every entry
+    stack = [base_path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                    yield entry.path
+
+
 def discover_tasks(package: str = "app.tasks") -> None:
     """
     Recursively import all task modules.
@@ -43,19 +66,17 @@ def discover_tasks(package: str = "app.tasks") -> None:
     if spec is None or spec.submodule_search_locations is None:
         raise ImportError(f"Could not find package {package}")
 
-    base_path = pathlib.Path(next(iter(spec.submodule_search_locations)))
-
-    for entry in base_path.rglob("*.py"):
-        if entry.stem == "__init__":
-            continue
+    base_path = next(iter(spec.submodule_search_locations))
+    # NOTE: module names are sliced out of the path strings, rather than built
+    #   with PurePath operations for every file
+    prefix_len = len(base_path) + len(os.sep)
 
-        relative_path = entry.relative_to(base_path)
-        module_name = (
-            f"{package}.{relative_path.with_suffix('').as_posix().replace('/', '.')}"
-        )
+    for file_path in _iter_task_files(base_path):
+        relative_name = file_path[prefix_len : -len(".py")]
+        module_name = f"{package}.{relative_name.replace(os.sep, '.')}"
 
         importlib.import_module(module_name)
-        logger.info(f"Loaded task module: {module_name}")
+        logger.info("Loaded task module: %s", module_name)
 
 
 configure_logging(get_app_settings())
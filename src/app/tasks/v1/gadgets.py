@@ -15,7 +15,7 @@ from pydantic import BaseModel
 from pymongo.asynchronous.database import AsyncDatabase as AsyncMongoDatabase
 
 from app.core.v1.mongo import with_huey_mongo_session
-from app.core.v1.tasks import huey_app
+from app.core.v1.tasks import HEARTBEAT_SECONDS, huey_app
 from app.layers.repository.v1.gadgets import GadgetRepository
 from app.schemas.dto.v1.gadgets import GadgetRead, GadgetZapTask
 
@@ -53,7 +53,8 @@ async def _async_logic_gadget_zap(
     REQUEST_ID_CONTEXTVAR.set(params.request_id)
     gadget_repo = GadgetRepository(mongo_client)
 
-    db_gadget: GadgetRead = await gadget_repo.get_by_id(params.gadget_id)
+    # NOTE: a missing gadget fails the task before it is marked as RUNNING
+    await gadget_repo.get_by_id(params.gadget_id)
 
     task_md = GadgetZapTask.model_validate(fetch_task_metadata(huey_app, task_uuid))
     task_md.state = "RUNNING"
@@ -65,36 +66,37 @@ async def _async_logic_gadget_zap(
     )
 
     try:
-        for tick in range(1, params.duration + 1):
-            logger.debug(f"{task_uuid}: Progress {tick}/{params.duration}")
-            task_md.runtime = tick
+        runtime = 0
+        while runtime < params.duration:
+            step = min(HEARTBEAT_SECONDS, params.duration - runtime)
+            await asyncio.sleep(step)
+            runtime += step
+            logger.debug("%s: Progress %s/%s", task_uuid, runtime, params.duration)
+            task_md.runtime = runtime
             store_task_metadata(huey_app, task_uuid, task_md.model_dump())
             await gadget_repo.zap_task_update(
                 task_uuid=task_uuid,
-                runtime=tick,
+                runtime=runtime,
             )
-            await asyncio.sleep(1)
 
-        current_force = db_gadget.force or 0
-        await gadget_repo.update_force(params.gadget_id, current_force + 1)
+        # NOTE: the force is incremented in the database, because it may have
+        #   changed while this task was running
+        db_gadget: GadgetRead = await gadget_repo.increment_force(params.gadget_id)
 
         await gadget_repo.collection.update_one(
             {"id": params.gadget_id},
             {"$set": {"last_task_uuid": task_uuid, "last_task_status": "SUCCESS"}},
         )
 
-        task_md.state = "SUCCESS"
-        store_task_metadata(huey_app, task_uuid, task_md.model_dump())
-
         await gadget_repo.zap_task_update(
             task_uuid=task_uuid,
             state="SUCCESS",
-            result={"gadget_id": params.gadget_id, "new_force": current_force + 1},
+            result={"gadget_id": params.gadget_id, "new_force": db_gadget.force},
         )
 
-        return task_md
+        return task_md.model_copy(update={"state": "SUCCESS"})
     except Exception as exc:
-        logger.exception(f"{task_uuid}: Exception in gadget_zap_task")
+        logger.exception("%s: Exception in gadget_zap_task", task_uuid)
         task_md.state = "FAILED"
         task_md = task_md.model_copy(
             update={"result": {"error": str(exc), "traceback": traceback.format_exc()}}
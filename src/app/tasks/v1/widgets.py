@@ -16,12 +16,9 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.v1.sqlalchemy import with_huey_db_session
-from app.core.v1.tasks import huey_app
+from app.core.v1.tasks import HEARTBEAT_SECONDS, huey_app
 from app.layers.repository.v1.widgets import WidgetRepository
 from app.schemas.dto.v1.widgets import WidgetZapTask
-from app.schemas.orm.v1.widgets import (
-    Widget,
-)
 from app.schemas.orm.v1.widgets import WidgetZapTask as OrmWidgetZapTask  # noqa: F401
 
 logger = logging.getLogger(__name__)
@@ -60,7 +57,8 @@ async def _async_logic_widget_zap(
     REQUEST_ID_CONTEXTVAR.set(params.request_id)
     widget_repo = WidgetRepository(db_session)
 
-    db_widget: Widget = await widget_repo.get_by_id(params.widget_id)
+    # NOTE: a missing widget fails the task before it is marked as RUNNING
+    await widget_repo.get_by_id(params.widget_id)
 
     task_md = WidgetZapTask.model_validate(fetch_task_metadata(huey_app, task_uuid))
     task_md.state = "RUNNING"
@@ -72,17 +70,22 @@ async def _async_logic_widget_zap(
     )
 
     try:
-        for tick in range(1, params.duration + 1):
-            logger.debug(f"{task_uuid}: Progress {tick}/{params.duration}")
-            task_md.runtime = tick
+        runtime = 0
+        while runtime < params.duration:
+            step = min(HEARTBEAT_SECONDS, params.duration - runtime)
+            await asyncio.sleep(step)
+            runtime += step
+            logger.debug("%s: Progress %s/%s", task_uuid, runtime, params.duration)
+            task_md.runtime = runtime
             store_task_metadata(huey_app, task_uuid, task_md.model_dump())
             await widget_repo.zap_task_update(
                 task_uuid=task_uuid,
-                runtime=tick,
+                runtime=runtime,
             )
-            await asyncio.sleep(1)
 
-        await widget_repo.update_force(params.widget_id, db_widget.force + 1)
+        # NOTE: the force is incremented in the database, because it may have
+        #   changed while this task was running
+        new_force = await widget_repo.increment_force(params.widget_id)
 
         await widget_repo.update_last_task(
             widget_id=params.widget_id,
@@ -90,19 +93,16 @@ async def _async_logic_widget_zap(
             status="SUCCESS",
         )
 
-        task_md.state = "SUCCESS"
-        store_task_metadata(huey_app, task_uuid, task_md.model_dump())
-
         await widget_repo.zap_task_update(
             task_uuid=task_uuid,
             state="SUCCESS",
-            result={"widget_id": params.widget_id, "new_force": db_widget.force + 1},
+            result={"widget_id": params.widget_id, "new_force": new_force},
         )
 
-        logger.info(f"{task_uuid}: Completed. New force: {db_widget.force}")
-        return task_md
+        logger.info("%s: Completed. New force: %s", task_uuid, new_force)
+        return task_md.model_copy(update={"state": "SUCCESS"})
     except Exception as exc:
-        logger.exception(f"{task_uuid}: Exception in widget_zap_task")
+        logger.exception("%s: Exception in widget_zap_task", task_uuid)
         task_md.state = "FAILED"
         task_md = task_md.model_copy(
             update={"result": {"error": str(exc), "traceback": traceback.format_exc()}}
@@ -4,35 +4,16 @@
 
 """pyinvoke task definitions used for linting/fixing code."""
 
-from invoke import Context, task
+import os
+from concurrent.futures import ThreadPoolExecutor
 
+from invoke import Context, Exit, task
 
-@task(
-    help={
-        "fix": "Apply fixes instead of just linting",
-        "files": "Files or directories to check/fix",
-    }
-)
-def black(ctx: Context, fix: bool = False, files: str = ".") -> None:
-    """
-    Run Black for code formatting.
-
-    Extra options are defined in pyproject.toml.
-
-    Args:
-        ctx: The pyinvoke subprocess context.
-        fix: Whether to apply fixes. Defaults to False.
-        files: File matching pattern. Defaults to ".".
-
-    Returns:
-        None: No return value.
-    """
-    if fix:
-        cmd = f"black {files}"
-    else:
-        cmd = f"black --check --diff {files}"
-    print(f"-> Running: {cmd}")
-    ctx.run(cmd, pty=False, warn=False)
+# NOTE: loadfile keeps the tests of a module on one worker, so module-specific
+#   session fixtures (like the argon2 hash in the auth tests) are not rebuilt by
+#   every worker
+_PARALLEL_ARGS = " -n auto --dist=loadfile"
+_PYTEST_MODES = {"all": "", "lf": " --lf", "ff": " --ff"}
 
 
 @task(
@@ -41,9 +22,9 @@ def black(ctx: Context, fix: bool = False, files: str = ".") -> None:
         "files": "Files or directories to check/fix",
     }
 )
-def isort(ctx: Context, fix: bool = False, files: str = ".") -> None:
+def ruff_format(ctx: Context, fix: bool = False, files: str = ".") -> None:
     """
-    Run isort for import sorting.
+    Run the Ruff formatter for code formatting.
 
     Extra options are defined in pyproject.toml.
 
@@ -56,10 +37,9 @@ def isort(ctx: Context, fix: bool = False, files: str = ".") -> None:
         None: No return value.
     """
     if fix:
-        cmd = f"isort --profile black {files}"
+        cmd = f"ruff format {files}"
     else:
-        cmd = f"isort --profile black --check-only --diff {files}"
-
+        cmd = f"ruff format --check --diff {files}"
     print(f"-> Running: {cmd}")
     ctx.run(cmd, pty=False, warn=False)
 
@@ -92,29 +72,6 @@ def ruff(ctx: Context, fix: bool = False, files: str = ".") -> None:
     ctx.run(cmd, pty=False, warn=False)
 
 
-@task(
-    help={
-        "files": "Files or directories to check/fix",
-    }
-)
-def pydocstyle(ctx: Context, files: str = ".") -> None:
-    """
-    Run pydocstyle for docstring linting.
-
-    Extra options are defined in pyproject.toml.
-
-    Args:
-        ctx: The pyinvoke subprocess context.
-        files: File matching pattern. Defaults to ".".
-
-    Returns:
-        None: No return value.
-    """
-    cmd = f"pydocstyle --config=pyproject.toml {files}"
-    print(f"-> Running: {cmd}")
-    ctx.run(cmd, pty=False, warn=False)
-
-
 @task(
     help={
         "files": "Files or directories to check/fix",
@@ -139,7 +96,6 @@ def pydoclint(ctx: Context, files: str = ".") -> None:
 
 
 @task(
-    pre=[black, isort, ruff, pydocstyle, pydoclint],
     help={
         "files": "Files or directories to lint",
     },
@@ -148,15 +104,38 @@ def lint(ctx: Context, files: str = ".") -> None:
     """
     Run all linters.
 
-    Each linter has extra options defined in pyproject.toml.
+    Each linter has extra options defined in pyproject.toml. The linters do not
+    depend on each other, so they run concurrently and their output is printed
+    once they have all finished.
 
     Args:
         ctx: The pyinvoke subprocess context.
         files: File matching pattern. Defaults to ".".
 
-    Returns:
-        None: No return value.
+    Raises:
+        Exit: If any of the linters failed.
     """
+    cmds = [
+        f"ruff format --check --diff {files}",
+        f"ruff check {files}",
+        f"pydoclint {files}",
+    ]
+    # NOTE: warn=True lets every linter finish even when another one fails
+    with ThreadPoolExecutor(max_workers=min(len(cmds), os.cpu_count() or 1)) as pool:
+        results = list(
+            pool.map(lambda cmd: ctx.run(cmd, pty=False, warn=True, hide=True), cmds)
+        )
+
+    failed = []
+    for cmd, result in zip(cmds, results):
+        print(f"-> Ran: {cmd}")
+        print(result.stdout, end="")
+        print(result.stderr, end="")
+        if result.exited != 0:
+            failed.append(cmd)
+
+    if failed:
+        raise Exit(f"Linting failed: {', '.join(failed)}", code=1)
     print("Linting completed.")
 
 
@@ -178,9 +157,12 @@ def fixers(ctx: Context, files: str = ".") -> None:
     Returns:
         None: No return value.
     """
-    black(ctx, fix=True, files=files)
-    isort(ctx, fix=True, files=files)
-    # NOTE: we are not ready to use ruff to autofix code
+    ruff_format(ctx, fix=True, files=files)
+    # NOTE: we are not ready to use ruff to autofix code, so only imports are
+    #   sorted (which is all that isort used to fix)
+    cmd = f"ruff check --fix --select I {files}"
+    print(f"-> Running: {cmd}")
+    ctx.run(cmd, pty=False, warn=False)
     # ruff(ctx, fix=True, files=files)
     print("-> Fixers completed.")
 
@@ -189,12 +171,18 @@ def fixers(ctx: Context, files: str = ".") -> None:
     help={
         "files": "Space-separated list of files to include",
         "expr": "Run tests which match substring expression ('-k' pytest arg)",
+        "parallel": "Run test files in parallel pytest-xdist workers",
+        "mode": "Which tests to run: all, lf (last failed) or ff (failed first)",
+        "cache_clear": "Clear the pytest cache (and its failure record) first",
     },
 )
 def pytest(
     ctx: Context,
     files: str = "tests",
     expr: str = "",
+    parallel: bool = False,
+    mode: str = "all",
+    cache_clear: bool = False,
 ) -> None:
     """
     Run pytest unit/integration tests.
@@ -203,14 +191,27 @@ def pytest(
         ctx: The pyinvoke subprocess context.
         files: Space-separated list of files to include.
         expr: Run tests which match substring expression ('-k' pytest arg).
+        parallel: Run test files in parallel workers. Defaults to False.
+        mode: Run "all" tests, only the tests that failed last time ("lf"), or
+            the tests that failed last time first ("ff"). Defaults to "all".
+        cache_clear: Clear the pytest cache before running. Defaults to False.
 
     Returns:
         None: No return value.
+
+    Raises:
+        Exit: If mode is not one of the supported modes.
     """
+    if mode not in _PYTEST_MODES:
+        raise Exit(f"Unknown mode: {mode}", code=1)
+
+    cmd = f"pytest {files}{_PYTEST_MODES[mode]}"
+    if parallel:
+        cmd += _PARALLEL_ARGS
+    if cache_clear:
+        cmd += " --cache-clear"
     if expr:
-        cmd = f"pytest {files} -k {expr}"
-    else:
-        cmd = f"pytest {files}"
+        cmd += f" -k {expr}"
     print(f"-> Running: {cmd}")
     ctx.run(cmd, pty=False, warn=False)
 
@@ -219,12 +220,14 @@ def pytest(
     help={
         "files": "Space-separated list of files to include",
         "expr": "Run tests which match substring expression ('-k' pytest arg)",
+        "parallel": "Run test files in parallel pytest-xdist workers",
     },
 )
 def coverage(
     ctx: Context,
     files: str = "tests",
     expr: str = "",
+    parallel: bool = False,
 ) -> None:
     """
     Run pytest unit/integration tests.
@@ -233,11 +236,14 @@ def coverage(
         ctx: The pyinvoke subprocess context.
         files: Space-separated list of files to include.
         expr: Run tests which match substring expression ('-k' pytest arg).
+        parallel: Run test files in parallel workers. Defaults to False.
 
     Returns:
         None: No return value.
     """
     cmd = f"pytest --cov=app --cov-report term-missing {files}"
+    if parallel:
+        cmd += _PARALLEL_ARGS
     if expr:
         cmd += f" -k {expr}"
     print(f"-> Running: {cmd}")
@@ -248,24 +254,49 @@ def coverage(
     help={
         "files": "Space-separated list of files to include",
         "exclude": "Regex of files/directories to ignore",
+        "daemon": "Check with the mypy daemon, which keeps its state between runs",
     },
 )
 def mypy(
     ctx: Context,
     files: str = "src/app tasks.py",
     exclude: str = "^alembic/",
+    daemon: bool = False,
 ) -> None:
     """
     Check for PEP 484 compliance using mypy.
 
+    With daemon=True, the check is done by dmypy. The daemon is started on the
+    first run, and later runs only recheck what changed. Use mypy-stop to stop it.
+
     Args:
         ctx: The pyinvoke subprocess context.
         files: Space-separated list of files to include.
         exclude: Ignore file/directories matching this regex.
+        daemon: Whether to check with the mypy daemon. Defaults to False.
+
+    Returns:
+        None: No return value.
+    """
+    if daemon:
+        cmd = f"dmypy run -- --exclude={exclude} {files}"
+    else:
+        cmd = f"mypy --exclude={exclude} {files}"
+    print(f"-> Running: {cmd}")
+    ctx.run(cmd, pty=False, warn=False)
+
+
+@task
+def mypy_stop(ctx: Context) -> None:
+    """
+    Stop the mypy daemon started by the mypy task.
+
+    Args:
+        ctx: The pyinvoke subprocess context.
 
     Returns:
         None: No return value.
     """
-    cmd = f"mypy --exclude={exclude} {files}"
+    cmd = "dmypy stop"
     print(f"-> Running: {cmd}")
     ctx.run(cmd, pty=False, warn=False)
@@ -7,7 +7,8 @@
 import importlib
 import importlib.util
 import logging
-import pathlib
+import os
+import sys
 
 import pytest
 
@@ -64,29 +65,36 @@ def discover_all_app_modules() -> None:
     if spec is None or not spec.submodule_search_locations:
         raise ImportError(f"Could not find package: {package}")
 
-    package_path = pathlib.Path(next(iter(spec.submodule_search_locations)))
+    package_path = next(iter(spec.submodule_search_locations))
 
-    def discover_modules(path: pathlib.Path, parent: str):
+    def discover_modules(path: str, parent: str):
         """
-        Recursive inner function to discover all app modules.
+        Walk the package with os.scandir and import all app modules.
         """
-        for entry in path.rglob("*.py"):  # recursively find all .py files
-
-            if entry.stem == "__init__":
-                # NOTE: skip __init__.py files, but we are using implicit
-                #   namespace packages so they should not be found
-                continue
-
-            # convert file path to module import path
-            relative_path = entry.relative_to(path)
-            module_name = (
-                f"{parent}.{relative_path.with_suffix('').as_posix().replace('/', '.')}"
-            )
-            try:
-                importlib.import_module(module_name)
-                logger.info(f"Loaded module: {module_name}")
-            except ImportError as exc:
-                logger.error(f"Failed to load module: {module_name}, Error: {exc}")
+        stack = [(path, parent)]
+        while stack:
+            dir_path, dir_package = stack.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{dir_package}.{entry.name}"))
+                        continue
+                    # NOTE: skip __init__.py files, but we are using implicit
+                    #   namespace packages so they should not be found
+                    if not entry.name.endswith(".py") or entry.name == "__init__.py":
+                        continue
+
+                    module_name = f"{dir_package}.{entry.name[: -len('.py')]}"
+                    # NOTE: most modules were already imported while collecting tests
+                    if module_name in sys.modules:
+                        continue
+                    try:
+                        importlib.import_module(module_name)
+                        logger.info("Loaded module: %s", module_name)
+                    except ImportError as exc:
+                        logger.error(
+                            "Failed to load module: %s, Error: %s", module_name, exc
+                        )
 
     discover_modules(package_path, package)
     logger.info("Finished loading app modules.")
@@ -21,10 +21,8 @@ from nmtfast.settings.v1.schemas import (
 from app.core.v1.auth import _user_label, process_api_key_header, process_bearer_token
 from app.core.v1.settings import AppSettings
 
-ph = argon2.PasswordHasher()
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_key():
     """
     Fixture providing a test API key.
@@ -32,10 +30,22 @@ def mock_api_key():
     return "test-api-key"
 
 
-@pytest.fixture
-def mock_settings(mock_api_key):
+@pytest.fixture(scope="session")
+def mock_api_key_hash(mock_api_key):
+    """
+    Fixture providing the argon2 hash of the test API key.
+
+    Argon2 is deliberately slow, so the key is only hashed once per session.
+    """
+    return argon2.PasswordHasher().hash(mock_api_key)
+
+
+@pytest.fixture(scope="session")
+def mock_settings(mock_api_key_hash):
     """
     Fixture providing properly configured AppSettings.
+
+    The settings are shared by all tests, which only read them.
     """
     return AppSettings(
         auth=AuthSettings(
@@ -47,7 +57,7 @@ def mock_settings(mock_api_key):
                     "valid-key": IncomingAuthApiKey(
                         contact="test@example.com",
                         memo="pytest fixture",
-                        hash=ph.hash(mock_api_key),
+                        hash=mock_api_key_hash,
                         algo="argon2",
                         acls=[SectionACL(section_regex=".*", permissions=["*"])],
                     )
@@ -65,7 +75,7 @@ def mock_cache():
     return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_acls():
     """
     Fixture providing sample ACL data.
@@ -73,7 +83,7 @@ def mock_acls():
     return [SectionACL(section_regex=".*", permissions=["*"])]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_auth_info(mock_acls):
     """
     Fixture providing sample AuthSuccess (with list of SectionACLs).
@@ -81,86 +91,60 @@ def mock_auth_info(mock_acls):
     return AuthSuccess(name="test-user", acls=mock_acls)
 
 
+@pytest.fixture(scope="session")
+def mock_auth_info_json(mock_auth_info):
+    """
+    Fixture providing the cached (JSON serialized) form of the sample AuthSuccess.
+    """
+    return mock_auth_info.model_dump_json()
+
+
 # Tests for process_api_key_header
 @pytest.mark.asyncio
-async def test_process_api_key_header_empty_key(mock_settings, mock_cache):
+@pytest.mark.parametrize("mode", ["authn", "authz"])
+async def test_process_api_key_header_empty_key(mock_settings, mock_cache, mode):
     """
     Test API key authentication fails with empty key.
     """
-    # test mode "authn"
     with pytest.raises(HTTPException) as exc:
-        await process_api_key_header("", mock_settings, mock_cache, "authn")
-    assert exc.value.status_code == 403
-    assert "Invalid API key" in exc.value.detail
-
-    # test mode "authz"
-    with pytest.raises(HTTPException) as exc:
-        await process_api_key_header("", mock_settings, mock_cache, "authz")
+        await process_api_key_header("", mock_settings, mock_cache, mode)
     assert exc.value.status_code == 403
     assert "Invalid API key" in exc.value.detail
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["authn", "authz"])
 async def test_process_api_key_header_cached_success(
-    mock_settings, mock_cache, mock_acls
+    mock_settings, mock_cache, mock_auth_info_json, mode
 ):
     """
     Test API key authentication with valid cached ACLs.
     """
-    auth_info = AuthSuccess(name="valid-key", acls=mock_acls)
-    mock_cache.fetch_app_cache.return_value = auth_info.model_dump_json()
+    mock_cache.fetch_app_cache.return_value = mock_auth_info_json
 
-    # test mode "authn"
-    result = await process_api_key_header(
-        "valid-key", mock_settings, mock_cache, "authn"
-    )
+    result = await process_api_key_header("valid-key", mock_settings, mock_cache, mode)
     assert len(result) == 1
     assert result[0].permissions == ["*"]
 
-    # test mode "authz"
-    result = await process_api_key_header(
-        "valid-key", mock_settings, mock_cache, "authz"
-    )
-    assert len(result) == 1
-    assert result[0].permissions == ["*"]
-
-
-@pytest.mark.asyncio
-async def test_process_api_key_header_authn_cache_miss_success(
-    mock_settings, mock_cache, mock_api_key
-):
-    """
-    Test API key authentication with cache miss but successful authn.
-    """
-    # test mode "authn"
-    mock_cache.fetch_app_cache.return_value = None
-    result = await process_api_key_header(
-        mock_api_key, mock_settings, mock_cache, "authn"
-    )
-    assert len(result) == 1
-    assert result[0].permissions == ["*"]
-    mock_cache.store_app_cache.assert_called_once()
-
 
 @pytest.mark.asyncio
-async def test_process_api_key_header_authz_cache_miss_success(
-    mock_settings, mock_cache, mock_api_key
+@pytest.mark.parametrize("mode", ["authn", "authz"])
+async def test_process_api_key_header_cache_miss_success(
+    mock_settings, mock_cache, mock_api_key, mode
 ):
     """
-    Test API key authentication with cache miss but successful authz.
+    Test API key authentication with cache miss but successful authn/authz.
     """
-    # test mode "authz"
     mock_cache.fetch_app_cache.return_value = None
-    result = await process_api_key_header(
-        mock_api_key, mock_settings, mock_cache, "authz"
-    )
+    result = await process_api_key_header(mock_api_key, mock_settings, mock_cache, mode)
     assert len(result) == 1
     assert result[0].permissions == ["*"]
     mock_cache.store_app_cache.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_process_api_key_header_auth_error(mock_settings, mock_cache):
+@pytest.mark.parametrize("mode", ["authn", "authz"])
+async def test_process_api_key_header_auth_error(mock_settings, mock_cache, mode):
     """
     Test API key authentication with authentication error.
     """
@@ -168,133 +152,80 @@ async def test_process_api_key_header_auth_error(mock_settings, mock_cache):
         "app.core.v1.auth.authenticate_api_key",
         new=AsyncMock(side_effect=AuthenticationError("Invalid key")),
     ):
-        # test mode "authn"
-        mock_cache.fetch_app_cache.return_value = None
-        with pytest.raises(HTTPException) as exc:
-            await process_api_key_header(
-                "invalid-key", mock_settings, mock_cache, "authn"
-            )
-        assert exc.value.status_code == 403
-        assert "Invalid key" in exc.value.detail
-
-        # test mode "authz"
         mock_cache.fetch_app_cache.return_value = None
         with pytest.raises(HTTPException) as exc:
-            await process_api_key_header(
-                "invalid-key", mock_settings, mock_cache, "authz"
-            )
+            await process_api_key_header("invalid-key", mock_settings, mock_cache, mode)
         assert exc.value.status_code == 403
         assert "Invalid key" in exc.value.detail
 
 
 # Tests for process_bearer_token
 @pytest.mark.asyncio
-async def test_process_bearer_token_empty_token(mock_settings, mock_cache):
+@pytest.mark.parametrize("mode", ["authn", "authz"])
+async def test_process_bearer_token_empty_token(mock_settings, mock_cache, mode):
     """
     Test bearer token authentication with empty token.
     """
-    # test mode authn
-    with pytest.raises(HTTPException) as exc:
-        await process_bearer_token("", mock_settings, mock_cache, "authn")
-    assert exc.value.status_code == 401
-    assert "Missing or invalid" in exc.value.detail
-
-    # test mode authz
     with pytest.raises(HTTPException) as exc:
-        await process_bearer_token("", mock_settings, mock_cache, "authz")
+        await process_bearer_token("", mock_settings, mock_cache, mode)
     assert exc.value.status_code == 401
     assert "Missing or invalid" in exc.value.detail
 
 
 @pytest.mark.asyncio
-async def test_process_bearer_token_invalid_format(mock_settings, mock_cache):
+@pytest.mark.parametrize("mode", ["authn", "authz"])
+async def test_process_bearer_token_invalid_format(mock_settings, mock_cache, mode):
     """
     Test bearer token authentication with invalid JWT format.
     """
-    # test mode authn
-    with pytest.raises(HTTPException) as exc:
-        await process_bearer_token(
-            "invalid-token-format", mock_settings, mock_cache, "authn"
-        )
-    assert exc.value.status_code == 403
-    assert "Invalid token" in exc.value.detail
-
-    # test mode authz
     with pytest.raises(HTTPException) as exc:
         await process_bearer_token(
-            "invalid-token-format", mock_settings, mock_cache, "authz"
+            "invalid-token-format", mock_settings, mock_cache, mode
         )
     assert exc.value.status_code == 403
     assert "Invalid token" in exc.value.detail
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["authn", "authz"])
 async def test_process_bearer_token_cached_success(
-    mock_settings, mock_cache, mock_acls
+    mock_settings, mock_cache, mock_auth_info_json, mode
 ):
     """
     Test bearer token authentication with valid cached ACLs.
     """
-    auth_info = AuthSuccess(name="valid.jwt.token", acls=mock_acls)
-    mock_cache.fetch_app_cache.return_value = auth_info.model_dump_json()
+    mock_cache.fetch_app_cache.return_value = mock_auth_info_json
 
-    # test mode authn
     result = await process_bearer_token(
-        "valid.jwt.token", mock_settings, mock_cache, "authn"
-    )
-    assert len(result) == 1
-    assert result[0].permissions == ["*"]
-
-    # test mode authz
-    result = await process_bearer_token(
-        "valid.jwt.token", mock_settings, mock_cache, "authz"
+        "valid.jwt.token", mock_settings, mock_cache, mode
     )
     assert len(result) == 1
     assert result[0].permissions == ["*"]
 
 
 @pytest.mark.asyncio
-async def test_process_bearer_token_authn_cache_miss_success(
-    mock_settings, mock_cache, mock_auth_info
+@pytest.mark.parametrize("mode", ["authn", "authz"])
+async def test_process_bearer_token_cache_miss_success(
+    mock_settings, mock_cache, mock_auth_info, mode
 ):
     """
-    Test bearer token authentication with cache miss but successful authn.
+    Test bearer token authentication with cache miss but successful authn/authz.
     """
     with patch(
         "app.core.v1.auth.authenticate_token",
         new=AsyncMock(return_value=mock_auth_info),
     ):
-        # test mode authn
         mock_cache.fetch_app_cache.return_value = None
         result = await process_bearer_token(
-            "valid.jwt.token", mock_settings, mock_cache, "authn"
+            "valid.jwt.token", mock_settings, mock_cache, mode
         )
         assert len(result) == 1
         mock_cache.store_app_cache.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_process_bearer_token_authz_cache_miss_success(
-    mock_settings, mock_cache, mock_auth_info
-):
-    """
-    Test bearer token authentication with cache miss but successful authz.
-    """
-    with patch(
-        "app.core.v1.auth.authenticate_token",
-        new=AsyncMock(return_value=mock_auth_info),
-    ):
-        # test mode authz
-        mock_cache.fetch_app_cache.return_value = None
-        result = await process_bearer_token(
-            "valid.jwt.token", mock_settings, mock_cache, "authz"
-        )
-        assert len(result) == 1
-        mock_cache.store_app_cache.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_process_bearer_token_auth_error(mock_settings, mock_cache):
+@pytest.mark.parametrize("mode", ["authn", "authz"])
+async def test_process_bearer_token_auth_error(mock_settings, mock_cache, mode):
     """
     Test bearer token authentication with authentication error.
     """
@@ -303,43 +234,25 @@ async def test_process_bearer_token_auth_error(mock_settings, mock_cache):
         "app.core.v1.auth.authenticate_token",
         new=AsyncMock(side_effect=AuthenticationError("Invalid token")),
     ):
-        # test mode authn
-        with pytest.raises(HTTPException) as exc:
-            await process_bearer_token(
-                "invalid.jwt.token", mock_settings, mock_cache, "authn"
-            )
-        assert exc.value.status_code == 403
-        assert "Invalid token" in exc.value.detail
-
-        # test mode authz
         with pytest.raises(HTTPException) as exc:
             await process_bearer_token(
-                "invalid.jwt.token", mock_settings, mock_cache, "authz"
+                "invalid.jwt.token", mock_settings, mock_cache, mode
             )
         assert exc.value.status_code == 403
         assert "Invalid token" in exc.value.detail
 
 
 @pytest.mark.asyncio
-async def test_process_bearer_token_no_acls_returned(mock_settings, mock_cache):
+@pytest.mark.parametrize("mode", ["authn", "authz"])
+async def test_process_bearer_token_no_acls_returned(mock_settings, mock_cache, mode):
     """
     Test bearer token authentication when no ACLs are returned.
     """
     with patch("app.core.v1.auth.authenticate_token", new=AsyncMock(return_value=[])):
-        # test mode authn
         mock_cache.fetch_app_cache.return_value = None
         with pytest.raises(HTTPException) as exc:
             await process_bearer_token(
-                "valid.jwt.token", mock_settings, mock_cache, "authn"
-            )
-        assert exc.value.status_code == 403
-        assert "no permissions" in exc.value.detail
-
-        # test mode authz
-        mock_cache.fetch_app_cache.return_value = None
-        with pytest.raises(HTTPException) as exc:
-            await process_bearer_token(
-                "valid.jwt.token", mock_settings, mock_cache, "authz"
+                "valid.jwt.token", mock_settings, mock_cache, mode
             )
         assert exc.value.status_code == 403
         assert "no permissions" in exc.value.detail
@@ -355,7 +268,6 @@ async def test_process_api_key_header_auth_returns_no_acls(
     with patch(
         "app.core.v1.auth.authenticate_api_key", new=AsyncMock(return_value=[])
     ):  # explicitly return empty list
-
         # test mode "authn"
         mock_cache.fetch_app_cache.return_value = None
         result = await process_api_key_header(
@@ -4,8 +4,13 @@
 
 """Unit tests for core readiness functions."""
 
+from unittest.mock import AsyncMock
+
+import pytest
+
 from app.core.v1 import health
 from app.core.v1.health import (
+    LivenessMiddleware,
     check_app_readiness,
     set_app_not_ready,
     set_app_ready,
@@ -40,3 +45,67 @@ def test_set_app_not_ready():
     set_app_not_ready()
 
     assert check_app_readiness() is False
+
+
+@pytest.mark.asyncio
+async def test_liveness_middleware_answers_probe():
+    """
+    Test LivenessMiddleware responds to liveness probes without calling the app.
+    """
+    inner_app = AsyncMock()
+    send = AsyncMock()
+    middleware = LivenessMiddleware(inner_app)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/health/liveness",
+        "root_path": "/api",
+    }
+    await middleware(scope, AsyncMock(), send)
+
+    inner_app.assert_not_awaited()
+    start, body = (call.args[0] for call in send.await_args_list)
+    assert start["status"] == 200
+    assert (b"content-type", b"application/json") in start["headers"]
+    assert body["body"] == b'{"status":"alive"}'
+
+
+@pytest.mark.asyncio
+async def test_liveness_middleware_passes_other_requests():
+    """
+    Test LivenessMiddleware passes non-probe requests to the next app.
+    """
+    inner_app = AsyncMock()
+    receive = AsyncMock()
+    send = AsyncMock()
+    middleware = LivenessMiddleware(inner_app)
+
+    for scope in (
+        {"type": "http", "method": "GET", "path": "/health/readiness"},
+        {"type": "http", "method": "POST", "path": "/health/liveness"},
+        {"type": "lifespan"},
+    ):
+        await middleware(scope, receive, send)
+        inner_app.assert_awaited_with(scope, receive, send)
+
+    send.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_liveness_middleware_head_has_no_body():
+    """
+    Test LivenessMiddleware answers HEAD probes with headers but no body.
+    """
+    inner_app = AsyncMock()
+    send = AsyncMock()
+    middleware = LivenessMiddleware(inner_app)
+
+    scope = {"type": "http", "method": "HEAD", "path": "/health/liveness"}
+    await middleware(scope, AsyncMock(), send)
+
+    inner_app.assert_not_awaited()
+    start, body = (call.args[0] for call in send.await_args_list)
+    assert start["status"] == 200
+    assert (b"content-length", b"18") in start["headers"]
+    assert body["body"] == b""
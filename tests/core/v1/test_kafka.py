@@ -30,12 +30,10 @@ def test_enhanced_json_encoder():
     encoder = EnhancedJSONEncoder()
 
     # Test datetime
-    now = datetime.now()
-    assert encoder.default(now) == now.isoformat()
+    assert encoder.default(datetime(2025, 1, 1, 12, 30, 15)) == "2025-01-01T12:30:15"
 
     # Test date
-    today = date.today()
-    assert encoder.default(today) == today.isoformat()
+    assert encoder.default(date(2025, 1, 1)) == "2025-01-01"
 
     # Test Decimal
     dec = Decimal("3.14")
@@ -90,15 +88,20 @@ async def test_kafka_producer_initialization_with_auth():
         sasl_mechanism="PLAIN",
         sasl_plain_username="user",
         sasl_plain_password="pass",
+        linger_ms=50,
+        max_batch_size=65536,
     )
 
     import app.core.v1.kafka as kafka_module
 
     with (
-        patch.object(kafka_module, "_sk", mock_sk),
-        patch.object(kafka_module, "_sasl_mechanism", "PLAIN"),
-        patch.object(kafka_module, "_sasl_plain_username", "user"),
-        patch.object(kafka_module, "_sasl_plain_password", "pass"),
+        patch.multiple(
+            kafka_module,
+            _sk=mock_sk,
+            _sasl_mechanism="PLAIN",
+            _sasl_plain_username="user",
+            _sasl_plain_password="pass",
+        ),
         patch(
             "app.core.v1.kafka.AIOKafkaProducer", return_value=mock_producer_instance
         ),
@@ -194,23 +197,31 @@ async def test_create_kafka_producer_uninitialized():
         sasl_mechanism="PLAIN",
         sasl_plain_username="",
         sasl_plain_password="",
+        linger_ms=10,
+        max_batch_size=32768,
     )
 
     import app.core.v1.kafka as kafka_mod
 
     with (
-        patch.object(kafka_mod, "_sk", mock_sk),
-        patch.object(kafka_mod, "_sasl_mechanism", "PLAIN"),
-        patch.object(kafka_mod, "_sasl_plain_username", ""),
-        patch.object(kafka_mod, "_sasl_plain_password", ""),
-        patch.object(kafka_mod, "kafka_producer", None),
+        patch.multiple(
+            kafka_mod,
+            _sk=mock_sk,
+            _sasl_mechanism="PLAIN",
+            _sasl_plain_username="",
+            _sasl_plain_password="",
+            kafka_producer=None,
+        ),
         patch(
             "app.core.v1.kafka.AIOKafkaProducer", return_value=mock_producer_instance
-        ),
+        ) as mock_producer_class,
     ):
         result = await kafka_mod.create_kafka_producer()
 
         assert result is mock_producer_instance
+        producer_kwargs = mock_producer_class.call_args.kwargs
+        assert producer_kwargs["linger_ms"] == 10
+        assert producer_kwargs["max_batch_size"] == 32768
 
 
 @pytest.mark.asyncio
@@ -219,7 +230,9 @@ async def test_start_demo_consumer_success():
     Test _start_demo_consumer processes messages successfully.
     """
     mock_consumer = AsyncMock()
-    mock_consumer.__aiter__.return_value = [MagicMock(value={"test": "message"})]
+    mock_consumer.__aiter__.return_value = [
+        types.SimpleNamespace(value={"test": "message"})
+    ]
 
     with (
         patch("app.core.v1.kafka.AIOKafkaConsumer", return_value=mock_consumer),
@@ -249,7 +262,7 @@ async def test_start_demo_consumer_exception(caplog):
 
     mock_consumer = AsyncMock()
     mock_consumer.__aiter__.return_value = [
-        MagicMock(
+        types.SimpleNamespace(
             value=json.dumps({"foo": "bar"}).encode("utf-8"),
         )
     ]
@@ -269,10 +282,13 @@ async def test_start_demo_consumer_exception(caplog):
     )
 
     with (
-        patch.object(kafka_module, "_sk", mock_sk),
-        patch.object(kafka_module, "_sasl_mechanism", "PLAIN"),
-        patch.object(kafka_module, "_sasl_plain_username", ""),
-        patch.object(kafka_module, "_sasl_plain_password", ""),
+        patch.multiple(
+            kafka_module,
+            _sk=mock_sk,
+            _sasl_mechanism="PLAIN",
+            _sasl_plain_username="",
+            _sasl_plain_password="",
+        ),
         patch("app.core.v1.kafka.AIOKafkaConsumer", return_value=mock_consumer),
         patch("app.core.v1.kafka.route_kafka_message", side_effect=Exception("Boom!")),
     ):
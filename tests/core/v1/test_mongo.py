@@ -8,11 +8,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+import app.core.v1.mongo as mongo_module
 from app.core.v1.settings import AppSettings, MongoSettings
 
-# NOTE: each test needs to import app.core.v1.kafka so that patching of objects
-#   like kafka_producer can succeed
-
 
 def test_mongo_clients_initialization_with_url():
     """
@@ -25,32 +23,33 @@ def test_mongo_clients_initialization_with_url():
     mock_sync_client = MagicMock()
     mock_sync_client.address = ("localhost", 27017)
 
+    # NOTE: the clients are created lazily from the module settings, so patching
+    #   the module globals is enough and the module does not need to be reloaded
     with (
-        patch(
-            "app.core.v1.settings.get_app_settings",
-            return_value=test_app_settings,
-        ),
-        patch(
-            "pymongo.AsyncMongoClient",
-            return_value=mock_async_client,
-        ),
-        patch(
-            "pymongo.MongoClient",
-            return_value=mock_sync_client,
+        patch.multiple(
+            mongo_module,
+            settings=test_app_settings,
+            async_client=None,
+            sync_client=None,
         ),
+        patch.object(
+            mongo_module, "AsyncMongoClient", return_value=mock_async_client
+        ) as mock_async_cls,
+        patch.object(
+            mongo_module, "MongoClient", return_value=mock_sync_client
+        ) as mock_sync_cls,
     ):
-        import importlib
-
-        import app.core.v1.mongo as mongo_module
-
-        importlib.reload(mongo_module)
-
-        # Trigger lazy initialization via getter functions
         assert mongo_module.get_async_client() is mock_async_client
         assert mongo_module.get_sync_client() is mock_sync_client
         assert mongo_module.sync_client is not None
         assert mongo_module.sync_client.address == ("localhost", 27017)
 
+        # the clients are only created once
+        assert mongo_module.get_async_client() is mock_async_client
+        assert mongo_module.get_sync_client() is mock_sync_client
+        mock_async_cls.assert_called_once_with("mongodb://localhost:27017")
+        mock_sync_cls.assert_called_once_with("mongodb://localhost:27017")
+
 
 def test_mongo_clients_not_initialized_without_url():
     """
@@ -58,20 +57,24 @@ def test_mongo_clients_not_initialized_without_url():
     """
     test_app_settings = AppSettings(mongo=MongoSettings(url="", db="test-db"))
 
-    with patch(
-        "app.core.v1.settings.get_app_settings",
-        return_value=test_app_settings,
+    with (
+        patch.multiple(
+            mongo_module,
+            settings=test_app_settings,
+            async_client=None,
+            sync_client=None,
+        ),
+        patch.object(mongo_module, "AsyncMongoClient") as mock_async_cls,
+        patch.object(mongo_module, "MongoClient") as mock_sync_cls,
     ):
-        # NOTE: reload module to re-execute initialization code
-        import importlib
-
-        import app.core.v1.mongo as mongo_module
-
-        importlib.reload(mongo_module)
+        assert mongo_module.get_async_client() is None
+        assert mongo_module.get_sync_client() is None
 
         # verify clients were NOT initialized
         assert mongo_module.async_client is None
         assert mongo_module.sync_client is None
+        mock_async_cls.assert_not_called()
+        mock_sync_cls.assert_not_called()
 
 
 @pytest.mark.asyncio
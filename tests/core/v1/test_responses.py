@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""Unit tests for shared response classes."""
+
+import json
+from datetime import datetime
+
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from app.core.v1.responses import PydanticJSONResponse, etag_json_response
+
+
+class _Item(BaseModel):
+    """
+    Minimal model used to exercise model serialization.
+    """
+
+    id: int
+    name: str
+    created_at: datetime
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    """
+    Build a minimal GET request with the given headers.
+    """
+    raw_headers = [
+        (key.lower().encode("latin-1"), value.encode("latin-1"))
+        for key, value in (headers or {}).items()
+    ]
+    return Request({"type": "http", "method": "GET", "headers": raw_headers})
+
+
+def test_pydantic_json_response_renders_models():
+    """
+    Test that Pydantic models are serialized without dumping them first.
+    """
+    items = [_Item(id=1, name="é", created_at=datetime(2025, 1, 2, 3, 4, 5))]
+
+    response = PydanticJSONResponse(content=items, headers={"X-Total-Count": "1"})
+
+    assert response.media_type == "application/json"
+    assert response.headers["X-Total-Count"] == "1"
+    assert json.loads(response.body) == [
+        {"id": 1, "name": "é", "created_at": "2025-01-02T03:04:05"}
+    ]
+
+
+def test_pydantic_json_response_renders_plain_content():
+    """
+    Test that plain JSON content renders the same as JSONResponse, compactly.
+    """
+    response = PydanticJSONResponse(status_code=503, content={"status": "not ready"})
+
+    assert response.status_code == 503
+    assert response.body == b'{"status":"not ready"}'
+
+
+def test_etag_json_response_sets_etag():
+    """
+    Test that a JSON body is returned with an ETag derived from its content.
+    """
+    item = _Item(id=1, name="a", created_at=datetime(2025, 1, 2))
+
+    response = etag_json_response(_request(), item)
+    changed = etag_json_response(_request(), item.model_copy(update={"name": "b"}))
+
+    assert response.status_code == 200
+    assert response.media_type == "application/json"
+    assert json.loads(response.body)["name"] == "a"
+    assert response.headers["ETag"].startswith('"')
+    assert response.headers["ETag"] != changed.headers["ETag"]
+
+
+def test_etag_json_response_not_modified():
+    """
+    Test that a matching If-None-Match header produces an empty 304 response.
+    """
+    item = _Item(id=1, name="a", created_at=datetime(2025, 1, 2))
+    etag = etag_json_response(_request(), item).headers["ETag"]
+
+    for if_none_match in (etag, f'"stale", W/{etag}', "*"):
+        response = etag_json_response(_request({"If-None-Match": if_none_match}), item)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == etag
+
+    stale = etag_json_response(_request({"If-None-Match": '"stale"'}), item)
+    assert stale.status_code == 200
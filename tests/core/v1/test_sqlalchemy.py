@@ -4,12 +4,12 @@
 
 """Unit tests for core SQLAlchemy functions."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.core.v1.settings import AppSettings, SqlAlchemySettings
-from app.core.v1.sqlalchemy import with_huey_db_session
+from app.core.v1.sqlalchemy import warm_up_pool, with_huey_db_session
 
 
 def test_with_ssl_mode_default_context():
@@ -68,3 +68,43 @@ async def test_with_huey_db_session_injects_db_session():
     mock_session.commit.assert_awaited_once()
     mock_session.rollback.assert_not_called()
     mock_session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_holds_connections_then_releases():
+    """
+    Test that warm_up_pool opens all connections before releasing any of them.
+    """
+    events = []
+
+    def make_connection(index):
+        conn = AsyncMock()
+        conn.__aenter__.side_effect = lambda *args: events.append(("open", index))
+        conn.__aexit__.side_effect = lambda *args: events.append(("close", index))
+        return conn
+
+    mock_engine = MagicMock()
+    mock_engine.connect.side_effect = [make_connection(i) for i in range(3)]
+
+    await warm_up_pool(mock_engine, 3)
+
+    assert events == [
+        ("open", 0),
+        ("open", 1),
+        ("open", 2),
+        ("close", 2),
+        ("close", 1),
+        ("close", 0),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_disabled():
+    """
+    Test that warm_up_pool does nothing when no connections are requested.
+    """
+    mock_engine = MagicMock()
+
+    await warm_up_pool(mock_engine, 0)
+
+    mock_engine.connect.assert_not_called()
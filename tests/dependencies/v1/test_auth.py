@@ -9,7 +9,12 @@ from fastapi import HTTPException, Request
 from nmtfast.auth.v1.exceptions import AuthenticationError
 from nmtfast.settings.v1.schemas import SectionACL
 
-from app.dependencies.v1.auth import authenticate_headers, get_acls
+from app.dependencies.v1.auth import (
+    ClientCredentials,
+    authenticate_headers,
+    get_acls,
+    get_client_credentials,
+)
 
 
 @pytest.fixture
@@ -22,13 +27,29 @@ def mock_cache():
     return AsyncMock()
 
 
+async def _authenticate(api_key, token, token_auth_code, settings, cache):
+    """
+    Resolve credentials and authenticate them, as FastAPI would.
+    """
+    credentials = await get_client_credentials(
+        api_key=api_key,
+        token=token,
+        token_auth_code=token_auth_code,
+    )
+    return await authenticate_headers(
+        credentials=credentials,
+        settings=settings,
+        cache=cache,
+    )
+
+
 @pytest.mark.asyncio
 async def test_authenticate_headers_both_credentials_fail(mock_settings, mock_cache):
     """
     Test mutual exclusion of API key and token.
     """
     with pytest.raises(HTTPException) as exc:
-        await authenticate_headers(
+        await _authenticate(
             api_key="test-key",
             token="test-token",
             token_auth_code=None,
@@ -53,7 +74,7 @@ async def test_authenticate_headers_api_key_success(mock_settings, mock_cache):
             ],
         ),
     ):
-        result = await authenticate_headers(
+        result = await _authenticate(
             api_key="valid-key",
             token=None,
             token_auth_code=None,
@@ -73,7 +94,7 @@ async def test_authenticate_headers_api_key_failure(mock_settings, mock_cache):
         new=AsyncMock(side_effect=AuthenticationError("Invalid key")),
     ):
         with pytest.raises(HTTPException) as exc:
-            await authenticate_headers(
+            await _authenticate(
                 api_key="invalid-key",
                 token=None,
                 token_auth_code=None,
@@ -95,7 +116,7 @@ async def test_authenticate_headers_api_key_no_acls(mock_settings, mock_cache):
         new=AsyncMock(return_value=[]),
     ):
         with pytest.raises(HTTPException) as exc:
-            await authenticate_headers(
+            await _authenticate(
                 api_key="no-acls-key",
                 token=None,
                 token_auth_code=None,
@@ -116,7 +137,7 @@ async def test_authenticate_headers_token_success(mock_settings, mock_cache):
             return_value=[SectionACL(section_regex=".*", permissions=["*"])],
         ),
     ):
-        result = await authenticate_headers(
+        result = await _authenticate(
             api_key=None,
             token="valid.token.here",
             token_auth_code=None,
@@ -136,7 +157,7 @@ async def test_authenticate_headers_token_failure(mock_settings, mock_cache):
         new=AsyncMock(side_effect=AuthenticationError("Invalid token")),
     ):
         with pytest.raises(HTTPException) as exc:
-            await authenticate_headers(
+            await _authenticate(
                 api_key=None,
                 token="invalid.token",
                 token_auth_code=None,
@@ -153,7 +174,7 @@ async def test_authenticate_headers_no_credentials(mock_settings, mock_cache):
     Test no credentials provided.
     """
     with pytest.raises(HTTPException) as exc:
-        await authenticate_headers(
+        await _authenticate(
             api_key=None,
             token=None,
             token_auth_code=None,
@@ -311,7 +332,7 @@ async def test_authenticate_headers_token_no_acls(mock_settings, mock_cache):
         "app.dependencies.v1.auth.process_bearer_token", new=AsyncMock(return_value=[])
     ):
         with pytest.raises(HTTPException) as exc:
-            await authenticate_headers(
+            await _authenticate(
                 api_key=None,
                 token="valid.but.empty.acls",
                 token_auth_code=None,
@@ -333,7 +354,7 @@ async def test_authenticate_headers_auth_code_token_success(mock_settings, mock_
             return_value=[SectionACL(section_regex=".*", permissions=["*"])],
         ),
     ):
-        result = await authenticate_headers(
+        result = await _authenticate(
             api_key=None,
             token=None,
             token_auth_code="valid.auth.code.token",
@@ -351,7 +372,7 @@ async def test_authenticate_headers_api_key_and_auth_code_token_fail(
     Test mutual exclusion of API key and authorization code Bearer token.
     """
     with pytest.raises(HTTPException) as exc:
-        await authenticate_headers(
+        await _authenticate(
             api_key="test-key",
             token=None,
             token_auth_code="test.auth.code.token",
@@ -380,3 +401,41 @@ async def test_get_acls_token_auth_error(mock_settings, mock_cache):
 
         assert exc.value.status_code == 403
         assert "Token validation failed" in exc.value.detail
+
+
+@pytest.mark.asyncio
+async def test_get_client_credentials_rejects_before_lookups():
+    """
+    Test missing/conflicting credentials are rejected without any lookups.
+    """
+    with (
+        patch("app.dependencies.v1.auth.process_api_key_header") as mock_api_key,
+        patch("app.dependencies.v1.auth.process_bearer_token") as mock_token,
+    ):
+        for api_key, token in ((None, None), ("test-key", "test-token")):
+            with pytest.raises(HTTPException) as exc:
+                await get_client_credentials(
+                    api_key=api_key,
+                    token=token,
+                    token_auth_code=None,
+                )
+            assert exc.value.status_code == 403
+
+        mock_api_key.assert_not_called()
+        mock_token.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_client_credentials_uses_auth_code_token():
+    """
+    Test the authorization code scheme token is used as the Bearer token.
+    """
+    credentials = await get_client_credentials(
+        api_key=None,
+        token=None,
+        token_auth_code="auth.code.token",
+    )
+
+    assert credentials == ClientCredentials(
+        api_key=None, bearer_token="auth.code.token"
+    )
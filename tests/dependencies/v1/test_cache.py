@@ -9,18 +9,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 from nmtfast.cache.v1.base import AppCacheBase
 
-from app.core.v1.settings import AppSettings
 from app.dependencies.v1.cache import get_cache
 
 
-@pytest.fixture
-def mock_settings():
-    """
-    Fixture providing mock application settings.
-    """
-    return MagicMock(spec=AppSettings)
-
-
 @pytest.fixture
 def mock_cache():
     """
@@ -30,10 +21,10 @@ def mock_cache():
 
 
 @pytest.mark.asyncio
-async def test_get_cache_returns_app_cache(mock_settings, mock_cache):
+async def test_get_cache_returns_app_cache(mock_cache):
     """
     Test get_cache returns the app_cache instance.
     """
     with patch("app.dependencies.v1.cache.app_cache", new=mock_cache):
-        result = await get_cache(mock_settings)
+        result = await get_cache()
         assert result == mock_cache
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file in the project root for details.
+
+"""Unit tests for request context dependency injection functions."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from nmtfast.cache.v1.base import AppCacheBase
+from nmtfast.settings.v1.schemas import SectionACL
+
+from app.core.v1.settings import AppSettings
+from app.dependencies.v1.context import RequestContext, get_request_context
+
+
+@pytest.mark.asyncio
+async def test_get_request_context_bundles_dependencies():
+    """
+    Test get_request_context returns the injected ACLs, settings and cache.
+    """
+    acls = [SectionACL(section_regex=".*", permissions=["*"])]
+    settings = MagicMock(spec=AppSettings)
+    cache = MagicMock(spec=AppCacheBase)
+
+    ctx = await get_request_context(acls=acls, settings=settings, cache=cache)
+
+    assert isinstance(ctx, RequestContext)
+    assert ctx.acls is acls
+    assert ctx.settings is settings
+    assert ctx.cache is cache
+
+
+def test_request_context_uses_slots():
+    """
+    Test RequestContext does not allocate a per-instance __dict__.
+    """
+    ctx = RequestContext(acls=[], settings=MagicMock(), cache=MagicMock())
+
+    assert not hasattr(ctx, "__dict__")
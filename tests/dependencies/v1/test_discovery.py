@@ -6,7 +6,6 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import httpx
 import pytest
 from nmtfast.discovery.v1.exceptions import ServiceConnectionError
 
@@ -15,10 +14,12 @@ from app.core.v1.settings import AppSettings
 from app.dependencies.v1.discovery import get_api_clients
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_settings():
     """
     Fixture providing mock AppSettings.
+
+    The mock is only read by the tests, so it is shared by all of them.
     """
     settings = MagicMock(spec=AppSettings)
     settings.auth = "mock_auth"
@@ -41,7 +42,8 @@ async def test_get_api_clients_creates_client_lazily(mock_settings):
     """
     Test that get_api_clients lazily creates a client when not yet present.
     """
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    # NOTE: the client is only compared by identity, so any object will do
+    mock_client = object()
 
     with (
         patch(
@@ -71,7 +73,7 @@ async def test_get_api_clients_returns_existing_client(mock_settings):
     """
     Test that get_api_clients returns an existing client without recreating it.
     """
-    existing_client = AsyncMock(spec=httpx.AsyncClient)
+    existing_client = object()
     api_clients["widgets"] = existing_client
 
     with patch(
@@ -4,6 +4,8 @@
 
 """Unit tests for exceptions."""
 
+import pickle
+
 from app.errors.v1.exceptions import ResourceNotFoundError
 
 
@@ -41,3 +43,13 @@ def test_not_found_error_string_id():
     assert error.resource_id == resource_id
     assert error.resource_name == resource_name
     assert str(error) == "Product with ID abc-def not found."
+
+
+def test_not_found_error_pickle():
+    """Tests that the ResourceNotFoundError survives a pickle round trip."""
+
+    error = pickle.loads(pickle.dumps(ResourceNotFoundError(7, "Widget")))
+
+    assert error.resource_id == 7
+    assert error.resource_name == "Widget"
+    assert str(error) == "Widget with ID 7 not found."
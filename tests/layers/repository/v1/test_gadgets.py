@@ -181,6 +181,38 @@ async def test_update_force_not_found(mock_mongo_db, mock_db_gadget):
         await repo.update_force(gadget_id=mock_db_gadget["id"], new_force=42)
 
 
+@pytest.mark.asyncio
+async def test_increment_force_found(mock_mongo_db, mock_db_gadget):
+    """
+    Test atomically incrementing the force value of a gadget when it exists.
+    """
+    updated_doc = mock_db_gadget.copy()
+    updated_doc["force"] = 43
+
+    mock_mongo_db["gadgets"].find_one_and_update = AsyncMock(return_value=updated_doc)
+
+    repo = GadgetRepository(db=mock_mongo_db)
+    result = await repo.increment_force(gadget_id=updated_doc["id"])
+
+    assert result.force == 43
+    query, update = mock_mongo_db["gadgets"].find_one_and_update.call_args.args
+    assert query == {"id": updated_doc["id"]}
+    assert update == [{"$set": {"force": {"$add": [{"$ifNull": ["$force", 0]}, 1]}}}]
+
+
+@pytest.mark.asyncio
+async def test_increment_force_not_found(mock_mongo_db, mock_db_gadget):
+    """
+    Test incrementing the force value of a gadget when it does not exist.
+    """
+    mock_mongo_db["gadgets"].find_one_and_update = AsyncMock(return_value=None)
+
+    repo = GadgetRepository(db=mock_mongo_db)
+
+    with pytest.raises(ResourceNotFoundError):
+        await repo.increment_force(gadget_id=mock_db_gadget["id"])
+
+
 @pytest.mark.asyncio
 async def test_get_all(mock_mongo_db, mock_db_gadget):
     """
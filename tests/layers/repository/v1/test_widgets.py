@@ -39,6 +39,14 @@ def mock_db_widget():
     return Widget(id=1, name="Test Widget", height="10cm", mass="5kg", force=20)
 
 
+def test_widget_repository_uses_slots(mock_async_session: AsyncMock):
+    """Test that WidgetRepository does not allocate a per-instance __dict__."""
+    repository = WidgetRepository(mock_async_session)
+
+    assert repository.db is mock_async_session
+    assert not hasattr(repository, "__dict__")
+
+
 @pytest.mark.asyncio
 async def test_widget_create(
     mock_async_session: AsyncMock,
@@ -121,6 +129,32 @@ async def test_update_force_widget_not_found(mock_async_session: AsyncMock):
         await repository.update_force(1, 123)
 
 
+@pytest.mark.asyncio
+async def test_increment_force_success(mock_async_session: AsyncMock):
+    """Test atomically incrementing the force value of a widget."""
+
+    repository = WidgetRepository(mock_async_session)
+    select_result = MagicMock()
+    select_result.scalar_one.return_value = 21
+    mock_async_session.execute.side_effect = [MagicMock(rowcount=1), select_result]
+
+    result = await repository.increment_force(1)
+
+    assert result == 21
+    assert mock_async_session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_increment_force_widget_not_found(mock_async_session: AsyncMock):
+    """Test increment_force raises ResourceNotFoundError when widget does not exist."""
+
+    repository = WidgetRepository(mock_async_session)
+    mock_async_session.execute.return_value = MagicMock(rowcount=0)
+
+    with pytest.raises(ResourceNotFoundError, match="Widget with ID 1 not found"):
+        await repository.increment_force(1)
+
+
 @pytest.mark.asyncio
 async def test_get_all(
     mock_async_session: AsyncMock,
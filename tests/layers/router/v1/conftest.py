@@ -10,10 +10,8 @@ from nmtfast.settings.v1.schemas import IncomingAuthApiKey, SectionACL
 
 from app.core.v1.settings import AppSettings, AuthSettings, LoggingSettings
 
-ph = argon2.PasswordHasher()
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_api_key() -> str:
     """
     Fixture to return a predictable phrase that can be used to test hashing.
@@ -21,8 +19,16 @@ def mock_api_key() -> str:
     return "pytestapikey2"
 
 
+@pytest.fixture(scope="session")
+def mock_api_key_hash(mock_api_key: str) -> str:
+    """
+    Fixture to return the argon2 hash of mock_api_key, computed once per session.
+    """
+    return argon2.PasswordHasher().hash(mock_api_key)
+
+
 @pytest.fixture(scope="function")
-def mock_settings(mock_api_key: str) -> AppSettings:
+def mock_settings(mock_api_key_hash: str) -> AppSettings:
     """
     Fixture to provide a generic AppSettings instance.
     """
@@ -35,7 +41,7 @@ def mock_settings(mock_api_key: str) -> AppSettings:
                 "key1": IncomingAuthApiKey(
                     contact="some.user@domain.tld",
                     memo="pytest fixture",
-                    hash=ph.hash(mock_api_key),
+                    hash=mock_api_key_hash,
                     algo="argon2",
                     acls=[SectionACL(section_regex=".*", permissions=["*"])],
                 )
@@ -12,6 +12,7 @@ from nmtfast.cache.v1.base import AppCacheBase
 from nmtfast.settings.v1.schemas import SectionACL
 
 from app.core.v1.settings import AppSettings
+from app.dependencies.v1.context import RequestContext
 from app.dependencies.v1.mongo import get_mongo_db
 from app.errors.v1.exceptions import ResourceNotFoundError
 from app.layers.repository.v1.gadgets import GadgetRepository
@@ -143,11 +144,17 @@ async def test_get_gadget_service_dependency(mock_mongo_db: AsyncMock):
 
     app.dependency_overrides[get_mongo_db] = override_get_mongo_db
 
-    gadget_service = get_gadget_service(mock_mongo_db)
+    ctx = RequestContext(
+        acls=[],
+        settings=MagicMock(spec=AppSettings),
+        cache=MagicMock(spec=AppCacheBase),
+    )
+    gadget_service = await get_gadget_service(mock_mongo_db, ctx)
 
     assert isinstance(gadget_service, GadgetService)
     assert isinstance(gadget_service.gadget_repository, GadgetRepository)
     assert gadget_service.gadget_repository.db == mock_mongo_db
+    assert gadget_service.settings is ctx.settings
 
     app.dependency_overrides.pop(get_mongo_db)
 
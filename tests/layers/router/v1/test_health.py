@@ -4,17 +4,45 @@
 
 """Unit tests for health check router."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.layers.repository.v1.widgets import WidgetRepository
-from app.layers.router.v1.health import get_health_service
+from app.layers.router.v1.health import (
+    ReadinessCache,
+    get_health_service,
+    get_readiness_cache,
+    health_router,
+    readiness,
+)
 from app.layers.service.v1.health import AppHealthService
-from app.main import app
+from app.main import app as main_app
 
-client = TestClient(app)
+
+@pytest.fixture
+def app() -> FastAPI:
+    """
+    Fixture to provide a fresh app with only the health router.
+
+    The main app answers liveness probes in LivenessMiddleware, so the routes are
+    tested on an app without that middleware; a new app per test also means a new
+    readiness cache per test.
+    """
+    app = FastAPI()
+    app.include_router(health_router)
+    return app
+
+
+@pytest.fixture
+def client(app: FastAPI) -> TestClient:
+    """
+    Fixture to provide a TestClient for the health router app.
+    """
+    return TestClient(app)
 
 
 @pytest.fixture
@@ -24,6 +52,11 @@ def mock_health_service_true() -> AsyncMock:
     """
     service = AsyncMock(spec=AppHealthService)
     service.check_health.return_value = True
+    service.check_health_results.return_value = {
+        "basic": True,
+        "database": True,
+        "cache": True,
+    }
     return service
 
 
@@ -34,10 +67,16 @@ def mock_health_service_false() -> AsyncMock:
     """
     service = AsyncMock(spec=AppHealthService)
     service.check_health.return_value = False
+    service.check_health_results.return_value = {
+        "basic": True,
+        "database": False,
+        "cache": True,
+    }
     return service
 
 
-def test_get_health_service_creates_app_health_service():
+@pytest.mark.asyncio
+async def test_get_health_service_creates_app_health_service():
     """
     Test that get_health_service() returns a valid AppHealthService
     with the expected injected dependencies.
@@ -46,7 +85,7 @@ def test_get_health_service_creates_app_health_service():
     mock_db = MagicMock()
     mock_cache = MagicMock()
 
-    service = get_health_service(
+    service = await get_health_service(
         settings=mock_settings,
         db=mock_db,
         cache=mock_cache,
@@ -60,7 +99,9 @@ def test_get_health_service_creates_app_health_service():
 
 
 @pytest.mark.asyncio
-async def test_liveness_healthy(mock_health_service_true: AsyncMock):
+async def test_liveness_healthy(
+    mock_health_service_true: AsyncMock, app: FastAPI, client: TestClient
+):
     """
     Test /health/liveness returns 200 when dependencies are healthy.
     """
@@ -77,7 +118,9 @@ async def test_liveness_healthy(mock_health_service_true: AsyncMock):
 
 
 @pytest.mark.asyncio
-async def test_liveness_unhealthy(mock_health_service_false: AsyncMock):
+async def test_liveness_unhealthy(
+    mock_health_service_false: AsyncMock, app: FastAPI, client: TestClient
+):
     """
     Test /health/liveness returns 503 when dependencies are unhealthy.
     """
@@ -96,7 +139,10 @@ async def test_liveness_unhealthy(mock_health_service_false: AsyncMock):
 @pytest.mark.asyncio
 @patch("app.layers.router.v1.health.check_app_readiness", return_value=True)
 async def test_readiness_healthy(
-    mock_check: AsyncMock, mock_health_service_true: AsyncMock
+    mock_check: AsyncMock,
+    mock_health_service_true: AsyncMock,
+    app: FastAPI,
+    client: TestClient,
 ):
     """
     Test /health/readiness returns 200 when both app and dependencies are healthy.
@@ -116,7 +162,10 @@ async def test_readiness_healthy(
 @pytest.mark.asyncio
 @patch("app.layers.router.v1.health.check_app_readiness", return_value=False)
 async def test_readiness_check_app_readiness_false(
-    mock_check: AsyncMock, mock_health_service_true: AsyncMock
+    mock_check: AsyncMock,
+    mock_health_service_true: AsyncMock,
+    app: FastAPI,
+    client: TestClient,
 ):
     """
     Test /health/readiness returns 503 when check_app_readiness() is False.
@@ -136,7 +185,10 @@ async def test_readiness_check_app_readiness_false(
 @pytest.mark.asyncio
 @patch("app.layers.router.v1.health.check_app_readiness", return_value=True)
 async def test_readiness_unhealthy_dependencies(
-    mock_check: AsyncMock, mock_health_service_false: AsyncMock
+    mock_check: AsyncMock,
+    mock_health_service_false: AsyncMock,
+    app: FastAPI,
+    client: TestClient,
 ):
     """
     Test /health/readiness returns 503 when dependencies are not ready.
@@ -149,5 +201,104 @@ async def test_readiness_unhealthy_dependencies(
 
     response = client.get("/health/readiness")
     assert response.status_code == 503
+    assert response.json()["checks"] == {
+        "basic": "ok",
+        "database": "failed",
+        "cache": "ok",
+    }
+
+    app.dependency_overrides.pop(get_health_service, None)
+
+
+@pytest.mark.asyncio
+async def test_readiness_cache_ignored_when_shutting_down(
+    mock_health_service_true: AsyncMock,
+    app: FastAPI,
+    client: TestClient,
+):
+    """
+    Test /health/readiness reports shutdown even if a ready result is cached.
+    """
+
+    def override_get_health_service():
+        return mock_health_service_true
+
+    app.dependency_overrides[get_health_service] = override_get_health_service
+
+    with patch("app.layers.router.v1.health.check_app_readiness", return_value=True):
+        assert client.get("/health/readiness").status_code == 200
+    with patch("app.layers.router.v1.health.check_app_readiness", return_value=False):
+        assert client.get("/health/readiness").status_code == 503
 
     app.dependency_overrides.pop(get_health_service, None)
+
+
+@pytest.mark.asyncio
+async def test_main_app_liveness_skips_route(mock_health_service_false: AsyncMock):
+    """
+    Test the main app answers /health/liveness before the route is reached.
+    """
+    main_app.dependency_overrides[get_health_service] = lambda: (
+        mock_health_service_false
+    )
+
+    response = TestClient(main_app).get("/health/liveness")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+    mock_health_service_false.check_health.assert_not_awaited()
+
+    main_app.dependency_overrides.pop(get_health_service, None)
+
+
+@pytest.mark.asyncio
+async def test_readiness_cache_is_per_app():
+    """
+    Test get_readiness_cache keeps one ReadinessCache per app.
+    """
+    first, second = FastAPI(), FastAPI()
+    first_request = MagicMock(app=first)
+
+    first_cache = await get_readiness_cache(first_request)
+    assert await get_readiness_cache(first_request) is first_cache
+    assert await get_readiness_cache(MagicMock(app=second)) is not first_cache
+
+
+def test_main_app_liveness_rejects_other_methods():
+    """
+    Test the main app rejects non-GET/HEAD liveness requests with 405.
+    """
+    response = TestClient(main_app).post("/health/liveness")
+    assert response.status_code == 405
+
+
+@pytest.mark.asyncio
+@patch("app.layers.router.v1.health.check_app_readiness", return_value=True)
+async def test_readiness_concurrent_misses_share_one_check(
+    mock_check: AsyncMock, mock_health_service_true: AsyncMock
+):
+    """
+    Test concurrent /health/readiness cache misses run the dependency checks once.
+    """
+    results = mock_health_service_true.check_health_results.return_value
+
+    async def slow_check_health_results(checks):
+        await asyncio.sleep(0)
+        return results
+
+    mock_health_service_true.check_health_results.side_effect = (
+        slow_check_health_results
+    )
+    settings = MagicMock()
+    settings.health.readiness_ttl = 2.0
+
+    readiness_cache = ReadinessCache()
+
+    responses = await asyncio.gather(
+        *(
+            readiness(mock_health_service_true, readiness_cache, settings)
+            for _ in range(5)
+        )
+    )
+
+    assert all(response.status_code == 200 for response in responses)
+    assert mock_health_service_true.check_health_results.await_count == 1
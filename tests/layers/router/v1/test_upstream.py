@@ -20,8 +20,13 @@ from nmtfast.repositories.widgets.v1.schemas import (
 from nmtfast.settings.v1.schemas import SectionACL
 
 from app.core.v1.settings import AppSettings
+from app.dependencies.v1.context import RequestContext
 from app.errors.v1.exceptions import ResourceNotFoundError
-from app.layers.router.v1.upstream import authenticate_headers, get_widget_service
+from app.layers.router.v1.upstream import (
+    _CREATE_EXAMPLES,
+    authenticate_headers,
+    get_widget_service,
+)
 from app.layers.service.v1.upstream import WidgetApiService
 from app.main import app
 
@@ -144,11 +149,9 @@ async def test_get_widget_service_dependency():
     mock_cache = MagicMock(spec=AppCacheBase)
 
     # call the dependency function directly
-    widget_service = get_widget_service(
+    widget_service = await get_widget_service(
         api_clients=mock_api_clients,
-        acls=mock_acls,
-        settings=mock_settings,
-        cache=mock_cache,
+        ctx=RequestContext(acls=mock_acls, settings=mock_settings, cache=mock_cache),
     )
 
     # Verify the service was created correctly
@@ -162,6 +165,29 @@ async def test_get_widget_service_dependency():
     assert widget_service.cache == mock_cache
 
 
+@pytest.mark.asyncio
+async def test_get_widget_service_reuses_api_repository():
+    """
+    Test that one WidgetApiRepository is reused for the same upstream client.
+    """
+    mock_api_clients = {"widgets": AsyncMock(spec=httpx.AsyncClient)}
+    ctx = RequestContext(
+        acls=[],
+        settings=MagicMock(spec=AppSettings),
+        cache=MagicMock(spec=AppCacheBase),
+    )
+
+    first = await get_widget_service(api_clients=mock_api_clients, ctx=ctx)
+    second = await get_widget_service(api_clients=mock_api_clients, ctx=ctx)
+    other = await get_widget_service(
+        api_clients={"widgets": AsyncMock(spec=httpx.AsyncClient)}, ctx=ctx
+    )
+
+    assert first is not second
+    assert first.widget_api_repository is second.widget_api_repository
+    assert other.widget_api_repository is not first.widget_api_repository
+
+
 @pytest.mark.asyncio
 async def test_widget_get_by_id_endpoint_success(
     mock_api_key,
@@ -512,3 +538,36 @@ async def test_upstream_zap_list_endpoint_not_found(
 
     app.dependency_overrides.pop(get_widget_service, None)
     app.dependency_overrides.pop(authenticate_headers, None)
+
+
+def test_widget_api_create_examples_are_documented():
+    """
+    Test the request body examples are rendered into the OpenAPI schema.
+    """
+    operation = app.openapi()["paths"]["/v1/upstream"]["post"]
+    examples = operation["requestBody"]["content"]["application/json"]["examples"]
+    assert examples["normal"]["value"] == _CREATE_EXAMPLES["normal"]["value"]
+
+
+def test_widget_id_path_descriptions_are_per_route():
+    """
+    Test each upstream route documents widget_id with its own description.
+    """
+    paths = app.openapi()["paths"]
+
+    def widget_id_description(path: str, method: str) -> str:
+        parameters = paths[path][method]["parameters"]
+        return next(p for p in parameters if p["name"] == "widget_id")["description"]
+
+    assert (
+        widget_id_description("/v1/upstream/{widget_id}", "get")
+        == "The ID of the widget to retrieve."
+    )
+    assert (
+        widget_id_description("/v1/upstream/{widget_id}/zap", "post")
+        == "The ID of the widget to zap."
+    )
+    assert (
+        widget_id_description("/v1/upstream/{widget_id}/zap/{task_uuid}/status", "get")
+        == "The ID of the widget to get zap task for."
+    )
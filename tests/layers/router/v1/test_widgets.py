@@ -4,7 +4,7 @@
 
 """Unit tests for router layer."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from aiokafka import AIOKafkaProducer
@@ -14,6 +14,7 @@ from nmtfast.settings.v1.schemas import SectionACL
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.v1.settings import AppSettings
+from app.dependencies.v1.context import RequestContext
 from app.dependencies.v1.sqlalchemy import get_sql_db
 from app.errors.v1.exceptions import ResourceNotFoundError
 from app.layers.repository.v1.widgets import WidgetRepository
@@ -142,11 +143,17 @@ async def test_get_widget_service_dependency(mock_async_session: AsyncMock):
 
     app.dependency_overrides[get_sql_db] = override_get_sql_db
 
-    widget_service = get_widget_service(mock_async_session)
+    ctx = RequestContext(
+        acls=[],
+        settings=MagicMock(spec=AppSettings),
+        cache=MagicMock(spec=AppCacheBase),
+    )
+    widget_service = await get_widget_service(mock_async_session, ctx)
 
     assert isinstance(widget_service, WidgetService)
     assert isinstance(widget_service.widget_repository, WidgetRepository)
     assert widget_service.widget_repository.db == mock_async_session
+    assert widget_service.settings is ctx.settings
 
     app.dependency_overrides.pop(get_sql_db)
 
@@ -183,6 +190,41 @@ async def test_widget_get_by_id_endpoint_success(
     app.dependency_overrides.pop(authenticate_headers, None)
 
 
+@pytest.mark.asyncio
+async def test_widget_get_by_id_endpoint_not_modified(
+    mock_api_key: str,
+    mock_widget_service: AsyncMock,
+    mock_widget_read: WidgetRead,
+):
+    """Unit test for the widget_get_by_id endpoint when the client ETag matches."""
+
+    def override_get_widget_service():
+        return mock_widget_service
+
+    def override_authenticate_headers():
+        return "Authenticated successfully."
+
+    app.dependency_overrides[get_widget_service] = override_get_widget_service
+    app.dependency_overrides[authenticate_headers] = override_authenticate_headers
+    mock_widget_service.widget_get_by_id = AsyncMock(return_value=mock_widget_read)
+
+    first = client.get(
+        f"/v1/widgets/{mock_widget_read.id}",
+        headers={"X-API-Key": mock_api_key},
+    )
+    second = client.get(
+        f"/v1/widgets/{mock_widget_read.id}",
+        headers={"X-API-Key": mock_api_key, "If-None-Match": first.headers["ETag"]},
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.content == b""
+
+    app.dependency_overrides.pop(get_widget_service, None)
+    app.dependency_overrides.pop(authenticate_headers, None)
+
+
 @pytest.mark.asyncio
 async def test_widget_get_by_id_endpoint_not_found(
     mock_api_key: str,
@@ -620,3 +662,26 @@ async def test_widget_zap_list_endpoint_not_found(
 
     app.dependency_overrides.pop(get_widget_service, None)
     app.dependency_overrides.pop(authenticate_headers, None)
+
+
+def test_widget_routes_document_response_models():
+    """Unit test that routes skip re-validation but keep their OpenAPI schema."""
+    paths = app.openapi()["paths"]
+
+    for path, method, code, schema_name in (
+        ("/v1/widgets", "post", "201", "WidgetRead"),
+        ("/v1/widgets/{widget_id}", "get", "200", "WidgetRead"),
+        ("/v1/widgets/{widget_id}", "patch", "200", "WidgetRead"),
+        ("/v1/widgets/{widget_id}/zap", "post", "202", "WidgetZapTask"),
+        (
+            "/v1/widgets/{widget_id}/zap/{task_uuid}/status",
+            "get",
+            "200",
+            "WidgetZapTask",
+        ),
+    ):
+        response = paths[path][method]["responses"][code]
+        schema = response["content"]["application/json"]["schema"]
+        # NOTE: upstream widget schemas share these names, so FastAPI may prefix
+        #   them with the module path
+        assert schema["$ref"].endswith(schema_name)
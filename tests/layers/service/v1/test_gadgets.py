@@ -281,12 +281,10 @@ async def test_gadget_zap_by_uuid_not_found_task(
 
     with contextlib.ExitStack() as stack:
         mock_fetch_result = stack.enter_context(
-            patch("app.layers.service.v1.gadgets.fetch_task_result", return_value=None)
+            patch("app.core.v1.tasks.fetch_task_result", return_value=None)
         )
         mock_fetch_metadata = stack.enter_context(
-            patch(
-                "app.layers.service.v1.gadgets.fetch_task_metadata", return_value=None
-            )
+            patch("app.core.v1.tasks.fetch_task_metadata", return_value=None)
         )
 
         with pytest.raises(ResourceNotFoundError, match="Task"):
@@ -319,12 +317,12 @@ async def test_gadget_zap_by_uuid_returns_task_result(
     with contextlib.ExitStack() as stack:
         mock_fetch_result = stack.enter_context(
             patch(
-                "app.layers.service.v1.gadgets.fetch_task_result",
+                "app.core.v1.tasks.fetch_task_result",
                 return_value=mock_gadget_zap_task.model_dump(),
             )
         )
         mock_fetch_metadata = stack.enter_context(
-            patch("app.layers.service.v1.gadgets.fetch_task_metadata")
+            patch("app.core.v1.tasks.fetch_task_metadata")
         )
         result = await service.gadget_zap_by_uuid(mock_gadget_read.id, "test-uuid")
 
@@ -527,13 +525,13 @@ async def test_gadget_zap_by_uuid_persists_error(
 
         stack.enter_context(
             patch(
-                "app.layers.service.v1.gadgets.fetch_task_result",
+                "app.core.v1.tasks.fetch_task_result",
                 side_effect=RuntimeError("gadget error"),
             )
         )
         stack.enter_context(
             patch(
-                "app.layers.service.v1.gadgets.fetch_task_metadata",
+                "app.core.v1.tasks.fetch_task_metadata",
                 return_value={
                     "uuid": "error-test-uuid",
                     "gadget_id": mock_gadget_read.id,
@@ -578,10 +576,10 @@ async def test_gadget_zap_by_uuid_db_success(
             }
         )
         mock_fetch_result = stack.enter_context(
-            patch("app.layers.service.v1.gadgets.fetch_task_result")
+            patch("app.core.v1.tasks.fetch_task_result")
         )
         mock_fetch_metadata = stack.enter_context(
-            patch("app.layers.service.v1.gadgets.fetch_task_metadata")
+            patch("app.core.v1.tasks.fetch_task_metadata")
         )
 
         result = await service.gadget_zap_by_uuid(
@@ -589,6 +587,7 @@ async def test_gadget_zap_by_uuid_db_success(
         )
 
         mock_fetch_result.assert_not_called()
+        mock_gadget_repository.get_by_id.assert_not_awaited()
         mock_fetch_metadata.assert_not_called()
         assert isinstance(result, GadgetZapTask)
         assert result.uuid == "db-success-uuid"
@@ -623,10 +622,10 @@ async def test_gadget_zap_by_uuid_db_failed(
             }
         )
         mock_fetch_result = stack.enter_context(
-            patch("app.layers.service.v1.gadgets.fetch_task_result")
+            patch("app.core.v1.tasks.fetch_task_result")
         )
         mock_fetch_metadata = stack.enter_context(
-            patch("app.layers.service.v1.gadgets.fetch_task_metadata")
+            patch("app.core.v1.tasks.fetch_task_metadata")
         )
 
         result = await service.gadget_zap_by_uuid(mock_gadget_read.id, "db-failed-uuid")
@@ -667,12 +666,12 @@ async def test_gadget_zap_by_uuid_db_pending_falls_through(
         )
         stack.enter_context(
             patch(
-                "app.layers.service.v1.gadgets.fetch_task_result",
+                "app.core.v1.tasks.fetch_task_result",
                 return_value=mock_gadget_zap_task.model_dump(),
             )
         )
         mock_fetch_metadata = stack.enter_context(
-            patch("app.layers.service.v1.gadgets.fetch_task_metadata")
+            patch("app.core.v1.tasks.fetch_task_metadata")
         )
 
         result = await service.gadget_zap_by_uuid(
@@ -681,6 +680,7 @@ async def test_gadget_zap_by_uuid_db_pending_falls_through(
 
         assert isinstance(result, GadgetZapTask)
         mock_fetch_metadata.assert_not_called()
+        mock_gadget_repository.get_by_id.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -700,12 +700,10 @@ async def test_gadget_zap_by_uuid_db_none_no_huey_metadata(
     with contextlib.ExitStack() as stack:
         mock_gadget_repository.get_zap_task_by_uuid = AsyncMock(return_value=None)
         stack.enter_context(
-            patch("app.layers.service.v1.gadgets.fetch_task_result", return_value=None)
+            patch("app.core.v1.tasks.fetch_task_result", return_value=None)
         )
         stack.enter_context(
-            patch(
-                "app.layers.service.v1.gadgets.fetch_task_metadata", return_value=None
-            )
+            patch("app.core.v1.tasks.fetch_task_metadata", return_value=None)
         )
 
         with pytest.raises(ResourceNotFoundError, match="Task"):
@@ -791,13 +789,13 @@ async def test_gadget_zap_by_uuid_error_path_zap_task_update_raises(
 
         stack.enter_context(
             patch(
-                "app.layers.service.v1.gadgets.fetch_task_result",
+                "app.core.v1.tasks.fetch_task_result",
                 side_effect=RuntimeError("gadget error"),
             )
         )
         stack.enter_context(
             patch(
-                "app.layers.service.v1.gadgets.fetch_task_metadata",
+                "app.core.v1.tasks.fetch_task_metadata",
                 return_value={
                     "uuid": task_uuid,
                     "gadget_id": mock_gadget_read.id,
@@ -831,11 +829,11 @@ async def test_gadget_zap_by_uuid_fallback_metadata(
 
     with contextlib.ExitStack() as stack:
         stack.enter_context(
-            patch("app.layers.service.v1.gadgets.fetch_task_result", return_value=None)
+            patch("app.core.v1.tasks.fetch_task_result", return_value=None)
         )
         stack.enter_context(
             patch(
-                "app.layers.service.v1.gadgets.fetch_task_metadata",
+                "app.core.v1.tasks.fetch_task_metadata",
                 return_value={
                     "uuid": "meta-uuid",
                     "gadget_id": mock_gadget_read.id,
@@ -4,12 +4,13 @@
 
 """Unit tests for AppHealthService."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from app.layers.service.v1.health import AppHealthService
 
@@ -22,7 +23,7 @@ def mock_settings():
 @pytest.fixture
 def mock_db():
     db = AsyncMock(spec=AsyncSession)
-    db.execute.return_value = None
+    db.connection.return_value = AsyncMock(spec=AsyncConnection)
     return db
 
 
@@ -49,12 +50,14 @@ def service(mock_settings, mock_widget_repository, mock_cache):
 async def test_check_database_success(service, mock_widget_repository):
     result = await service._check_database()
     assert result is True
-    mock_widget_repository.db.execute.assert_called_once()
+    connection = mock_widget_repository.db.connection.return_value
+    connection.exec_driver_sql.assert_awaited_once_with("SELECT 1")
 
 
 @pytest.mark.asyncio
 async def test_check_database_failure(service, mock_widget_repository):
-    mock_widget_repository.db.execute.side_effect = OperationalError(
+    connection = mock_widget_repository.db.connection.return_value
+    connection.exec_driver_sql.side_effect = OperationalError(
         "SELECT 1", {}, Exception("fail")
     )
 
@@ -114,7 +117,8 @@ async def test_check_health_all(service):
 
 @pytest.mark.asyncio
 async def test_check_health_fails_on_database(service, mock_widget_repository):
-    mock_widget_repository.db.execute.side_effect = Exception("fail")
+    connection = mock_widget_repository.db.connection.return_value
+    connection.exec_driver_sql.side_effect = Exception("fail")
 
     result = await service.check_health(checks=["database"])
     assert result is False
@@ -126,3 +130,43 @@ async def test_check_health_fails_on_cache(service, mock_cache):
 
     result = await service.check_health(checks=["cache"])
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_check_health_results_reports_each_check(service, mock_cache):
+    mock_cache.fetch_app_cache.return_value = json.dumps("CORRUPT").encode("utf-8")
+
+    results = await service.check_health_results(checks=["basic", "database", "cache"])
+    assert results == {"basic": True, "database": True, "cache": False}
+
+
+@pytest.mark.asyncio
+async def test_check_health_results_runs_checks_concurrently(service):
+    started = []
+    release = asyncio.Event()
+
+    async def slow_check(name):
+        started.append(name)
+        await release.wait()
+        return True
+
+    service._check_database = lambda: slow_check("database")
+    service._check_cache = lambda: slow_check("cache")
+
+    task = asyncio.create_task(
+        service.check_health_results(checks=["database", "cache"])
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert started == ["database", "cache"]
+
+    release.set()
+    assert await task == {"database": True, "cache": True}
+
+
+@pytest.mark.asyncio
+async def test_check_health_results_default_and_unknown_checks(service):
+    assert await service.check_health_results() == {"basic": True}
+
+    results = await service.check_health_results(checks=("cache", "unknown"))
+    assert results == {"cache": True}
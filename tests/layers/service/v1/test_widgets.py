@@ -164,6 +164,62 @@ async def test_widget_get_by_id_success(
     assert result.id == mock_widget_read.id
 
 
+@pytest.mark.asyncio
+async def test_is_authz_caches_allowed_permissions(
+    mock_widget_repository: AsyncMock,
+    mock_allow_acls: list[SectionACL],
+    mock_settings: AppSettings,
+    mock_cache: AppCacheBase,
+    mock_kafka: AIOKafkaProducer,
+):
+    """
+    Test that an allowed permission is only checked against the ACLs once.
+    """
+    service = WidgetService(
+        mock_widget_repository,
+        mock_allow_acls,
+        mock_settings,
+        mock_cache,
+        mock_kafka,
+    )
+
+    with patch(
+        "app.layers.service.v1.widgets.check_acl", new=AsyncMock()
+    ) as mock_check_acl:
+        await service._is_authz(mock_allow_acls, "read")
+        await service._is_authz(mock_allow_acls, "read")
+        await service._is_authz(mock_allow_acls, "zap")
+
+    assert mock_check_acl.await_count == 2
+    assert service._acl_cache == {"read": True, "zap": True}
+
+
+@pytest.mark.asyncio
+async def test_is_authz_does_not_cache_denied_permissions(
+    mock_widget_repository: AsyncMock,
+    mock_deny_acls: list[SectionACL],
+    mock_settings: AppSettings,
+    mock_cache: AppCacheBase,
+    mock_kafka: AIOKafkaProducer,
+):
+    """
+    Test that a denied permission raises AuthorizationError on every check.
+    """
+    service = WidgetService(
+        mock_widget_repository,
+        mock_deny_acls,
+        mock_settings,
+        mock_cache,
+        mock_kafka,
+    )
+
+    for _ in range(2):
+        with pytest.raises(AuthorizationError):
+            await service._is_authz(mock_deny_acls, "read")
+
+    assert service._acl_cache == {}
+
+
 @pytest.mark.asyncio
 async def test_widget_get_by_id_authorization_error(
     mock_widget_repository: AsyncMock,
@@ -234,6 +290,16 @@ async def test_widget_zap_success(
 
         mock_widget_repository.get_by_id.assert_called_once_with(mock_widget_read.id)
         mock_zap_task.schedule.assert_called_once()
+        mock_widget_repository.zap_task_create.assert_awaited_once_with(
+            widget_id=mock_widget_read.id,
+            task_uuid="test-uuid",
+            duration=mock_widget_zap.duration,
+        )
+        mock_widget_repository.update_last_task.assert_awaited_once_with(
+            widget_id=mock_widget_read.id,
+            task_uuid="test-uuid",
+            status="PENDING",
+        )
         mock_store_metadata.assert_called_once_with(
             ANY,  # huey_app
             "test-uuid",
@@ -276,12 +342,10 @@ async def test_widget_zap_by_uuid_not_found_task(
 
     with contextlib.ExitStack() as stack:
         mock_fetch_result = stack.enter_context(
-            patch("app.layers.service.v1.widgets.fetch_task_result", return_value=None)
+            patch("app.core.v1.tasks.fetch_task_result", return_value=None)
         )
         mock_fetch_metadata = stack.enter_context(
-            patch(
-                "app.layers.service.v1.widgets.fetch_task_metadata", return_value=None
-            )
+            patch("app.core.v1.tasks.fetch_task_metadata", return_value=None)
         )
 
         with pytest.raises(ResourceNotFoundError, match="Task"):
@@ -318,12 +382,12 @@ async def test_widget_zap_by_uuid_returns_task_result(
     with contextlib.ExitStack() as stack:
         mock_fetch_result = stack.enter_context(
             patch(
-                "app.layers.service.v1.widgets.fetch_task_result",
+                "app.core.v1.tasks.fetch_task_result",
                 return_value=mock_widget_zap_task.model_dump(),
             )
         )
         mock_fetch_metadata = stack.enter_context(
-            patch("app.layers.service.v1.widgets.fetch_task_metadata")
+            patch("app.core.v1.tasks.fetch_task_metadata")
         )
         result = await service.widget_zap_by_uuid(mock_widget_read.id, "test-uuid")
 
@@ -575,10 +639,10 @@ async def test_widget_zap_by_uuid_db_success(
     with contextlib.ExitStack() as stack:
         mock_widget_repository.get_zap_task_by_uuid = AsyncMock(return_value=db_task)
         mock_fetch_result = stack.enter_context(
-            patch("app.layers.service.v1.widgets.fetch_task_result")
+            patch("app.core.v1.tasks.fetch_task_result")
         )
         mock_fetch_metadata = stack.enter_context(
-            patch("app.layers.service.v1.widgets.fetch_task_metadata")
+            patch("app.core.v1.tasks.fetch_task_metadata")
         )
 
         result = await service.widget_zap_by_uuid(
@@ -586,6 +650,7 @@ async def test_widget_zap_by_uuid_db_success(
         )
 
         mock_fetch_result.assert_not_called()
+        mock_widget_repository.get_by_id.assert_not_awaited()
         mock_fetch_metadata.assert_not_called()
         assert isinstance(result, WidgetZapTask)
         assert result.uuid == "db-success-uuid"
@@ -631,10 +696,10 @@ async def test_widget_zap_by_uuid_db_failed(
     with contextlib.ExitStack() as stack:
         mock_widget_repository.get_zap_task_by_uuid = AsyncMock(return_value=db_task)
         mock_fetch_result = stack.enter_context(
-            patch("app.layers.service.v1.widgets.fetch_task_result")
+            patch("app.core.v1.tasks.fetch_task_result")
         )
         mock_fetch_metadata = stack.enter_context(
-            patch("app.layers.service.v1.widgets.fetch_task_metadata")
+            patch("app.core.v1.tasks.fetch_task_metadata")
         )
 
         result = await service.widget_zap_by_uuid(mock_widget_read.id, "db-failed-uuid")
@@ -686,12 +751,12 @@ async def test_widget_zap_by_uuid_db_pending_falls_through(
         mock_widget_repository.get_zap_task_by_uuid = AsyncMock(return_value=db_task)
         stack.enter_context(
             patch(
-                "app.layers.service.v1.widgets.fetch_task_result",
+                "app.core.v1.tasks.fetch_task_result",
                 return_value=mock_widget_zap_task.model_dump(),
             )
         )
         mock_fetch_metadata = stack.enter_context(
-            patch("app.layers.service.v1.widgets.fetch_task_metadata")
+            patch("app.core.v1.tasks.fetch_task_metadata")
         )
 
         result = await service.widget_zap_by_uuid(
@@ -700,6 +765,7 @@ async def test_widget_zap_by_uuid_db_pending_falls_through(
 
         assert isinstance(result, WidgetZapTask)
         mock_fetch_metadata.assert_not_called()
+        mock_widget_repository.get_by_id.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -724,12 +790,10 @@ async def test_widget_zap_by_uuid_db_none_no_huey_metadata(
     with contextlib.ExitStack() as stack:
         mock_widget_repository.get_zap_task_by_uuid = AsyncMock(return_value=None)
         stack.enter_context(
-            patch("app.layers.service.v1.widgets.fetch_task_result", return_value=None)
+            patch("app.core.v1.tasks.fetch_task_result", return_value=None)
         )
         stack.enter_context(
-            patch(
-                "app.layers.service.v1.widgets.fetch_task_metadata", return_value=None
-            )
+            patch("app.core.v1.tasks.fetch_task_metadata", return_value=None)
         )
 
         with pytest.raises(ResourceNotFoundError, match="Task"):
@@ -762,13 +826,13 @@ async def test_widget_zap_by_uuid_persists_error(
 
         stack.enter_context(
             patch(
-                "app.layers.service.v1.widgets.fetch_task_result",
+                "app.core.v1.tasks.fetch_task_result",
                 side_effect=RuntimeError("task error"),
             )
         )
         stack.enter_context(
             patch(
-                "app.layers.service.v1.widgets.fetch_task_metadata",
+                "app.core.v1.tasks.fetch_task_metadata",
                 return_value={
                     "uuid": "error-test-uuid",
                     "widget_id": mock_widget_read.id,
@@ -817,13 +881,13 @@ async def test_widget_zap_by_uuid_error_path_zap_task_update_raises(
 
         stack.enter_context(
             patch(
-                "app.layers.service.v1.widgets.fetch_task_result",
+                "app.core.v1.tasks.fetch_task_result",
                 side_effect=RuntimeError("task error"),
             )
         )
         stack.enter_context(
             patch(
-                "app.layers.service.v1.widgets.fetch_task_metadata",
+                "app.core.v1.tasks.fetch_task_metadata",
                 return_value={
                     "uuid": task_uuid,
                     "widget_id": mock_widget_read.id,
@@ -61,7 +61,9 @@ async def test_async_logic_gadget_zap_success(monkeypatch, mock_task):
 
     mock_repo = AsyncMock()
     mock_repo.get_by_id.return_value = GadgetRead(id="gadget-42", name="test", force=5)
-    mock_repo.update_force.return_value = None
+    mock_repo.increment_force.return_value = GadgetRead(
+        id="gadget-42", name="test", force=6
+    )
 
     monkeypatch.setattr("app.tasks.v1.gadgets.GadgetRepository", lambda _: mock_repo)
     monkeypatch.setattr(
@@ -81,6 +83,11 @@ async def test_async_logic_gadget_zap_success(monkeypatch, mock_task):
     assert isinstance(result, GadgetZapTask)
     assert result.state == "SUCCESS"
     assert result.runtime == 1
+    mock_repo.increment_force.assert_awaited_once_with("gadget-42")
+    assert mock_repo.zap_task_update.call_args_list[-1].kwargs["result"] == {
+        "gadget_id": "gadget-42",
+        "new_force": 6,
+    }
 
 
 @pytest.mark.asyncio
@@ -139,7 +146,7 @@ def test_gadget_zap_task_wrapper(monkeypatch):
 @pytest.mark.asyncio
 async def test_async_logic_gadget_zap_error_path(monkeypatch, mock_task):
     """
-    Test gadget zap error path when update_force raises an exception.
+    Test gadget zap error path when increment_force raises an exception.
     """
     mock_task = MagicMock()
     mock_task.id = "mock-task-id"
@@ -147,7 +154,7 @@ async def test_async_logic_gadget_zap_error_path(monkeypatch, mock_task):
 
     mock_repo = AsyncMock()
     mock_repo.get_by_id.return_value = GadgetRead(id="gadget-42", name="test", force=5)
-    mock_repo.update_force.side_effect = RuntimeError("force error")
+    mock_repo.increment_force.side_effect = RuntimeError("force error")
 
     monkeypatch.setattr("app.tasks.v1.gadgets.GadgetRepository", lambda _: mock_repo)
     monkeypatch.setattr(
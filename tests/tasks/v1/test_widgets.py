@@ -4,6 +4,7 @@
 
 """Tests for widget tasks."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -91,19 +92,77 @@ async def test_async_logic_widget_zap_success(
             "update_last_task",
             new=AsyncMock(return_value=mock_widget),
         ):
-            params = WidgetZapParams(
-                request_id="req-1", widget_id=mock_widget.id, duration=1
-            )
+            with patch.object(
+                __import__(
+                    "app.tasks.v1.widgets", fromlist=["WidgetRepository"]
+                ).WidgetRepository,
+                "increment_force",
+                new=AsyncMock(return_value=43),
+            ) as increment_force:
+                params = WidgetZapParams(
+                    request_id="req-1", widget_id=mock_widget.id, duration=1
+                )
 
-            result = await _async_logic_widget_zap(
-                params=params, task=mock_task, db_session=mock_db_session
-            )
+                result = await _async_logic_widget_zap(
+                    params=params, task=mock_task, db_session=mock_db_session
+                )
 
+            increment_force.assert_awaited_once_with(mock_widget.id)
             assert isinstance(result, WidgetZapTask)
             assert result.widget_id == mock_widget.id
             assert result.state == "SUCCESS"
 
 
+@pytest.mark.asyncio
+async def test_async_logic_widget_zap_coalesces_progress(
+    monkeypatch, mock_widget, mock_task, mock_db_session
+):
+    """
+    Test that the task sleeps in heartbeat steps and publishes progress after each.
+    """
+    stored: list[dict] = []
+    sleep = AsyncMock()
+    monkeypatch.setattr(
+        "app.tasks.v1.widgets.fetch_task_metadata",
+        lambda huey_app, task_id: {
+            "uuid": task_id,
+            "state": "PENDING",
+            "widget_id": mock_widget.id,
+            "duration": 6,
+            "runtime": 0,
+        },
+    )
+    monkeypatch.setattr(
+        "app.tasks.v1.widgets.store_task_metadata",
+        lambda huey_app, uuid, payload: stored.append(payload),
+    )
+    monkeypatch.setattr("app.tasks.v1.widgets.asyncio", SimpleNamespace(sleep=sleep))
+    repository = __import__(
+        "app.tasks.v1.widgets", fromlist=["WidgetRepository"]
+    ).WidgetRepository
+    with (
+        patch.object(repository, "zap_task_update", new=AsyncMock()) as update,
+        patch.object(repository, "update_last_task", new=AsyncMock()),
+        patch.object(repository, "increment_force", new=AsyncMock(return_value=43)),
+    ):
+        params = WidgetZapParams(
+            request_id="req-1", widget_id=mock_widget.id, duration=6
+        )
+
+        result = await _async_logic_widget_zap(
+            params=params, task=mock_task, db_session=mock_db_session
+        )
+
+    assert result.state == "SUCCESS"
+    assert [c.args[0] for c in sleep.await_args_list] == [5, 1]
+    assert [md["runtime"] for md in stored] == [0, 5, 6]
+    assert all(md["state"] != "SUCCESS" for md in stored)
+    runtimes = [
+        c.kwargs["runtime"] for c in update.await_args_list if "runtime" in c.kwargs
+    ]
+    assert runtimes == [5, 6]
+
+
 @pytest.mark.asyncio
 async def test_async_logic_widget_zap_not_found(monkeypatch, mock_task):
     """
@@ -142,7 +201,7 @@ async def test_async_logic_widget_zap_error_path(
     monkeypatch.setattr(
         "app.tasks.v1.widgets.store_task_metadata", lambda huey_app, uuid, payload: None
     )
-    # Make update_force raise an exception to trigger the error path
+    # Make the widget lookup raise an exception to trigger the error path
     mock_db_session.get = AsyncMock(side_effect=RuntimeError("db error"))
 
     params = WidgetZapParams(request_id="req-1", widget_id=mock_widget.id, duration=1)
@@ -225,7 +284,7 @@ async def test_async_logic_widget_zap_error_path_full(
     monkeypatch, mock_widget, mock_task, mock_db_session
 ):
     """
-    Test widget zap logic when update_force raises during SUCCESS phase.
+    Test widget zap logic when increment_force raises during SUCCESS phase.
     """
     store_calls = []
 
@@ -252,7 +311,7 @@ async def test_async_logic_widget_zap_error_path_full(
         __import__(
             "app.tasks.v1.widgets", fromlist=["WidgetRepository"]
         ).WidgetRepository,
-        "update_force",
+        "increment_force",
         new=AsyncMock(side_effect=RuntimeError("force error")),
     ):
         with patch.object(
@@ -30,7 +30,6 @@ def test_task_settings_redis_backend() -> None:
     )
 
     with patch("app.core.v1.settings.get_app_settings", return_value=test_app_settings):
-
         # NOTE: reload the module to re-execute the module-level code
         import importlib
 
@@ -51,7 +50,6 @@ def test_task_settings_sqlite_backend() -> None:
     )
 
     with patch("app.core.v1.settings.get_app_settings", return_value=test_app_settings):
-
         # NOTE: reload the module to re-execute the module-level code
         import importlib
 
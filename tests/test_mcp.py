@@ -6,70 +6,169 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastapi import FastAPI
 
-from app.mcp import mcp_app, mcp_lifespan
+from app.mcp import (
+    LazyMcpMountMiddleware,
+    McpMounter,
+    create_api_client,
+    mcp_app,
+    mcp_lifespan,
+)
 
 
-@pytest.mark.asyncio
-async def test_mcp_lifespan_mounts_app():
+class DummyAsyncContextManager:
     """
-    Test that mcp_lifespan fetches OpenAPI, creates FastMCP, mounts the app, and yields.
+    Stand-in for the inner FastMCP lifespan context.
     """
-    app = FastAPI()
-    mock_openapi_spec = {
-        "openapi": "3.0.0",
-        "info": {"title": "Test", "version": "1.0.0"},
-    }
 
-    # mock the response from httpx
-    mock_response = AsyncMock()
-    mock_response.status_code = 200
-    mock_response.raise_for_status.return_value = None
-    # Implementation calls resp.json() synchronously, so set .json as a MagicMock
-    mock_response.json = MagicMock(return_value=mock_openapi_spec)
+    def __init__(self):
+        self.exited = False
+
+    async def __aenter__(self):
+        pass
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.exited = True
+
+
+def make_stream_client(*chunks: bytes) -> MagicMock:
+    """
+    Build an httpx client mock whose stream() yields the given body chunks.
+    """
+    mock_response = MagicMock()
+
+    async def aiter_bytes():
+        for chunk in chunks:
+            yield chunk
 
-    # mock AsyncClient and its context manager behavior
-    mock_client = AsyncMock()
-    mock_client.get.return_value = mock_response
+    mock_response.aiter_bytes = aiter_bytes
+    stream_ctx = MagicMock()
+    stream_ctx.__aenter__ = AsyncMock(return_value=mock_response)
+    stream_ctx.__aexit__ = AsyncMock(return_value=None)
 
-    class DummyAsyncClient:
-        async def __aenter__(self):
-            return mock_client
+    client = AsyncMock()
+    client.stream = MagicMock(return_value=stream_ctx)
+    return client
 
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            pass
 
-    # mock MCP http_app and its lifespan context
-    mock_mcp = MagicMock()
-    mock_http_app = MagicMock()
+@pytest.fixture
+def mock_client():
+    """
+    Fixture providing an httpx client mock that streams a valid OpenAPI spec.
+    """
+    return make_stream_client(
+        b'{"openapi": "3.0.0", ',
+        b'"info": {"title": "Test", "version": "1.0.0"}}',
+    )
 
-    class DummyAsyncContextManager:
-        async def __aenter__(self):
-            pass
 
-        async def __aexit__(self, exc_type, exc, tb):
-            pass
+@pytest.fixture
+def mock_mcp():
+    """
+    Fixture providing a FastMCP mock whose http_app has a dummy lifespan.
+    """
+    mcp = MagicMock()
+    mcp.http_app.return_value.lifespan.return_value = DummyAsyncContextManager()
+    return mcp
 
-    mock_http_app.lifespan.return_value = DummyAsyncContextManager()
-    mock_mcp.http_app.return_value = mock_http_app
 
+@pytest.fixture
+def mcp_settings():
+    """
+    Fixture pinning the MCP settings used by the tests.
+    """
     with (
-        patch("app.mcp.httpx.AsyncClient", return_value=DummyAsyncClient()),
-        patch("app.mcp.FastMCP.from_openapi", return_value=mock_mcp),
-        patch.object(app, "mount") as mock_mount,
         patch("app.mcp.settings.mcp.openapi_base_url", "http://testserver"),
         patch("app.mcp.settings.mcp.openapi_path", "/openapi.json"),
         patch("app.mcp.settings.mcp.mcp_mount_path", "/mcp"),
     ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_mcp_lifespan_defers_mount(mcp_settings, mock_client):
+    """
+    Test that mcp_lifespan does no MCP work at startup and closes the client.
+    """
+    app = FastAPI()
+
+    with patch("app.mcp.httpx.AsyncClient", return_value=mock_client):
         async with mcp_lifespan(app):
-            pass
+            assert isinstance(app.state.mcp_mounter, McpMounter)
+            assert app.state.mcp_mounter.mounted is False
+            mock_client.stream.assert_not_called()
+
+    mock_client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_mcp_mounter_mounts_app(mcp_settings, mock_client, mock_mcp):
+    """
+    Test that McpMounter fetches OpenAPI, creates FastMCP and mounts the app once.
+    """
+    app = FastAPI()
+    mounter = McpMounter(app, mock_client)
+    mock_http_app = mock_mcp.http_app.return_value
+
+    with (
+        patch("app.mcp.FastMCP.from_openapi", return_value=mock_mcp),
+        patch.object(app, "mount") as mock_mount,
+    ):
+        await mounter.mount()
+        await mounter.mount()
 
-        mock_client.get.assert_awaited_once_with("/openapi.json")
-        mock_response.json.assert_called_once()
-        mock_mcp.http_app.assert_called_once()
-        mock_mount.assert_called_once_with("/mcp", mock_http_app)
+    assert mounter.mounted is True
+    mock_client.stream.assert_called_once_with("GET", "/openapi.json")
+    assert mock_client.stream.return_value.__aexit__.await_count == 1
+    mock_mcp.http_app.assert_called_once()
+    mock_mount.assert_called_once_with("/mcp", mock_http_app)
+
+    await mounter.aclose()
+    assert mock_http_app.lifespan.return_value.exited is True
+
+
+@pytest.mark.asyncio
+async def test_lazy_mcp_mount_middleware(mcp_settings):
+    """
+    Test that the middleware only mounts MCP for requests under the mount path.
+    """
+    app = FastAPI()
+    app.state.mcp_mounter = MagicMock(mounted=False, mount=AsyncMock())
+    inner_app = AsyncMock()
+    middleware = LazyMcpMountMiddleware(inner_app)
+    receive, send = AsyncMock(), AsyncMock()
+
+    scope = {"type": "http", "app": app, "path": "/docs", "root_path": ""}
+    await middleware(scope, receive, send)
+    app.state.mcp_mounter.mount.assert_not_awaited()
+
+    scope = {"type": "http", "app": app, "path": "/mcp/", "root_path": ""}
+    await middleware(scope, receive, send)
+    app.state.mcp_mounter.mount.assert_awaited_once()
+
+    assert inner_app.await_count == 2
+
+
+def test_create_api_client_uses_mcp_settings():
+    """
+    Test that create_api_client builds a pooled client from MCP settings.
+    """
+    with (
+        patch("app.mcp.settings.mcp.openapi_base_url", "http://testserver"),
+        patch("app.mcp.settings.mcp.headers", {"X-Test": "1"}),
+        patch("app.mcp.httpx.AsyncClient") as mock_async_client,
+    ):
+        client = create_api_client()
+
+    assert client is mock_async_client.return_value
+    kwargs = mock_async_client.call_args.kwargs
+    assert kwargs["base_url"] == "http://testserver"
+    assert kwargs["headers"] == {"X-Test": "1"}
+    assert kwargs["http2"] is False
+    assert kwargs["limits"].max_keepalive_connections == 50
 
 
 def test_mcp_app_is_fastapi():
@@ -80,66 +179,57 @@ def test_mcp_app_is_fastapi():
 
 
 @pytest.mark.asyncio
-async def test_mcp_lifespan_retries_and_fails():
+async def test_mcp_mounter_retries_and_fails(mcp_settings):
     """
-    Test that mcp_lifespan retries and raises after max_retries if OpenAPI fetch fails.
+    Test that mounting retries and raises after max_retries if OpenAPI fetch fails.
     """
     app = FastAPI()
-    # Simulate failure on every get
-    mock_response = AsyncMock()
-    mock_response.status_code = 500
-    mock_response.raise_for_status.side_effect = Exception("fail")
-    mock_response.json = MagicMock(side_effect=Exception("fail"))
-    mock_client = AsyncMock()
-    mock_client.get.side_effect = Exception("fail")
-
-    class DummyAsyncClient:
-        async def __aenter__(self):
-            return mock_client
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            pass
+    # Simulate connection failure on every get
+    mock_client = make_stream_client()
+    mock_client.stream.side_effect = httpx.ConnectError("fail")
+    mounter = McpMounter(app, mock_client)
 
     # Patch max_retries to 2 for fast test
     with (
-        patch("app.mcp.httpx.AsyncClient", return_value=DummyAsyncClient()),
         patch("app.mcp.settings.mcp.max_retries", 2),
-        patch("app.mcp.settings.mcp.openapi_base_url", "http://testserver"),
-        patch("app.mcp.settings.mcp.openapi_path", "/openapi.json"),
-        patch("app.mcp.settings.mcp.mcp_mount_path", "/mcp"),
+        patch("app.mcp.asyncio.sleep", new_callable=AsyncMock),
     ):
-        with pytest.raises(Exception, match="fail"):
-            async with mcp_lifespan(app):
-                pass
+        with pytest.raises(httpx.ConnectError, match="fail"):
+            await mounter.mount()
+
+    assert mock_client.stream.call_count == 2
+    assert mounter.mounted is False
 
 
 @pytest.mark.asyncio
-async def test_mcp_lifespan_openapi_not_dict():
+async def test_mcp_mounter_fails_fast_on_http_error(mcp_settings):
     """
-    Test that mcp_lifespan asserts if openapi_spec is not a dict.
+    Test that an error status from the server is raised without retrying.
     """
     app = FastAPI()
-    mock_response = AsyncMock()
-    mock_response.status_code = 200
-    mock_response.raise_for_status.return_value = None
-    mock_response.json = MagicMock(return_value=[1, 2, 3])  # Not a dict
-    mock_client = AsyncMock()
-    mock_client.get.return_value = mock_response
+    request = httpx.Request("GET", "http://testserver/openapi.json")
+    response = httpx.Response(500, request=request)
+    mock_client = make_stream_client()
+    mock_client.stream.return_value.__aenter__.return_value = response
+    mounter = McpMounter(app, mock_client)
 
-    class DummyAsyncClient:
-        async def __aenter__(self):
-            return mock_client
+    with patch("app.mcp.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with pytest.raises(httpx.HTTPStatusError):
+            await mounter.mount()
 
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            pass
+    assert mock_client.stream.call_count == 1
+    mock_sleep.assert_not_awaited()
 
-    with (
-        patch("app.mcp.httpx.AsyncClient", return_value=DummyAsyncClient()),
-        patch("app.mcp.FastMCP.from_openapi"),
-        patch("app.mcp.settings.mcp.openapi_base_url", "http://testserver"),
-        patch("app.mcp.settings.mcp.openapi_path", "/openapi.json"),
-        patch("app.mcp.settings.mcp.mcp_mount_path", "/mcp"),
-    ):
+
+@pytest.mark.asyncio
+async def test_mcp_mounter_openapi_not_dict(mcp_settings):
+    """
+    Test that mounting asserts if openapi_spec is not a dict.
+    """
+    app = FastAPI()
+    mock_client = make_stream_client(b"[1, 2, 3]")  # Not a dict
+    mounter = McpMounter(app, mock_client)
+
+    with patch("app.mcp.FastMCP.from_openapi"):
         with pytest.raises(AssertionError):
-            async with mcp_lifespan(app):
-                pass
+            await mounter.mount()
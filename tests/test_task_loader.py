@@ -5,8 +5,7 @@
 """Test discovery of Huey tasks."""
 
 import types
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -32,23 +31,35 @@ def test_discover_tasks_raises_import_error_when_submodule_locations_is_none():
             discover_tasks("another.fake.package")
 
 
-def test_discover_tasks_skips_init():
+def test_discover_tasks_skips_init(tmp_path):
     """
     Test discover_tasks() skips importing __init__.py during task module discovery.
     """
-    mock_spec = types.SimpleNamespace(submodule_search_locations=["/fake/path"])
-
-    init_file = MagicMock(spec=Path)
-    init_file.stem = "__init__"
-    init_file.suffix = ".py"
-    init_file.relative_to.return_value = Path("__init__.py")
-    init_file.with_suffix.return_value = Path("__init__")
+    mock_spec = types.SimpleNamespace(submodule_search_locations=[str(tmp_path)])
+    (tmp_path / "__init__.py").touch()
 
     with (
         patch("importlib.util.find_spec", return_value=mock_spec),
-        patch("pathlib.Path.rglob", return_value=[init_file]),
         patch("importlib.import_module") as mock_import,
     ):
         discover_tasks()
 
     mock_import.assert_not_called()  # __init__.py should be skipped
+
+
+def test_discover_tasks_imports_nested_modules(tmp_path):
+    """
+    Test discover_tasks() imports nested Python files and ignores other files.
+    """
+    mock_spec = types.SimpleNamespace(submodule_search_locations=[str(tmp_path)])
+    (tmp_path / "v1").mkdir()
+    (tmp_path / "v1" / "widgets.py").touch()
+    (tmp_path / "v1" / "README.md").touch()
+
+    with (
+        patch("importlib.util.find_spec", return_value=mock_spec),
+        patch("importlib.import_module") as mock_import,
+    ):
+        discover_tasks()
+
+    mock_import.assert_called_once_with("app.tasks.v1.widgets")